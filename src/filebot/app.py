@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import sys
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
 from filebot.ui.main_window import MainWindow
@@ -42,11 +43,13 @@ def main(argv: list[str] | None = None) -> int:
     int
         Process exit code.
     """
-    args = argv if argv is not None else sys.argv
-    app = QApplication(args)
+    # Qt allows one application object per process; reuse an existing one
+    app = QApplication.instance() or QApplication(sys.argv if argv is None else argv)
     window = MainWindow()
     window.resize(1200, 750)
     window.show()
+    # Build the views once the event loop has painted the initial frame
+    QTimer.singleShot(0, window.finish_init)
     return app.exec()
 
 
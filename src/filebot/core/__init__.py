@@ -21,10 +21,16 @@
 """Core business logic for FileBot (providers, models, registry).
 
 Exposes high-level access to configured web service clients via
-`provider_registry`.
+`provider_registry`. The registry module (and with it every provider client)
+is imported on first access rather than at package import time.
 """
 
-from filebot.core.config import AppConfig, load_config_from_env
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from filebot.core.config import AppConfig, load_config_from_env, reload_config
 from filebot.core.models import Episode, Movie, SearchResult, SeriesInfo
 from filebot.core.providers.base import (
     BaseDatasource,
@@ -32,7 +38,14 @@ from filebot.core.providers.base import (
     EpisodeListProvider,
     MovieIdentificationService,
 )
-from filebot.core.registry import ProviderRegistry, provider_registry
+
+if TYPE_CHECKING:
+    from filebot.core.registry import ProviderRegistry, provider_registry
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "ProviderRegistry": "filebot.core.registry",
+    "provider_registry": "filebot.core.registry",
+}
 
 __all__ = [
     "AppConfig",
@@ -47,4 +60,21 @@ __all__ = [
     "SeriesInfo",
     "load_config_from_env",
     "provider_registry",
+    "reload_config",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import the provider registry on first access and cache it."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return eagerly bound names plus lazily importable attributes."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
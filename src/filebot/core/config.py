@@ -22,9 +22,10 @@
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Application configuration for web service clients.
 
@@ -34,6 +35,8 @@ class AppConfig:
         API key for TMDb (TheMovieDB) if configured.
     tvdb_api_key:
         API key for TheTVDB if configured.
+    cache_dir:
+        Directory for on-disk provider caches; None disables them.
     """
 
     tmdb_api_key: str | None = None
@@ -43,17 +46,24 @@ class AppConfig:
     omdb_api_key: str | None = None
     fanarttv_api_key: str | None = None
     acoustid_api_key: str | None = None
+    cache_dir: str | None = None
 
 
+@lru_cache(maxsize=1)
 def load_config_from_env() -> AppConfig:
     """Load configuration from environment variables.
 
+    The result is memoized; subsequent calls return the same frozen instance
+    until `reload_config` is called.
+
     Environment
     ----
     FILEBOT_API_TMDB:
         API key for TheMovieDB.
     FILEBOT_API_TVDB:
         API key for TheTVDB.
+    FILEBOT_CACHE_DIR:
+        Directory for on-disk provider caches.
 
     Returns
     -------
@@ -68,4 +78,22 @@ def load_config_from_env() -> AppConfig:
         omdb_api_key=os.getenv("FILEBOT_API_OMDB"),
         fanarttv_api_key=os.getenv("FILEBOT_API_FANARTTV"),
         acoustid_api_key=os.getenv("FILEBOT_API_ACOUSTID"),
+        cache_dir=os.getenv("FILEBOT_CACHE_DIR") or None,
     )
+
+
+def clear_config_cache() -> None:
+    """Forget the memoized configuration; the next access re-reads the env."""
+    load_config_from_env.cache_clear()
+
+
+def reload_config() -> AppConfig:
+    """Discard the memoized configuration and re-read the environment.
+
+    Returns
+    -------
+    AppConfig
+        Freshly loaded configuration object.
+    """
+    clear_config_cache()
+    return load_config_from_env()
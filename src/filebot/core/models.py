@@ -20,10 +20,17 @@
 
 """Core models module."""
 
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Final
 
 
+def _intern(value: str | None) -> str | None:
+    """Intern short, frequently repeated strings (codes, series names)."""
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass(slots=True)
 class SearchResult:
     """A generic search result.
@@ -40,21 +47,51 @@ class SearchResult:
 
     id: int
     name: str | None = None
-    alias_names: list[str] = field(default_factory=list)
+    alias_names: tuple[str, ...] = ()
+    _effective_names: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern the name shared by repeated search results."""
+        self.name = _intern(self.name)
 
-    def effective_names(self) -> list[str]:
+    def effective_names(self) -> tuple[str, ...]:
         """Return primary name followed by aliases.
 
         Returns
         -------
-        list[str]
+        tuple[str, ...]
             Primary name and aliases; empty if `name` is not set.
+
+        Notes
+        -----
+        The tuple is computed on first call and reused afterwards; `name` and
+        `alias_names` are expected to be final once a result is published.
+        """
+        names = self._effective_names
+        if names is None:
+            if not self.name:
+                names = ()
+            elif not self.alias_names:
+                names = (self.name,)
+            else:
+                names = (self.name, *self.alias_names)
+            self._effective_names = names
+        return names
+
+    def iter_effective_names(self) -> Iterator[str]:
+        """Iterate primary name followed by aliases without building a tuple.
+
+        Yields
+        ------
+        str
+            Primary name, then each alias; nothing if `name` is not set.
         """
         if not self.name:
-            return []
-        if not self.alias_names:
-            return [self.name]
-        return [self.name, *self.alias_names]
+            return
+        yield self.name
+        yield from self.alias_names
 
 
 @dataclass(slots=True)
@@ -78,17 +115,25 @@ class Movie:
     """
 
     name: str
-    alias_names: list[str] = field(default_factory=list)
+    alias_names: tuple[str, ...] = ()
     year: int | None = None
     imdb_id: int | None = None
     tmdb_id: int | None = None
     language: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern name and language code."""
+        self.name = _intern(self.name)
+        self.language = _intern(self.language)
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class SeriesInfo:
     """Series-level information for an episode provider.
 
+    Instances are immutable so one snapshot can be shared by every `Episode`
+    of a series instead of being copied per episode.
+
     Parameters
     ----------
     id:
@@ -104,22 +149,32 @@ class SeriesInfo:
     runtime:
         Typical runtime in minutes if known.
     genres:
-        List of genre names.
+        Genre names.
     network:
         Network or production company name if known.
     """
 
     id: int
     name: str | None = None
-    alias_names: list[str] = field(default_factory=list)
+    alias_names: tuple[str, ...] = ()
     order: str | None = None
     status: str | None = None
     runtime: int | None = None
-    genres: list[str] = field(default_factory=list)
+    genres: tuple[str, ...] = ()
     network: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern name and small-vocabulary metadata strings."""
+        # Frozen dataclass: bypass the generated __setattr__ guard
+        object.__setattr__(self, "name", _intern(self.name))
+        object.__setattr__(self, "order", _intern(self.order))
+        object.__setattr__(self, "status", _intern(self.status))
+        object.__setattr__(self, "network", _intern(self.network))
+        if self.genres:
+            object.__setattr__(self, "genres", tuple(map(_intern, self.genres)))
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, repr=False)
 class Episode:
     """Episode information used for formatting and renaming.
 
@@ -142,7 +197,7 @@ class Episode:
     id:
         Provider-specific episode ID.
     series_info:
-        Copy of series info snapshot at retrieval time.
+        Series info snapshot at retrieval time, shared across the series.
     """
 
     series_name: str
@@ -155,6 +210,60 @@ class Episode:
     id: int | None = None
     series_info: SeriesInfo | None = None
 
+    def __post_init__(self) -> None:
+        """Intern the series name repeated on every episode of a series."""
+        self.series_name = _intern(self.series_name)
+
+    @classmethod
+    def from_values(
+        cls,
+        series_name: str,
+        season: int | None,
+        episode: int | None,
+        title: str | None,
+        absolute: int | None,
+        special_number: int | None,
+        airdate: str | None,
+        id: int | None,  # noqa: A002 - matches the field name
+        series_info: SeriesInfo | None,
+    ) -> "Episode":
+        """Build an episode from positional values, bypassing ``__init__``.
+
+        Meant for provider loops that build thousands of episodes: slots are
+        assigned directly and the interning ``__post_init__`` does is done
+        inline. Every field is required; there are no defaults.
+
+        Returns
+        -------
+        Episode
+            Episode equal to ``Episode(...)`` called with the same values.
+        """
+        self = object.__new__(cls)
+        self.series_name = _intern(series_name)
+        self.season = season
+        self.episode = episode
+        self.title = title
+        self.absolute = absolute
+        self.special_number = special_number
+        self.airdate = airdate
+        self.id = id
+        self.series_info = series_info
+        return self
+
+    def __repr__(self) -> str:
+        """Return a compact representation; episode lists can be very long."""
+        if self.season is not None:
+            number = f"S{self.season}E{self.episode}"
+        elif self.special_number is not None:
+            number = f"SP{self.special_number}"
+        else:
+            number = f"E{self.episode}"
+        return f"Episode({self.series_name!r}, {number}, id={self.id!r})"
+
+    def __hash__(self) -> int:
+        """Hash on identifying fields so episodes can key sets and dicts."""
+        return hash((self.id, self.season, self.episode, self.special_number))
+
 
 @dataclass(slots=True)
 class MultiEpisode:
@@ -199,6 +308,11 @@ class Artwork:
     language: str | None = None
     rating: float | None = None
 
+    def __post_init__(self) -> None:
+        """Intern category and language code."""
+        self.category = _intern(self.category)
+        self.language = _intern(self.language)
+
 
 @dataclass(slots=True)
 class SubtitleSearchResult:
@@ -226,3 +340,48 @@ class SubtitleSearchResult:
     tmdb_id: int | None = None
     score: int | None = None
     url: str | None = None
+
+    def __post_init__(self) -> None:
+        """Intern the language code."""
+        self.lang = _intern(self.lang)
+
+
+@dataclass(slots=True)
+class MusicRecording:
+    """Recording matched by a music identification service.
+
+    Parameters
+    ----------
+    id:
+        Provider recording ID (e.g., MusicBrainz recording MBID).
+    title:
+        Recording title if available.
+    artists:
+        Artist names in credited order.
+    duration:
+        Duration in seconds if available.
+    """
+
+    id: str
+    title: str | None = None
+    artists: tuple[str, ...] = ()
+    duration: int | None = None
+
+
+@dataclass(slots=True)
+class MusicMatch:
+    """Fingerprint match returned by a music identification service.
+
+    Parameters
+    ----------
+    id:
+        Provider match ID (e.g., AcoustID track ID).
+    score:
+        Match confidence between 0 and 1.
+    recordings:
+        Recordings linked to the match.
+    """
+
+    id: str
+    score: float
+    recordings: tuple[MusicRecording, ...] = ()
@@ -18,12 +18,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Core providers package."""
+"""Core providers package.
+
+Protocols and episode helpers are imported eagerly; concrete provider clients
+are resolved lazily on first attribute access (PEP 562) so importing the
+package does not pull in every client module.
+"""
 
 from __future__ import annotations
 
-from filebot.core.providers.acoustid import AcoustIDClient
-from filebot.core.providers.anidb import AniDBClient
+import importlib
+from typing import TYPE_CHECKING
+
 from filebot.core.providers.base import (
     ArtworkProvider,
     BaseDatasource,
@@ -34,17 +40,36 @@ from filebot.core.providers.base import (
     SubtitleProvider,
 )
 from filebot.core.providers.episode_utils import (
+    build_absolute_index,
     create_episode,
     get_multi_episode_list,
     match_by_absolute,
+    match_many_by_absolute,
 )
-from filebot.core.providers.fanarttv import FanartTVClient
-from filebot.core.providers.omdb import OMDbClient
-from filebot.core.providers.opensubtitles import OpenSubtitlesClient
-from filebot.core.providers.tmdb import TMDbClient
-from filebot.core.providers.tmdb_tv import TMDbTVClient
-from filebot.core.providers.tvdb import TheTVDBClient
-from filebot.core.providers.tvmaze import TVMazeClient
+
+if TYPE_CHECKING:
+    from filebot.core.providers.acoustid import AcoustIDClient
+    from filebot.core.providers.anidb import AniDBClient
+    from filebot.core.providers.fanarttv import FanartTVClient
+    from filebot.core.providers.omdb import OMDbClient
+    from filebot.core.providers.opensubtitles import OpenSubtitlesClient
+    from filebot.core.providers.tmdb import TMDbClient
+    from filebot.core.providers.tmdb_tv import TMDbTVClient
+    from filebot.core.providers.tvdb import TheTVDBClient
+    from filebot.core.providers.tvmaze import TVMazeClient
+
+# Public client name -> defining module, imported on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    "AcoustIDClient": "filebot.core.providers.acoustid",
+    "AniDBClient": "filebot.core.providers.anidb",
+    "FanartTVClient": "filebot.core.providers.fanarttv",
+    "OMDbClient": "filebot.core.providers.omdb",
+    "OpenSubtitlesClient": "filebot.core.providers.opensubtitles",
+    "TMDbClient": "filebot.core.providers.tmdb",
+    "TMDbTVClient": "filebot.core.providers.tmdb_tv",
+    "TVMazeClient": "filebot.core.providers.tvmaze",
+    "TheTVDBClient": "filebot.core.providers.tvdb",
+}
 
 __all__ = [
     "AcoustIDClient",
@@ -63,7 +88,25 @@ __all__ = [
     "TMDbTVClient",
     "TVMazeClient",
     "TheTVDBClient",
+    "build_absolute_index",
     "create_episode",
     "get_multi_episode_list",
     "match_by_absolute",
+    "match_many_by_absolute",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import provider clients on first access and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return eagerly bound names plus lazily importable clients."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
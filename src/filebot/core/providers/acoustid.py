@@ -5,25 +5,38 @@
 from __future__ import annotations
 
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-
-from filebot.core.providers.base import BaseDatasource, MusicIdentificationService
-from filebot.core.providers.utils import RateLimiter, is_allowed_http
+from urllib.parse import quote
+from urllib.request import Request
+
+from filebot.core.models import MusicMatch, MusicRecording
+from filebot.core.providers.base import (
+    BaseDatasource,
+    MusicIdentificationService,
+    RestClientMixin,
+    gunzip_if_needed,
+)
+from filebot.core.providers.connection_pool import urlopen
 
 # AcoustID API URLs
-_ACOUSTID_BASE_URL = "http://api.acoustid.org/v2/lookup"
-_ACOUSTID_ALLOWED_HOSTS = {"api.acoustid.org"}
+_ACOUSTID_BASE_URL = "https://api.acoustid.org/v2/lookup"
+_ACOUSTID_META = "recordings+releases+releasegroups+tracks+compress"
+# Invariant URL head; only client, duration and fingerprint vary per call
+_ACOUSTID_LOOKUP_PREFIX = f"{_ACOUSTID_BASE_URL}?meta={_ACOUSTID_META}"
 
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from collections.abc import Sequence
+
+    from filebot.core.providers.cache import ExpiringLRUCache
+    from filebot.core.providers.utils import RateLimiter
 
 
 @dataclass(slots=True)
-class AcoustIDClient(BaseDatasource, MusicIdentificationService):
+class AcoustIDClient(BaseDatasource, RestClientMixin, MusicIdentificationService):
     """AcoustID client.
 
     Parameters
@@ -33,7 +46,8 @@ class AcoustIDClient(BaseDatasource, MusicIdentificationService):
     """
 
     apikey: str
-    _cache_day: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
     _limiter: RateLimiter = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -56,30 +70,137 @@ class AcoustIDClient(BaseDatasource, MusicIdentificationService):
         """Lookup recordings by Chromaprint fingerprint and duration."""
         if duration < 1 or not fingerprint:
             return {}
-        url = (
-            _ACOUSTID_BASE_URL
-            + "?"
-            + urlencode({
-                "client": self.apikey,
-                "meta": "recordings+releases+releasegroups+tracks+compress",
-                "duration": duration,
-                "fingerprint": fingerprint,
-            })
-        )
-        if not is_allowed_http(url, _ACOUSTID_ALLOWED_HOSTS):
-            return {}
-
-        cached = self._cache_day.get(url)
+        # Key on the inputs so cache hits skip URL encoding of the fingerprint
+        key = (duration, fingerprint)
+        cached = self._cache_short.get(key)
         if cached is not None:
             return cached
 
+        data = self._fetch(duration, fingerprint)
+        if data is None:
+            return {}
+        self._cache_short[key] = data
+        return data
+
+    def identify(self, duration: int, fingerprint: str) -> list[MusicMatch]:
+        """Lookup a fingerprint and return typed matches, best score first.
+
+        Shares the response cache with `lookup`; only the parsed view differs.
+        """
+        return _parse_matches(self.lookup(duration, fingerprint))
+
+    def lookup_many(
+        self, items: Sequence[tuple[int, str]], max_workers: int = 5
+    ) -> list[dict]:
+        """Lookup several (duration, fingerprint) pairs concurrently.
+
+        Parameters
+        ----------
+        items:
+            Pairs of track duration in seconds and Chromaprint fingerprint.
+        max_workers:
+            Maximum number of requests in flight; the shared rate limiter
+            still caps overall throughput.
+
+        Returns
+        -------
+        list[dict]
+            Lookup results in input order; empty dicts for invalid input or
+            failed requests.
+        """
+        results: list[dict] = [{} for _ in items]
+        pending: dict[tuple[int, str], list[int]] = {}
+        for index, (duration, fingerprint) in enumerate(items):
+            if duration < 1 or not fingerprint:
+                continue
+            key = (duration, fingerprint)
+            cached = self._cache_short.get(key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+        if not pending:
+            return results
+
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(lambda k: self._fetch(*k), pending))
+        # Cache writes stay on the calling thread so each pair is stored once
+        for key, data in zip(pending, fetched, strict=True):
+            if data is None:
+                continue
+            self._cache_short[key] = data
+            for index in pending[key]:
+                results[index] = data
+        return results
+
+    def _fetch(self, duration: int, fingerprint: str) -> dict | None:
+        """Request a lookup from the API; None on transport or decode errors."""
+        url = (
+            f"{_ACOUSTID_LOOKUP_PREFIX}&client={quote(self.apikey, safe='')}"
+            f"&duration={duration}&fingerprint={quote(fingerprint, safe='')}"
+        )
+        # Literal prefix test; the URL is built from a module constant
+        if not url.startswith("https://"):
+            return None
+
         self._limiter.acquire()
 
         req = Request(url, headers={"Accept-Encoding": "gzip"})  # noqa: S310
         try:
-            with urlopen(req, timeout=20) as resp:  # noqa: S310
-                data = json.loads(resp.read().decode("utf-8"))
-                self._cache_day[url] = data
-                return data
-        except (HTTPError, URLError, TimeoutError, json.JSONDecodeError):
-            return {}
+            with urlopen(req, timeout=20) as resp:
+                raw = resp.read()
+        except (HTTPError, URLError, TimeoutError):
+            return None
+        try:
+            # json.loads decodes UTF-8 bytes directly
+            return json.loads(gunzip_if_needed(raw))
+        except (OSError, EOFError, zlib.error, ValueError):
+            return None
+
+
+def _parse_recording(rec: object) -> MusicRecording | None:
+    """Convert one AcoustID recording entry into a `MusicRecording`."""
+    if not isinstance(rec, dict):
+        return None
+    rec_id = rec.get("id")
+    if not isinstance(rec_id, str):
+        return None
+    title = rec.get("title")
+    duration = rec.get("duration")
+    artists = tuple(
+        a["name"]
+        for a in rec.get("artists") or ()
+        if isinstance(a, dict) and isinstance(a.get("name"), str)
+    )
+    return MusicRecording(
+        id=rec_id,
+        title=title if isinstance(title, str) else None,
+        artists=artists,
+        duration=int(duration) if isinstance(duration, int | float) else None,
+    )
+
+
+def _parse_matches(data: dict[str, Any]) -> list[MusicMatch]:
+    """Convert an AcoustID lookup payload into `MusicMatch` objects."""
+    if data.get("status") != "ok":
+        return []
+    matches: list[MusicMatch] = []
+    for res in data.get("results") or ():
+        if not isinstance(res, dict) or not isinstance(res.get("id"), str):
+            continue
+        score = res.get("score")
+        recordings = tuple(
+            rec
+            for rec in map(_parse_recording, res.get("recordings") or ())
+            if rec is not None
+        )
+        matches.append(
+            MusicMatch(
+                id=res["id"],
+                score=float(score) if isinstance(score, int | float) else 0.0,
+                recordings=recordings,
+            )
+        )
+    matches.sort(key=lambda m: m.score, reverse=True)
+    return matches
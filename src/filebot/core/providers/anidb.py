@@ -27,10 +27,18 @@ retrieval via the AniDB HTTP API.
 from __future__ import annotations
 
 import gzip
+import html
 import io
 import json
+import logging
 import re
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import TYPE_CHECKING
 from xml.etree import ElementTree as ET  # noqa: S405 - trusted XML from AniDB API
 
@@ -40,10 +48,16 @@ from filebot.core.providers.base import (
     EpisodeListProvider,
     RestClientMixin,
 )
+from filebot.core.providers.cache import shared_cache
 from filebot.core.providers.utils import is_allowed_http
 
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+
+    from filebot.core.providers.cache import ExpiringLRUCache
+
+_LOGGER = logging.getLogger(__name__)
 
 _ANIDB_TITLES_URL = "http://anidb.net/api/anime-titles.dat.gz"
 _ANIDB_HTTP_API = (
@@ -51,7 +65,24 @@ _ANIDB_HTTP_API = (
     "&clientver={clientver}&protover=1&aid={aid}"
 )
 _ANIDB_PUBLIC_URL = "http://anidb.net"
-_ALLOWED_HOSTS = {"anidb.net", "api.anidb.net:9001", "api.anidb.net"}
+_ALLOWED_HOSTS = frozenset({"anidb.net", "api.anidb.net:9001", "api.anidb.net"})
+_TRIGRAM = 3
+# bump when the persisted titles file layout changes
+_TITLES_FILE_VERSION = 1
+_TITLES_FILE_TTL = 24 * 60 * 60
+_GZIP_CHUNK = 128 * 1024
+# Title type and language priority for the titles dump (raw bytes, as matched):
+# main, official, synonym, short; romaji, English, Japanese
+_TYPE_RANK = {b"1": 0, b"4": 1, b"2": 2, b"3": 3}
+_LANGUAGE_RANK = {b"x-jat": 0, b"en": 1, b"ja": 2}
+_TITLE_BUCKETS = len(_TYPE_RANK) * len(_LANGUAGE_RANK)
+# Legacy ISO 639 codes still produced by some locales
+_LEGACY_LANGUAGE_CODES = {"iw": "he", "in": "id"}
+# aid|type|language|title; matched on raw bytes, optional CR before the newline
+_TITLES_RE = re.compile(rb"^(?!#)(\d+)\|(\d)\|([\w-]+)\|(.+?)\r?$")
+_AIRDATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# ElementPath expressions; ElementTree compiles and caches them on first use
+_MAIN_TITLE_PATH = ".//titles/title[@type='main']"
 
 
 @dataclass(slots=True)
@@ -64,21 +95,36 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         Registered AniDB client identifier.
     clientver:
         Client version integer.
+    titles_cache_path:
+        File in which to persist the parsed titles index for a day, so warm
+        starts skip the download and parse. None disables persistence.
     """
 
     client: str
     clientver: int
+    # optional on-disk copy of the parsed titles index, reused across restarts
+    titles_cache_path: Path | None = None
 
     # simple in-memory cache for anime titles index
     _titles_cache: list[SearchResult] | None = None
-    _cache_short: TTLCache | None = None
-    _cache_long: TTLCache | None = None
+    # trigram -> positions in `_titles_cache`, plus pre-lowered names per entry
+    _trigram_index: dict[str, set[int]] | None = None
+    _lowered_names: list[str] | None = None
+    _cache_short: ExpiringLRUCache | None = None
+    _cache_long: ExpiringLRUCache | None = None
+    # aid -> main title, filled by either XML parse so the other can skip it
+    _main_titles: ExpiringLRUCache | None = None
 
     def __post_init__(self) -> None:
         """Initialize caches for AniDB client."""
+        # AniDB bans clients exceeding roughly one request every two seconds
         self._init_rest(
             short_ttl=24 * 60 * 60,
             long_ttl=7 * 24 * 60 * 60,
+            rate=(1, 2),
+        )
+        self._main_titles = shared_cache(
+            type(self), "main_titles", maxsize=128, ttl=24 * 60 * 60
         )
 
     @property
@@ -97,7 +143,9 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         """Return False; AniDB uses absolute numbering."""
         return False
 
-    def search(self, query: str, locale: str) -> list[SearchResult]:
+    def search(
+        self, query: str, locale: str, *, limit: int | None = None
+    ) -> list[SearchResult]:
         """Search anime titles locally using the AniDB titles index.
 
         Parameters
@@ -106,6 +154,8 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
             Free-form query.
         locale:
             Unused for index search.
+        limit:
+            Stop after this many matches (in index order); None returns all.
 
         Returns
         -------
@@ -114,14 +164,19 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         """
         titles = self._load_titles_index()
         q = query.strip().lower()
-        if not q:
+        if not q or not titles:
             return []
-        matches: list[SearchResult] = []
-        for it in titles:
-            names = [n.lower() for n in it.effective_names()]
-            if any(q in n for n in names):
-                matches.append(it)
-        return matches
+        index, lowered = self._search_index(titles)
+        matches = _match_all(titles, index, lowered, (q,))
+        words = q.split()
+        if len(words) > 1:
+            # Fall back to every word in any order ("titan attack") only when
+            # the exact phrase finds nothing, so phrase hits keep precedence
+            phrase = list(islice(matches, limit))
+            if phrase:
+                return phrase
+            matches = _match_all(titles, index, lowered, words)
+        return list(islice(matches, limit))
 
     def get_episode_list(
         self, series: SearchResult | int, order: str, locale: str
@@ -144,41 +199,48 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         """
         sid = series.id if isinstance(series, SearchResult) else int(series)
         lang = _normalize_language(locale)
-        xml_data = self._request_xml(sid)
-
-        # Parse error node
-        if xml_data.find("error") is not None and (xml_data.findtext("error") or ""):
-            # expose message if present
-            raise RuntimeError(xml_data.findtext("error") or "AniDB error")
-
-        series_name = self._select_text(xml_data, "anime/titles/title[@type='main']")
-        official_name = self._select_text(
-            xml_data, f"anime/titles/title[@type='official' and @lang='{lang}']"
-        )
-        if not official_name:
-            official_name = series_name
-
-        episodes: list[Episode] = []
-        for node in xml_data.findall("anime/episodes/episode"):
-            ep = self._episode_from_node(
-                node=node,
-                lang=lang,
-                order=order,
-                series_name=series_name,
-                official_name=official_name,
-                sid=sid,
-            )
-            if ep is not None:
-                episodes.append(ep)
+        xml_bytes = self._request_xml_bytes(sid)
+
+        # Stream the document: each <episode> is converted and then dropped, so
+        # peak memory no longer scales with a full DOM of long series
+        titles: list[ET.Element] = []
+        info: SeriesInfo | None = None
+        keyed: list[tuple[tuple[int, int], Episode]] = []
+        path: list[ET.Element] = []
+        for event, elem in ET.iterparse(  # noqa: S314 - trusted XML from AniDB API
+            io.BytesIO(xml_bytes), events=("start", "end")
+        ):
+            if event == "start":
+                path.append(elem)
+                continue
+            path.pop()
+            parent = path[-1] if path else None
+            if elem.tag == "error" and len(path) <= 1 and (elem.text or "").strip():
+                # expose message if present
+                raise RuntimeError(elem.text.strip())
+            if parent is None:
+                continue
+            if elem.tag == "title" and parent.tag == "titles":
+                titles.append(elem)
+            elif elem.tag == "episode" and parent.tag == "episodes":
+                if info is None:
+                    # AniDB lists <titles> before <episodes>; one immutable
+                    # snapshot is shared by every episode of the series
+                    info = _series_info_from_titles(sid, titles, lang)
+                item = self._episode_from_node(
+                    node=elem,
+                    lang=lang,
+                    order=order,
+                    series_info=info,
+                )
+                if item is not None:
+                    keyed.append(item)
+                parent.clear()
+        self._main_titles[sid] = _main_title(titles)
 
         # sort: normal episodes first by episode number, then specials
-        episodes.sort(
-            key=lambda e: (
-                0 if e.episode is not None else 1,
-                e.episode if e.episode is not None else (e.special_number or 0),
-            )
-        )
-        return episodes
+        keyed.sort(key=itemgetter(0))
+        return [ep for _, ep in keyed]
 
     def _episode_from_node(
         self,
@@ -186,18 +248,22 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         *,
         lang: str,
         order: str,
-        series_name: str | None,
-        official_name: str | None,
-        sid: int,
-    ) -> Episode | None:
+        series_info: SeriesInfo,
+    ) -> tuple[tuple[int, int], Episode] | None:
         """Create an Episode object from an AniDB episode XML node.
 
-        Returns None if the node is not a normal/special episode.
+        Returns the episode with its sort key, ``(0, number)`` for normal
+        episodes and ``(1, number)`` for specials, or None if the node is not
+        a normal/special episode.
         """
         epno = node.find("epno")
         if epno is None or epno.text is None:
             return None
-        number = int(re.sub(r"\D", "", epno.text))
+        # epno is e.g. "12", "S1" or "C3"; keep the decimal digits only
+        digits = "".join(filter(str.isdecimal, epno.text))
+        if not digits:
+            return None
+        number = int(digits)
         type_attr = epno.get("type")
         try:
             ep_type = int(type_attr) if type_attr is not None else 0
@@ -211,23 +277,17 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         except ValueError:
             eid = None
 
-        airdate = self._select_text(node, "airdate") or None
-        title = self._select_text(node, f".//title[@lang='{lang}']") or ""
-        if not title:
-            title = self._select_text(node, ".//title[@lang='en']") or ""
+        airdate = _find_text(node, "airdate") or None
+        title = _title_by_lang(node.iter("title"), lang, fallback="en")
 
-        series_display = official_name or series_name or ""
+        series_display = series_info.name or ""
 
         if ep_type == 1:  # normal episode
             abs_num = number
-            if (
-                order == "AbsoluteAirdate"
-                and airdate
-                and re.match(r"\d{4}-\d{2}-\d{2}", airdate)
-            ):
+            if order == "AbsoluteAirdate" and airdate and _AIRDATE_RE.match(airdate):
                 y, m, d = airdate.split("-")
                 abs_num = int(y) * 10000 + int(m) * 100 + int(d)
-            return Episode(
+            return (0, number), Episode(
                 series_name=series_display,
                 season=None,
                 episode=number,
@@ -236,11 +296,11 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
                 special_number=None,
                 airdate=airdate,
                 id=eid,
-                series_info=SeriesInfo(id=sid, name=series_display),
+                series_info=series_info,
             )
 
         # special
-        return Episode(
+        return (1, number), Episode(
             series_name=series_display,
             season=None,
             episode=None,
@@ -249,7 +309,7 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
             special_number=number,
             airdate=airdate,
             id=eid,
-            series_info=SeriesInfo(id=sid, name=series_display),
+            series_info=series_info,
         )
 
     def get_series_info(self, series: SearchResult | int, locale: str) -> SeriesInfo:
@@ -268,10 +328,57 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
             Series info with localized name and aliases when available.
         """
         sid = series.id if isinstance(series, SearchResult) else int(series)
-        xml_data = self._request_xml(sid)
-        series_name = self._select_text(xml_data, "anime/titles/title[@type='main']")
+        series_name = self._main_titles.get(sid)
+        if series_name is None:
+            series_name = _find_text(self._request_xml(sid), _MAIN_TITLE_PATH)
+            self._main_titles[sid] = series_name
         return SeriesInfo(id=sid, name=series_name or None)
 
+    def get_episode_lists(
+        self,
+        series_ids: Iterable[int],
+        order: str,
+        locale: str,
+        max_workers: int = 4,
+    ) -> dict[int, list[Episode]]:
+        """Fetch episode lists for several series concurrently.
+
+        Network requests still pass the shared rate limiter one at a time;
+        parsing and cache hits overlap with them.
+
+        Parameters
+        ----------
+        series_ids:
+            AniDB numeric IDs; duplicates are fetched once.
+        order:
+            Sort order, as for `get_episode_list`.
+        locale:
+            Preferred language, as for `get_episode_list`.
+        max_workers:
+            Maximum number of series processed at once.
+
+        Returns
+        -------
+        dict[int, list[Episode]]
+            Episodes per series ID in input order; empty lists for series
+            that failed to load.
+        """
+        ids = list(dict.fromkeys(series_ids))
+        if not ids:
+            return {}
+
+        def _fetch(sid: int) -> list[Episode]:
+            try:
+                return self.get_episode_list(sid, order, locale)
+            except (RuntimeError, ET.ParseError):
+                # ParseError: truncated or malformed XML body
+                _LOGGER.warning("anidb_episode_list_failed", extra={"aid": sid})
+                return []
+
+        workers = max(1, min(max_workers, len(ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(ids, executor.map(_fetch, ids), strict=True))
+
     def get_episode_list_link(self, series: SearchResult) -> str:
         """Return AniDB public series page URL."""
         return f"{_ANIDB_PUBLIC_URL}/a{series.id}"
@@ -280,6 +387,12 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
     def _load_titles_index(self) -> list[SearchResult]:
         if self._titles_cache is not None:
             return self._titles_cache
+        if self.titles_cache_path is not None:
+            stored = _read_titles_file(self.titles_cache_path)
+            if stored is not None:
+                self._titles_cache = stored
+                self._trigram_index = self._lowered_names = None
+                return stored
 
         url = _ANIDB_TITLES_URL
         if not is_allowed_http(url, _ALLOWED_HOSTS):
@@ -293,49 +406,59 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         )
         if raw is None:
             return []
-        data = gzip.decompress(raw)
-        # parse
-        lines = io.BytesIO(data).read().decode("utf-8", errors="ignore").splitlines()
-        pattern = re.compile(r"^(?!#)(\d+)[|](\d)[|]([\w-]+)[|](.+)$")
-
-        # language and type priority
-        language_order = ["x-jat", "en", "ja"]
-        type_order = ["1", "4", "2", "3"]
-
-        by_aid: dict[int, list[tuple[int, int, str]]] = {}
-        for line in lines:
-            m = pattern.match(line)
-            if not m:
-                continue
-            aid = int(m.group(1))
-            typ = m.group(2)
-            lang = m.group(3)
-            title = _html_unescape(m.group(4))
-            if aid > 0 and title and typ in type_order and lang in language_order:
-                if typ == "3" and (
-                    len(title) < 5 or not title[:1].isupper() or title[-1:].isupper()
-                ):
-                    continue
-                by_aid.setdefault(aid, []).append((
-                    type_order.index(typ),
-                    language_order.index(lang),
-                    title,
-                ))
+        by_aid = _parse_titles(raw)
 
         results: list[SearchResult] = []
-        for aid, entries in by_aid.items():
-            entries_sorted = sorted(entries, key=lambda t: (t[0], t[1]))
-            names = [title for _, _, title in entries_sorted]
+        lowered: list[str] = []
+        for aid, buckets in by_aid.items():
+            # Buckets are already in (type, language) priority order
+            names = [title for bucket in buckets if bucket for title in bucket]
             if not names:
                 continue
             primary = names[0]
-            aliases = names[1:]
+            aliases = tuple(names[1:])
             results.append(SearchResult(id=aid, name=primary, alias_names=aliases))
+            # NUL never occurs in titles, so one `in` test covers every name
+            lowered.append("\0".join(names).lower())
 
         self._titles_cache = results
+        self._lowered_names = lowered
+        self._trigram_index = None
+        if self.titles_cache_path is not None:
+            _write_titles_file(self.titles_cache_path, results)
         return results
 
+    def _search_index(
+        self, titles: list[SearchResult]
+    ) -> tuple[dict[str, set[int]], list[str]]:
+        """Return the trigram index and lowered names for `titles`, building once.
+
+        Lowered names normally come from `_load_titles_index`; they are only
+        derived here when the titles list was provided some other way.
+        """
+        lowered = self._lowered_names
+        if lowered is None or len(lowered) != len(titles):
+            lowered = [
+                "\0".join(item.iter_effective_names()).lower() for item in titles
+            ]
+            self._lowered_names = lowered
+            self._trigram_index = None
+        if self._trigram_index is not None:
+            return self._trigram_index, lowered
+        index: dict[str, set[int]] = {}
+        for pos, names in enumerate(lowered):
+            for gram in {
+                names[i : i + _TRIGRAM] for i in range(len(names) - _TRIGRAM + 1)
+            }:
+                index.setdefault(gram, set()).add(pos)
+        self._trigram_index = index
+        return index, lowered
+
     def _request_xml(self, aid: int) -> ET.Element:
+        xml_bytes = self._request_xml_bytes(aid)
+        return ET.fromstring(xml_bytes)  # noqa: S314 - trusted XML from AniDB API
+
+    def _request_xml_bytes(self, aid: int) -> bytes:
         url = _ANIDB_HTTP_API.format(
             client=self.client, clientver=self.clientver, aid=aid
         )
@@ -352,51 +475,190 @@ class AniDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         if xml_bytes is None:
             message = "AniDB: request failed"
             raise RuntimeError(message)
-        return ET.fromstring(xml_bytes)  # noqa: S314 - trusted XML from AniDB API
-
-    def _select_text(self, root: ET.Element, xpath: str) -> str:
-        """Return first match text by simple XPath subset.
-
-        Supports absolute paths without predicates except for attribute filter
-        used in this module.
-        """
-        # very small subset: /a/b/c and filters like tag[@attr='val']
-        segments = xpath.strip("/").split("/")
-        current: list[ET.Element] = [root]
-        for seg in segments:
-            attr_name = attr_val = None
-            if "[@" in seg:
-                # e.g. title[@type='main']
-                name, rest = seg.split("[@", 1)
-                attr_name, attr_val = rest[:-1].split("=", 1)
-                attr_val = attr_val.strip("'\"")
-            else:
-                name = seg
-            next_nodes: list[ET.Element] = []
-            for node in current:
-                children = [
-                    child
-                    for child in node.findall(name)
-                    if attr_name is None or child.get(attr_name) == attr_val
-                ]
-                next_nodes.extend(children)
-            current = next_nodes
-            if not current:
-                return ""
-        return (current[0].text or "").strip()
-
-
+        return xml_bytes
+
+
+def _match_all(
+    titles: list[SearchResult],
+    index: dict[str, set[int]],
+    lowered: list[str],
+    needles: Sequence[str],
+) -> Iterator[SearchResult]:
+    """Yield titles whose lowered names contain every needle, in index order."""
+    grams = {
+        needle[i : i + _TRIGRAM]
+        for needle in needles
+        for i in range(len(needle) - _TRIGRAM + 1)
+    }
+    if grams:
+        postings = []
+        for gram in grams:
+            posting = index.get(gram)
+            if posting is None:
+                return
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates: Iterable[int] = sorted(postings[0].intersection(*postings[1:]))
+    else:
+        # Every needle is shorter than a trigram: scan the pre-lowered names
+        candidates = range(len(titles))
+    # Confirm the substring match; trigrams alone can match out of order
+    for pos in candidates:
+        names = lowered[pos]
+        if all(needle in names for needle in needles):
+            yield titles[pos]
+
+
+def _iter_gzip_lines(raw: bytes) -> Iterator[bytes]:
+    """Yield raw lines of a gzip blob without materializing the plain text.
+
+    Decompresses 128 KiB at a time with a single zlib object (``wbits=31``
+    reads the gzip framing in C), falling back to `gzip.GzipFile` for
+    input zlib rejects. Lines may keep a trailing CR, which `_TITLES_RE`
+    tolerates.
+    """
+    decomp = zlib.decompressobj(wbits=31)
+    view = memoryview(raw)
+    tail = b""
+    try:
+        for start in range(0, len(view), _GZIP_CHUNK):
+            lines = (tail + decomp.decompress(view[start : start + _GZIP_CHUNK])).split(
+                b"\n"
+            )
+            tail = lines.pop()
+            yield from lines
+        tail += decomp.flush()
+    except zlib.error:
+        if tail or start:
+            raise  # already yielded part of the stream; do not restart
+        with gzip.GzipFile(fileobj=io.BytesIO(raw), mode="rb") as gz:
+            yield from gz
+        return
+    if tail:
+        yield from tail.split(b"\n")
+
+
+def _parse_titles(raw: bytes) -> dict[int, list[list[str]]]:
+    """Parse the gzipped titles dump into per-aid priority buckets of titles.
+
+    Each aid maps to one bucket per (type, language) pair, ordered by
+    priority, so flattening the buckets yields titles best-first without a
+    per-aid sort.
+    """
+    by_aid: dict[int, list[list[str]]] = {}
+    # parse while decompressing; no full bytes/str/list copies of the index
+    for line in _iter_gzip_lines(raw):
+        m = _TITLES_RE.match(line)
+        if not m:
+            continue
+        aid_raw, typ, lang, title_raw = m.groups()
+        # O(1) rank lookups reject other types/languages before any conversion
+        type_rank = _TYPE_RANK.get(typ)
+        lang_rank = _LANGUAGE_RANK.get(lang)
+        if type_rank is None or lang_rank is None:
+            continue
+        aid = int(aid_raw)
+        if aid <= 0:
+            continue
+        # Only surviving records pay for UTF-8 decoding
+        title = _html_unescape(title_raw.decode("utf-8", errors="ignore"))
+        if not title or (
+            typ == b"3"
+            and (len(title) < 5 or not title[:1].isupper() or title[-1:].isupper())
+        ):
+            continue
+        buckets = by_aid.get(aid)
+        if buckets is None:
+            buckets = by_aid[aid] = [[] for _ in range(_TITLE_BUCKETS)]
+        buckets[type_rank * len(_LANGUAGE_RANK) + lang_rank].append(title)
+    return by_aid
+
+
+def _read_titles_file(path: Path) -> list[SearchResult] | None:
+    """Load a persisted titles index; None if missing, stale or unreadable."""
+    try:
+        if time.time() - path.stat().st_mtime >= _TITLES_FILE_TTL:
+            return None
+        with gzip.open(path, "rb") as fh:
+            payload = json.load(fh)
+        if payload.get("version") != _TITLES_FILE_VERSION:
+            return None
+        return [
+            SearchResult(id=aid, name=name, alias_names=tuple(aliases))
+            for aid, name, aliases in payload["titles"]
+        ]
+    except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def _write_titles_file(path: Path, titles: list[SearchResult]) -> None:
+    """Persist the titles index atomically; failures only cost the warm start."""
+    payload = {
+        "version": _TITLES_FILE_VERSION,
+        "titles": [[t.id, t.name, t.alias_names] for t in titles],
+    }
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # JSON rather than pickle: the cache dir is user-writable
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=1) as fh:
+            json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+        tmp.replace(path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _find_text(root: ET.Element, path: str) -> str:
+    """Return the stripped text of the first element matching `path`, or ""."""
+    return (root.findtext(path) or "").strip()
+
+
+def _main_title(titles: list[ET.Element]) -> str:
+    """Return the stripped text of the first main-type title, or ""."""
+    main = next((t for t in titles if t.get("type") == "main"), None)
+    return (main.text or "").strip() if main is not None else ""
+
+
+def _series_info_from_titles(
+    sid: int, titles: list[ET.Element], lang: str
+) -> SeriesInfo:
+    """Build series info from <titles> entries, preferring the official title."""
+    series_name = _main_title(titles)
+    official_name = _title_by_lang(
+        (t for t in titles if t.get("type") == "official"), lang
+    )
+    return SeriesInfo(id=sid, name=official_name or series_name)
+
+
+def _title_by_lang(
+    titles: Iterable[ET.Element], lang: str, fallback: str | None = None
+) -> str:
+    """Return the first title whose ``lang`` attribute equals `lang`, or "".
+
+    When that title is missing or empty, the first `fallback`-language title
+    is used instead; both are found in a single pass. Matching in Python
+    rather than in a path predicate keeps arbitrary locale strings from being
+    interpreted as ElementPath syntax.
+    """
+    found: str | None = None
+    alternative: str | None = None
+    for title in titles:
+        code = title.get("lang")
+        if code == lang and found is None:
+            found = (title.text or "").strip()
+            if found or fallback is None:
+                return found
+        elif code == fallback and alternative is None:
+            alternative = (title.text or "").strip()
+    return alternative or ""
+
+
+@lru_cache(maxsize=64)
 def _normalize_language(locale: str) -> str:
     code = (locale or "en").split(".")[0]
-    return {"iw": "he", "in": "id"}.get(code, code)
+    return _LEGACY_LANGUAGE_CODES.get(code, code)
 
 
 def _html_unescape(text: str) -> str:
-    # minimal HTML entity replacement for common cases
-    try:
-        return json.loads('"' + text.replace("\\", r"\\").replace('"', r"\"") + '"')
-    except (
-        json.JSONDecodeError,
-        ValueError,
-    ):  # narrow failures in best-effort unescape
-        return text
+    # Most titles carry no entities; skip the unescape call entirely for them
+    return html.unescape(text) if "&" in text else text
@@ -22,14 +22,25 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import threading
+import zlib
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from filebot.core.providers.cache import disk_cache, shared_cache
+from filebot.core.providers.connection_pool import urlopen
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, MutableMapping
+    from email.message import Message
+
     from filebot.core.models import (
         Artwork,
         Episode,
@@ -38,6 +49,13 @@ if TYPE_CHECKING:
         SeriesInfo,
         SubtitleSearchResult,
     )
+    from filebot.core.providers.cache import DiskCache
+    from filebot.core.providers.utils import RateLimiter
+
+# JSON endpoints are asked for gzip; responses are sniffed and inflated locally
+_JSON_HEADERS = {"Accept-Encoding": "gzip"}
+_GZIP_MAGIC = b"\x1f\x8b"
+_NOT_FOUND_CODES = frozenset({404, 410})
 
 
 @runtime_checkable
@@ -183,9 +201,107 @@ class SubtitleProvider(Datasource, Protocol):
         """Search subtitles by free-form query."""
 
 
+def gunzip_if_needed(raw: bytes) -> bytes:
+    """Return `raw` decompressed if it is a gzip stream, else unchanged.
+
+    ``urllib`` and the connection pool do not undo ``Content-Encoding``, so
+    callers that send ``Accept-Encoding: gzip`` sniff the magic bytes instead.
+
+    Raises
+    ------
+    OSError, EOFError, zlib.error
+        If the body looks like gzip but is corrupt or truncated.
+    """
+    return gzip.decompress(raw) if raw[:2] == _GZIP_MAGIC else raw
+
+
+def _as_frozenset(hosts: Collection[str] | None) -> frozenset[str] | None:
+    return hosts if hosts is None or isinstance(hosts, frozenset) else frozenset(hosts)
+
+
+@lru_cache(maxsize=1024)
+def _url_permitted(
+    url: str, require_https: bool, allowed_http_hosts: frozenset[str] | None
+) -> bool:
+    """Return True if `url` passes the scheme/host policy of the HTTP helpers.
+
+    Memoized so repeated requests to the same URL skip URL parsing entirely.
+    """
+    from filebot.core.providers.utils import is_allowed_http, is_https
+
+    if is_https(url):
+        return True
+    return not require_https and is_allowed_http(url, allowed_http_hosts)
+
+
+_T = TypeVar("_T")
+
+# Requests currently on the wire, keyed by (id(cache), cache key)
+_inflight: dict[tuple[int, str], Future[Any]] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(
+    cache: MutableMapping[Any, Any], key: str, fetch: Callable[[], _T]
+) -> _T:
+    """Run `fetch` once for concurrent callers missing the same cache entry.
+
+    The first caller (the leader) performs the request; callers arriving while
+    it is in flight block on its future and receive the same result, so a
+    burst of identical lookups costs one upstream request.
+
+    Parameters
+    ----------
+    cache:
+        Cache the result will be stored in; scopes the in-flight key.
+    key:
+        Cache key of the request.
+    fetch:
+        Performs the request and stores successful results in `cache`.
+
+    Returns
+    -------
+    _T
+        Result of the leader's `fetch` call.
+    """
+    flight = (id(cache), key)
+    with _inflight_lock:
+        future = _inflight.get(flight)
+        leader = future is None
+        if leader:
+            future = _inflight[flight] = Future()
+    if not leader:
+        return future.result()
+    try:
+        result = fetch()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[flight]
+
+
+class _NoopLimiter:
+    """Stand-in limiter for clients configured without a rate limit."""
+
+    __slots__ = ()
+
+    def acquire(self) -> None:
+        """Return immediately."""
+
+
 class RestClientMixin:
     """Shared REST client helper for JSON GET with caching and rate limiting.
 
+    Requests go through the process-wide keep-alive pool in
+    `connection_pool`, so repeated calls to one API reuse a TLS connection.
+    JSON responses are also written to the on-disk tier when one is set up
+    with `cache.configure_disk_cache`.
+
     Attributes
     ----------
     _cache_short:
@@ -193,9 +309,13 @@ class RestClientMixin:
     _cache_long:
         Long-lived cache (e.g., 1 week) for descriptor endpoints.
     _limiter:
-        Rate limiter to protect external APIs.
+        Rate limiter to protect external APIs; a no-op unless `_init_rest`
+        was given a rate.
     """
 
+    # Class-level default so the hot path needs no getattr or None check
+    _limiter: RateLimiter | _NoopLimiter = _NoopLimiter()
+
     def _http_get_json(
         self,
         url: str,
@@ -205,7 +325,7 @@ class RestClientMixin:
         cache_key: str | None = None,
         long_ttl: bool = False,
         require_https: bool = True,
-        allowed_http_hosts: set[str] | None = None,
+        allowed_http_hosts: Collection[str] | None = None,
     ) -> dict:
         """Perform a GET request and return parsed JSON with cache / rate limit.
 
@@ -231,48 +351,75 @@ class RestClientMixin:
         dict
             Parsed JSON object or empty dict on error.
         """
-        from filebot.core.providers.utils import is_allowed_http, is_https
-
         # Validate scheme
-        if require_https and not is_https(url):
-            return {}
-        if not require_https and not (
-            is_https(url) or is_allowed_http(url, allowed_http_hosts)
-        ):
+        if not _url_permitted(url, require_https, _as_frozenset(allowed_http_hosts)):
             return {}
 
         # Select cache
-        cache = getattr(self, "_cache_long" if long_ttl else "_cache_short")
+        cache = self._cache_long if long_ttl else self._cache_short
         key = cache_key or url
         cached = cache.get(key)
         if cached is not None:
             return cached
+        if url in _not_found:
+            return {}
+        disk = disk_cache()
+        shared_key = f"{type(self).__module__}.{type(self).__qualname__}|{key}"
 
-        # Rate limit before network call
-        limiter = getattr(self, "_limiter", None)
-        if limiter is not None:
-            limiter.acquire()
-
-        # Only allow http(s) via earlier guards
-        req = Request(url, headers=headers or {})  # noqa: S310
-        try:
-            with urlopen(req, timeout=timeout) as resp:  # noqa: S310
-                data = json.loads(resp.read().decode("utf-8"))
+        def fetch() -> dict:
+            # Second tier: a response stored by an earlier process
+            data = _disk_json(disk, shared_key)
+            if data is not None:
                 cache[key] = data
                 return data
-        except (HTTPError, URLError, TimeoutError, json.JSONDecodeError):
-            logging.getLogger(
-                f"{self.__class__.__module__}.{self.__class__.__name__}"
-            ).warning(
-                "http_json_request_failed",
-                extra={
-                    "url": url,
-                    "require_https": require_https,
-                    "long_ttl": long_ttl,
-                },
-                exc_info=True,
-            )
-            return {}
+
+            # Rate limit before network call
+            self._limiter.acquire()
+
+            # Revalidate an expired entry instead of downloading it again
+            stale = _validators.get(shared_key)
+            request_headers = _JSON_HEADERS | (headers or {})
+            if stale is not None:
+                request_headers |= stale[0]
+            # Only allow http(s) via earlier guards
+            req = Request(url, headers=request_headers)  # noqa: S310
+            try:
+                status, resp_headers, wire = _read_response(req, timeout)
+                revalidated = stale is not None and status == 304
+                # A 304 has no body: decode the compressed copy kept with the
+                # validators instead
+                raw = (
+                    gzip.decompress(stale[1]) if revalidated else gunzip_if_needed(wire)
+                )
+                # json.loads detects the encoding of raw bytes itself
+                data = json.loads(raw)
+            except (OSError, EOFError, zlib.error, ValueError) as exc:
+                # OSError covers HTTPError, URLError, timeouts and corrupt gzip;
+                # ValueError covers JSONDecodeError and UnicodeDecodeError
+                _remember_not_found(url, exc)
+                logging.getLogger(
+                    f"{self.__class__.__module__}.{self.__class__.__name__}"
+                ).warning(
+                    "http_json_request_failed",
+                    extra={
+                        "url": url,
+                        "require_https": require_https,
+                        "long_ttl": long_ttl,
+                    },
+                    exc_info=True,
+                )
+                return {}
+            cache[key] = data
+            if revalidated:
+                # Confirmed current: renew the validators too, so an entry that
+                # keeps revalidating never ages out
+                _validators[shared_key] = stale
+            else:
+                _remember_validators(shared_key, resp_headers, wire, raw)
+            _disk_store(disk, shared_key, raw, cache.ttl)
+            return data
+
+        return _single_flight(cache, key, fetch)
 
     def _init_rest(
         self,
@@ -284,6 +431,9 @@ class RestClientMixin:
     ) -> None:
         """Initialize standard caches and optional rate limiter.
 
+        Caches are process-wide and shared by all instances of the concrete
+        provider class; sizes and TTLs apply when a cache is first created.
+
         Parameters
         ----------
         short_ttl:
@@ -297,12 +447,11 @@ class RestClientMixin:
         rate:
             Optional (max_requests, window_seconds) for RateLimiter.
         """
-        from cachetools import TTLCache
-
         from filebot.core.providers.utils import RateLimiter
 
-        self._cache_short = TTLCache(maxsize=maxsize_short, ttl=short_ttl)
-        self._cache_long = TTLCache(maxsize=maxsize_long, ttl=long_ttl)
+        owner = type(self)
+        self._cache_short = shared_cache(owner, "short", maxsize_short, short_ttl)
+        self._cache_long = shared_cache(owner, "long", maxsize_long, long_ttl)
         if rate is not None:
             self._limiter = RateLimiter(max_requests=rate[0], window_seconds=rate[1])
 
@@ -315,44 +464,116 @@ class RestClientMixin:
         cache_key: str | None = None,
         long_ttl: bool = False,
         require_https: bool = True,
-        allowed_http_hosts: set[str] | None = None,
+        allowed_http_hosts: Collection[str] | None = None,
     ) -> bytes | None:
-        """Perform a GET request and return raw bytes with cache / rate limit."""
-        from filebot.core.providers.utils import is_allowed_http, is_https
+        """Perform a GET request and return raw bytes with cache / rate limit.
 
-        if require_https and not is_https(url):
-            return None
-        if not require_https and not (
-            is_https(url) or is_allowed_http(url, allowed_http_hosts)
-        ):
+        Cache hits return the stored `bytes` object itself, never a copy;
+        consumers slice it through `memoryview` or wrap it in `io.BytesIO`,
+        which share the buffer as well.
+        """
+        if not _url_permitted(url, require_https, _as_frozenset(allowed_http_hosts)):
             return None
 
-        cache = getattr(self, "_cache_long" if long_ttl else "_cache_short")
+        cache = self._cache_long if long_ttl else self._cache_short
         key = cache_key or url
         cached = cache.get(key)
         if cached is not None:
             return cached  # type: ignore[return-value]
+        if url in _not_found:
+            return None
 
-        limiter = getattr(self, "_limiter", None)
-        if limiter is not None:
-            limiter.acquire()
+        def fetch() -> bytes | None:
+            self._limiter.acquire()
+
+            req = Request(url, headers=headers or {})  # noqa: S310
+            try:
+                with urlopen(req, timeout=timeout) as resp:
+                    data = resp.read()
+                    cache[key] = data
+                    return data
+            except (HTTPError, URLError, TimeoutError) as exc:
+                _remember_not_found(url, exc)
+                logging.getLogger(
+                    f"{self.__class__.__module__}.{self.__class__.__name__}"
+                ).warning(
+                    "http_bytes_request_failed",
+                    extra={
+                        "url": url,
+                        "require_https": require_https,
+                        "long_ttl": long_ttl,
+                    },
+                    exc_info=True,
+                )
+                return None
+
+        return _single_flight(cache, key, fetch)
+
+
+# URLs the upstream answered 404/410 for, process-wide; short-circuits
+# repeated lookups of known-bad IDs until the entry expires
+_not_found = shared_cache(RestClientMixin, "not_found", maxsize=4096, ttl=60 * 60)
+
+
+# Validators (conditional request headers) and gzip-compressed bodies of JSON
+# responses, kept past the payload TTLs so expired entries can be revalidated
+# with If-None-Match / If-Modified-Since; a 304 skips the download. Only bytes
+# are held here, so decoded payloads are still freed when the caches drop them
+_validators = shared_cache(
+    RestClientMixin, "validators", maxsize=4096, ttl=30 * 24 * 60 * 60
+)
+
+
+def _read_response(req: Request, timeout: int) -> tuple[int, Message, bytes]:
+    """Return status, headers and body of `req`, treating 304 as a response.
+
+    The connection pool returns a 304, but ``urllib`` (used when an
+    environment proxy applies) raises `HTTPError` for it.
+    """
+    try:
+        with urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.headers, resp.read()
+    except HTTPError as exc:
+        if exc.code != 304:
+            raise
+        exc.close()
+        return 304, exc.headers, b""
 
-        req = Request(url, headers=headers or {})  # noqa: S310
-        try:
-            with urlopen(req, timeout=timeout) as resp:  # noqa: S310
-                data = resp.read()
-                cache[key] = data
-                return data
-        except (HTTPError, URLError, TimeoutError):
-            logging.getLogger(
-                f"{self.__class__.__module__}.{self.__class__.__name__}"
-            ).warning(
-                "http_bytes_request_failed",
-                extra={
-                    "url": url,
-                    "require_https": require_https,
-                    "long_ttl": long_ttl,
-                },
-                exc_info=True,
-            )
-            return None
+
+def _remember_validators(key: str, headers: Message, wire: bytes, raw: bytes) -> None:
+    """Store conditional headers from `headers` with a compressed body copy.
+
+    `wire` is the body as received and `raw` its decompressed form; a body
+    that arrived gzip-encoded is kept as is, anything else is compressed.
+    """
+    conditional: dict[str, str] = {}
+    if etag := headers.get("ETag"):
+        conditional["If-None-Match"] = etag
+    if modified := headers.get("Last-Modified"):
+        conditional["If-Modified-Since"] = modified
+    if conditional:
+        body = wire if wire[:2] == _GZIP_MAGIC else gzip.compress(raw, 1)
+        _validators[key] = (conditional, body)
+
+
+def _disk_json(disk: DiskCache | None, key: str) -> Any:
+    """Return the JSON body stored on disk under `key`; None if unavailable."""
+    raw = disk.get(key) if disk is not None else None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _disk_store(disk: DiskCache | None, key: str, raw: bytes, ttl: float) -> None:
+    """Write a raw JSON body through to the disk tier, if one is configured."""
+    if disk is not None:
+        disk.set(key, raw, ttl)
+
+
+def _remember_not_found(url: str, exc: BaseException) -> None:
+    """Record `url` as missing upstream if `exc` is a 404/410 response."""
+    if isinstance(exc, HTTPError) and exc.code in _NOT_FOUND_CODES:
+        _not_found[url] = True
@@ -0,0 +1,297 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Process-wide response caches shared by provider clients.
+
+Every client of the same provider class reuses one pair of caches, so a UI
+panel and a background worker talking to the same service share hits instead
+of each warming a private cache. An optional on-disk tier (`DiskCache`) keeps
+JSON responses across restarts.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+_MISSING = object()
+_LOGGER = logging.getLogger(__name__)
+
+
+class ExpiringLRUCache(MutableMapping[Any, Any]):
+    """Thread-safe LRU cache whose entries expire `ttl` seconds after insert.
+
+    Values are stored as ``(expires_at, value)`` pairs and expiry is checked
+    only on lookup, so a hit costs one dict access and one comparison rather
+    than `TTLCache`'s per-access sweep of its expiry list. Expired entries are
+    dropped lazily when read or evicted in LRU order.
+
+    Hits never take the lock: ``OrderedDict`` reads and ``move_to_end`` are
+    atomic, so concurrent readers do not serialize. Only writes and removal
+    of expired entries are locked.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of entries.
+    ttl:
+        Time-to-live of each entry in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = int(maxsize)
+        self.ttl = float(ttl)
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Any) -> Any:
+        data = self._data
+        entry = data.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] > time.monotonic():
+            # KeyError: evicted concurrently; the value read is still valid
+            with contextlib.suppress(KeyError):
+                data.move_to_end(key)
+            return entry[1]
+        with self._lock:
+            # Another thread may have replaced the entry since it was read
+            if data.get(key) is entry:
+                del data[key]
+        return _MISSING
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if `key` is cached and not expired."""
+        return self._lookup(key) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the cached value for `key`."""
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Store `value` under `key`, evicting the least recently used entry."""
+        with self._lock:
+            data = self._data
+            data[key] = (time.monotonic() + self.ttl, value)
+            data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def __delitem__(self, key: Any) -> None:
+        """Remove `key` from the cache."""
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over a snapshot of the cached keys."""
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        """Return the number of stored entries; expired ones count until read."""
+        return len(self._data)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for `key` or `default`."""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+_shared_caches: dict[tuple[str, str], ExpiringLRUCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(owner: type, name: str, maxsize: int, ttl: float) -> ExpiringLRUCache:
+    """Return the process-wide cache `name` for provider class `owner`.
+
+    Parameters
+    ----------
+    owner:
+        Provider class; each class gets its own namespace.
+    name:
+        Cache role within the provider (e.g., "short", "long").
+    maxsize:
+        Maximum entries, used only when the cache is first created.
+    ttl:
+        Time-to-live in seconds, used only when the cache is first created.
+
+    Returns
+    -------
+    ExpiringLRUCache
+        Cache shared by all instances of `owner`.
+    """
+    key = (f"{owner.__module__}.{owner.__qualname__}", name)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = ExpiringLRUCache(maxsize=maxsize, ttl=ttl)
+        return cache
+
+
+def clear_shared_caches() -> None:
+    """Empty every shared provider cache (e.g., after a config reload)."""
+    with _shared_lock:
+        caches = list(_shared_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+class DiskCache:
+    """SQLite-backed byte cache that survives process restarts.
+
+    Used as a second tier behind the in-memory caches: a miss in memory
+    checks disk before going to the network, and a hit is promoted back into
+    memory. Expiry uses wall-clock time because entries outlive the process.
+    Database errors are swallowed so a damaged cache file degrades to misses.
+    Keys are stored as SHA-256 digests, so request URLs carrying API keys are
+    never written to the file in plain text.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file; parent directories are created as needed.
+
+    Raises
+    ------
+    OSError
+        If the parent directory cannot be created.
+    sqlite3.Error
+        If the file cannot be opened as a database (e.g., it is corrupt).
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, value BLOB NOT NULL)"
+            )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored bytes for `key`, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires, value FROM entries WHERE key = ?",
+                    (_digest(key),),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] <= time.time():
+            return None
+        return row[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+        with contextlib.suppress(sqlite3.Error), self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (_digest(key), time.time() + ttl, value),
+            )
+
+    def prune(self) -> None:
+        """Delete expired entries."""
+        with contextlib.suppress(sqlite3.Error), self._lock:
+            self._conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with contextlib.suppress(sqlite3.Error), self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _digest(key: str) -> str:
+    """Return the on-disk form of `key`."""
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+_disk_cache: DiskCache | None = None
+
+
+def configure_disk_cache(path: str | os.PathLike[str] | None) -> DiskCache | None:
+    """Enable the process-wide on-disk response tier at `path`, or disable it.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file, or None to turn the disk tier off.
+
+    Returns
+    -------
+    DiskCache | None
+        The active disk cache, if any. None as well when `path` cannot be
+        opened (unwritable directory, corrupt file); the failure is logged and
+        the disk tier stays off rather than failing startup.
+    """
+    global _disk_cache
+    cache = None
+    if path is not None:
+        try:
+            cache = DiskCache(path)
+        except (OSError, sqlite3.Error):
+            _LOGGER.warning(
+                "disk_cache_unavailable", extra={"path": str(path)}, exc_info=True
+            )
+    with _shared_lock:
+        previous, _disk_cache = _disk_cache, cache
+    if previous is not None:
+        previous.close()
+    if cache is not None:
+        cache.prune()
+    return cache
+
+
+def disk_cache() -> DiskCache | None:
+    """Return the process-wide on-disk response tier, if configured."""
+    return _disk_cache
@@ -0,0 +1,296 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Keep-alive HTTP connection pool for provider clients.
+
+`urllib.request.urlopen` opens a fresh TCP (and TLS) connection per call and
+always sends ``Connection: close``. This module offers a drop-in `urlopen`
+that reuses persistent ``http.client`` connections per (scheme, host, port),
+so repeated calls to the same API only pay the handshake once. Requests that
+the environment routes through a proxy (``HTTP(S)_PROXY``/``NO_PROXY``) are
+handed to a standard ``urllib`` opener unchanged.
+"""
+
+from __future__ import annotations
+
+import atexit
+import http.client
+import io
+import ssl
+import sys
+import threading
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, build_opener, getproxies, proxy_bypass
+
+if TYPE_CHECKING:
+    from email.message import Message
+    from types import TracebackType
+    from typing import Self
+
+_DEFAULT_USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+_PoolKey = tuple[str, str]
+
+
+def _uses_proxy(url: str) -> bool:
+    """Return True if ``urllib`` would send `url` through a configured proxy."""
+    parts = urlsplit(url)
+    if parts.scheme not in {"http", "https"} or parts.scheme not in getproxies():
+        return False
+    return not proxy_bypass(parts.hostname or "")
+
+
+class PooledResponse:
+    """Response wrapper returning its connection to the pool on close.
+
+    Mirrors the subset of the ``urlopen`` response API used by providers:
+    ``read()``, ``status``, ``headers`` and context-manager support.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+        url: str,
+    ) -> None:
+        self._pool = pool
+        self._key = key
+        self._conn: http.client.HTTPConnection | None = conn
+        self._resp = resp
+        self.url = url
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers: Message = resp.headers
+
+    def read(self) -> bytes:
+        """Read and return the full response body."""
+        return self._resp.read()
+
+    def close(self) -> None:
+        """Release the underlying connection.
+
+        The connection goes back to the pool only when the body has been fully
+        consumed and the server did not ask to close it.
+        """
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._resp.isclosed() and not self._resp.will_close:
+            self._pool.release(self._key, conn)
+        else:
+            self._resp.close()
+            conn.close()
+
+    def __enter__(self) -> Self:
+        """Return self for use in ``with`` blocks."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the connection on block exit."""
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle keep-alive connections keyed by origin.
+
+    Parameters
+    ----------
+    max_idle_per_host:
+        Maximum number of idle connections retained per origin.
+
+    Notes
+    -----
+    Connections are checked out exclusively, so concurrent callers never share
+    a socket. Requests the environment proxy settings apply to bypass the pool
+    and go through a standard ``urllib`` opener, which handles proxy tunnelling.
+    """
+
+    def __init__(self, max_idle_per_host: int = 4) -> None:
+        self._max_idle = int(max_idle_per_host)
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    def urlopen(
+        self, req: Request | str, timeout: float = 15
+    ) -> PooledResponse | http.client.HTTPResponse:
+        """Send a request over a pooled connection.
+
+        Parameters
+        ----------
+        req:
+            ``urllib.request.Request`` or URL string.
+        timeout:
+            Socket timeout in seconds.
+
+        Returns
+        -------
+        PooledResponse | http.client.HTTPResponse
+            Response whose connection returns to the pool when closed; a plain
+            ``urllib`` response when the request goes through a proxy.
+
+        Raises
+        ------
+        HTTPError
+            For HTTP status codes >= 400.
+        URLError
+            For connection-level failures or unsupported schemes.
+        """
+        if isinstance(req, str):
+            req = Request(req)  # noqa: S310 - scheme validated below
+        if _uses_proxy(req.full_url):
+            # A fresh opener reads the proxy settings now, as _uses_proxy did;
+            # urllib.request.urlopen would reuse the ones from its first call
+            return build_opener().open(req, timeout=timeout)
+        method = req.get_method()
+        body = req.data if isinstance(req.data, bytes) else None
+        headers = dict(req.header_items())
+        headers.setdefault("User-Agent", _DEFAULT_USER_AGENT)
+        url = req.full_url
+        for _ in range(_MAX_REDIRECTS + 1):
+            response = self._send(url, method, body, headers, timeout)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_CODES or not location:
+                break
+            target = urljoin(url, location)
+            if url.startswith("https:") and not target.startswith("https:"):
+                break  # never downgrade to plain HTTP
+            response.read()
+            response.close()
+            url = target
+            if response.status == 303:
+                method, body = "GET", None
+        if response.status >= 400:
+            # Drain so the connection can be reused; hand the body to the error
+            payload = response.read()
+            response.close()
+            raise HTTPError(
+                url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(payload),
+            )
+        return response
+
+    def release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        """Return an idle connection to the pool, closing it if full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        """Close and drop all idle connections."""
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+    def _send(
+        self,
+        url: str,
+        method: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> PooledResponse:
+        req = Request(url)  # noqa: S310 - scheme validated below
+        scheme = req.type
+        if scheme not in {"http", "https"}:
+            msg = f"unsupported URL scheme: {scheme}"
+            raise URLError(msg)
+        key = (scheme, req.host)
+        conn, reused = self._acquire(key, timeout)
+        try:
+            try:
+                conn.request(method, req.selector, body=body, headers=headers)
+                resp = conn.getresponse()
+            except ConnectionError:
+                if not reused:
+                    raise
+                # Idle keep-alive socket was closed by the server; retry once
+                conn.close()
+                conn, _ = self._acquire(key, timeout, fresh=True)
+                conn.request(method, req.selector, body=body, headers=headers)
+                resp = conn.getresponse()
+        except TimeoutError:
+            conn.close()
+            raise
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise URLError(exc) from exc
+        return PooledResponse(self, key, conn, resp, url)
+
+    def _acquire(
+        self, key: _PoolKey, timeout: float, *, fresh: bool = False
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+            if conn is not None:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            conn = http.client.HTTPSConnection(
+                host, timeout=timeout, context=self._ssl_context
+            )
+        else:
+            conn = http.client.HTTPConnection(host, timeout=timeout)
+        return conn, False
+
+
+# Process-wide pool shared by all provider clients. Sized to the widest
+# per-host fan-out (TheTVDB page and TMDb season workers) so a burst of
+# concurrent requests leaves its connections reusable for the next one
+default_pool = ConnectionPool(max_idle_per_host=8)
+# Close idle sockets cleanly instead of leaving them to interpreter teardown
+atexit.register(default_pool.clear)
+
+
+def urlopen(
+    req: Request | str, timeout: float = 15
+) -> PooledResponse | http.client.HTTPResponse:
+    """Open a URL using the process-wide keep-alive pool.
+
+    Drop-in replacement for ``urllib.request.urlopen`` for simple GET/POST
+    requests; see `ConnectionPool.urlopen`.
+    """
+    return default_pool.urlopen(req, timeout=timeout)
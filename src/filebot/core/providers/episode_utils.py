@@ -26,6 +26,8 @@ This module provides helpers similar to Java's EpisodeUtilities.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from filebot.core.models import Episode, MultiEpisode
@@ -33,6 +35,9 @@ from filebot.core.models import Episode, MultiEpisode
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
 
+# Fetches all four numbering fields in one C-level call
+_episode_numbers = attrgetter("season", "episode", "special_number", "absolute")
+
 
 def create_episode(episodes: Sequence[Episode]) -> Episode | MultiEpisode:
     """Return a single Episode or a MultiEpisode grouping.
@@ -80,16 +85,37 @@ def episode_numbers_key(e: Episode) -> tuple[int, int, int, int]:
         Tuple of (season, episode, special, absolute) with missing values
         normalized to zero for stable ordering.
     """
-    season = e.season if e.season is not None else 0
-    episode = e.episode if e.episode is not None else 0
-    special = e.special_number if e.special_number is not None else 0
-    absolute = e.absolute if e.absolute is not None else 0
-    return (season, episode, special, absolute)
+    season, episode, special, absolute = _episode_numbers(e)
+    # `or 0` maps None (and 0) to 0 in one truth test per field
+    return (season or 0, episode or 0, special or 0, absolute or 0)
+
+
+def build_absolute_index(candidates: Iterable[Episode]) -> dict[int, Episode | None]:
+    """Index regular episodes by absolute number for repeated matching.
+
+    Parameters
+    ----------
+    candidates:
+        Episodes from the provider being matched against.
+
+    Returns
+    -------
+    dict[int, Episode | None]
+        Map of absolute number to episode. Specials and episodes without an
+        absolute number are skipped; numbers shared by several candidates map
+        to None because they cannot be matched unambiguously.
+    """
+    index: dict[int, Episode | None] = {}
+    for e in candidates:
+        if e.special_number is not None or e.absolute is None:
+            continue
+        index[e.absolute] = None if e.absolute in index else e
+    return index
 
 
 def match_by_absolute(
     source: Episode | MultiEpisode,
-    candidates: Iterable[Episode],
+    candidates: Iterable[Episode] | Mapping[int, Episode | None],
 ) -> Episode | MultiEpisode | None:
     """Match episodes by absolute numbering across providers.
 
@@ -98,7 +124,8 @@ def match_by_absolute(
     source:
         Episode or MultiEpisode with absolute numbers populated.
     candidates:
-        Iterable of episodes from another provider to match.
+        Episodes from another provider, or an index prebuilt with
+        `build_absolute_index` when matching many sources.
 
     Returns
     -------
@@ -110,12 +137,48 @@ def match_by_absolute(
     if not abs_set or len(abs_set) != len(parts):
         return None
 
-    found: list[Episode] = [
-        e for e in candidates if e.special_number is None and e.absolute in abs_set
-    ]
-
-    if len(found) != len(parts):
-        return None
+    if isinstance(candidates, Mapping):
+        index = candidates
+    else:
+        # One-off match: screen the pool by set membership and index only the
+        # wanted numbers rather than copying every candidate into a dict
+        index = build_absolute_index(e for e in candidates if e.absolute in abs_set)
+    found: list[Episode] = []
+    for a in abs_set:
+        e = index.get(a)
+        if e is None:
+            return None
+        found.append(e)
 
     found.sort(key=episode_numbers_key)
     return create_episode(found)
+
+
+def match_many_by_absolute(
+    sources: Iterable[Episode | MultiEpisode],
+    candidates: Iterable[Episode],
+) -> list[Episode | MultiEpisode | None]:
+    """Match several sources against one candidate list.
+
+    The absolute-number index is built once, restricted to numbers the
+    sources use, so each source costs one lookup per part instead of a scan
+    over all candidates.
+
+    Parameters
+    ----------
+    sources:
+        Episodes or MultiEpisodes with absolute numbers populated.
+    candidates:
+        Episodes from another provider to match.
+
+    Returns
+    -------
+    list[Episode | MultiEpisode | None]
+        Match for each source in input order.
+    """
+    sources = list(sources)
+    # Index only numbers some source asks for; the rest of the pool is
+    # rejected by a set membership test
+    wanted = {e.absolute for src in sources for e in get_multi_episode_list(src)}
+    index = build_absolute_index(e for e in candidates if e.absolute in wanted)
+    return [match_by_absolute(src, index) for src in sources]
@@ -4,18 +4,20 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from filebot.core.models import Artwork
 from filebot.core.providers.base import ArtworkProvider, BaseDatasource, RestClientMixin
-from filebot.core.providers.utils import is_https
 
 # FanartTV API URLs
 _FANARTTV_BASE_URL = "https://webservice.fanart.tv/v3/"
 
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from collections.abc import Sequence
+
+    from filebot.core.providers.cache import ExpiringLRUCache
 
 
 @dataclass(slots=True)
@@ -29,7 +31,8 @@ class FanartTVClient(BaseDatasource, RestClientMixin, ArtworkProvider):
     """
 
     apikey: str
-    _cache_week: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize cache for FanartTV client."""
@@ -43,43 +46,88 @@ class FanartTVClient(BaseDatasource, RestClientMixin, ArtworkProvider):
 
     def get_artwork(self, media_id: int, category: str, locale: str) -> list[Artwork]:
         """Return artwork items for a given media identifier and category."""
+        # Scheme is enforced by require_https in _http_get_json
         url = f"{_FANARTTV_BASE_URL}{category}/{media_id}?api_key={self.apikey}"
-        if not is_https(url):
-            return []
-
         data = self._http_get_json(url, timeout=15, long_ttl=True, require_https=True)
         if not isinstance(data, dict):
             return []
 
-        artworks: list[Artwork] = []
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if not isinstance(value, list):
-                    continue
-                for it in value:
-                    if not isinstance(it, dict):
-                        continue
-                    url_val = it.get("url")
-                    lang = it.get("lang") or None
-                    likes = it.get("likes")
-                    season = it.get("season")
-                    disc_type = it.get("disc_type")
-                    try:
-                        rating = (
-                            float(likes)
-                            if isinstance(likes, (int, float, str))
-                            else None
-                        )
-                    except ValueError:
-                        rating = None
-                    category_name = ",".join([p for p in [key, season, disc_type] if p])
-                    if isinstance(url_val, str) and url_val:
-                        artworks.append(
-                            Artwork(
-                                category=category_name or key,
-                                url=url_val,
-                                language=lang,
-                                rating=rating,
-                            )
-                        )
-        return artworks
+        # One pass over the payload; categories are lists of artwork dicts
+        return [
+            Artwork(
+                category=",".join([
+                    p for p in (key, it.get("season"), it.get("disc_type")) if p
+                ])
+                or key,
+                url=url_val,
+                language=it.get("lang") or None,
+                rating=_to_float(it.get("likes")),
+            )
+            for key, value in data.items()
+            if isinstance(value, list)
+            for it in value
+            if isinstance(it, dict)
+            and isinstance(url_val := it.get("url"), str)
+            and url_val
+        ]
+
+    def get_artwork_batch(
+        self,
+        media_ids: Sequence[int],
+        category: str,
+        locale: str,
+        max_workers: int = 8,
+    ) -> dict[int, list[Artwork]]:
+        """Fetch artwork for several media ids concurrently.
+
+        FanartTV has no multi-get endpoint, so the per-id requests run on a
+        thread pool; wall time approaches one round-trip instead of one per id.
+
+        Parameters
+        ----------
+        media_ids:
+            Media identifiers; duplicates are fetched once.
+        category:
+            Media category path segment (e.g., "movies", "tv").
+        locale:
+            Preferred language.
+        max_workers:
+            Maximum number of requests in flight.
+
+        Returns
+        -------
+        dict[int, list[Artwork]]
+            Artwork per media id, in first-seen input order.
+        """
+        unique = list(dict.fromkeys(media_ids))
+        if not unique:
+            return {}
+        workers = max(1, min(max_workers, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda media_id: self.get_artwork(media_id, category, locale), unique
+            )
+            return dict(zip(unique, results, strict=True))
+
+
+def _to_float(value: object) -> float | None:
+    """Return `value` as a float, or None when it is not numeric.
+
+    Parameters
+    ----------
+    value:
+        Raw ``likes`` field, usually a numeric string.
+
+    Returns
+    -------
+    float | None
+        Parsed rating.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
@@ -19,9 +20,11 @@ from filebot.core.providers.base import (
 # OMDb API URLs
 _OMDB_BASE_URL = "https://www.omdbapi.com/"
 
-if TYPE_CHECKING:
-    from cachetools import TTLCache
+# Trailing release year in free-form queries, e.g. "Serenity 2005"
+_YEAR_RE = re.compile(r"(.+?)\s+(19\d{2}|20\d{2})$")
 
+if TYPE_CHECKING:
+    from filebot.core.providers.cache import ExpiringLRUCache
     from filebot.core.providers.utils import RateLimiter
 
 
@@ -36,15 +39,16 @@ class OMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
     """
 
     apikey: str
-    _cache_short: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
     _limiter: RateLimiter = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize cache and rate limiter for OMDb client."""
-        # OMDb results change, but daily cache is fine for most workflows
+        # Searches (s=) go stale within hours; title lookups (i=) barely change
         self._init_rest(
-            short_ttl=24 * 60 * 60,
-            long_ttl=24 * 60 * 60,
+            short_ttl=4 * 60 * 60,
+            long_ttl=7 * 24 * 60 * 60,
             maxsize_short=4096,
             maxsize_long=4096,
             rate=(2, 1),
@@ -64,24 +68,20 @@ class OMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
         data = self._request(params)
         out: list[Movie] = []
         for it in data.get("Search") or []:
-            try:
-                if (it.get("Type") or "").lower() != "movie":
-                    continue
-                title = it.get("Title") or ""
-                year_str = it.get("Year") or ""
-                imdbid = (it.get("imdbID") or "").replace("tt", "")
-                out.append(
-                    Movie(
-                        name=title,
-                        alias_names=[],
-                        year=int(year_str) if year_str.isdigit() else None,
-                        imdb_id=int(imdbid) if imdbid.isdigit() else None,
-                        tmdb_id=None,
-                        language=None,
-                    )
-                )
-            except (TypeError, ValueError):
+            if not isinstance(it, dict) or _str_field(it, "Type").lower() != "movie":
                 continue
+            year_str = _str_field(it, "Year")
+            imdbid = _str_field(it, "imdbID").replace("tt", "")
+            out.append(
+                Movie(
+                    name=_str_field(it, "Title"),
+                    alias_names=(),
+                    year=int(year_str) if year_str.isdigit() else None,
+                    imdb_id=int(imdbid) if imdbid.isdigit() else None,
+                    tmdb_id=None,
+                    language=None,
+                )
+            )
         return out
 
     def get_movie_descriptor(self, movie: Movie, locale: str) -> Movie | None:
@@ -89,14 +89,14 @@ class OMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
         if not movie.imdb_id:
             return None
         params = {"i": f"tt{movie.imdb_id:07d}", "apikey": self.apikey}
-        data = self._request(params)
+        data = self._request(params, long_ttl=True)
         if (data.get("Response") or "").lower() != "true":
             return None
         title = (data.get("Title") or "").strip()
         year_str = data.get("Year") or ""
         return Movie(
             name=title,
-            alias_names=[],
+            alias_names=(),
             year=int(year_str)
             if isinstance(year_str, str) and year_str.isdigit()
             else movie.year,
@@ -105,16 +105,28 @@ class OMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
             language=locale or None,
         )
 
-    def _request(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _request(
+        self, params: dict[str, Any], *, long_ttl: bool = False
+    ) -> dict[str, Any]:
         url = _OMDB_BASE_URL + "?" + urlencode(params)
-        return self._http_get_json(url, timeout=15, long_ttl=False, require_https=True)
+        return self._http_get_json(
+            url, timeout=15, long_ttl=long_ttl, require_https=True
+        )
+
+
+def _str_field(item: dict[str, Any], key: str) -> str:
+    """Return ``item[key]`` if it is a string, else an empty string."""
+    value = item.get(key)
+    return value if isinstance(value, str) else ""
 
 
+@lru_cache(maxsize=2048)
 def _split_name_year(query: str) -> tuple[str, int | None]:
-    m = re.match(r"(.+?)\s+(19\d{2}|20\d{2})$", query.strip())
+    query = query.strip()
+    if not query[-4:].isdigit():
+        # No trailing year; skip the regex for the common case
+        return query, None
+    m = _YEAR_RE.match(query)
     if m:
-        try:
-            return m.group(1).strip(), int(m.group(2))
-        except ValueError:
-            return query.strip(), None
-    return query.strip(), None
+        return m.group(1).strip(), int(m.group(2))
+    return query, None
@@ -10,6 +10,7 @@ future phases.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
@@ -19,7 +20,11 @@ from filebot.core.providers.base import (
     RestClientMixin,
     SubtitleProvider,
 )
-from filebot.core.providers.utils import RateLimiter, compute_opensubtitles_hash
+from filebot.core.providers.utils import (
+    RateLimiter,
+    compute_opensubtitles_hash,
+    parse_int,
+)
 
 # OpenSubtitles API URLs
 _OPENSUBTITLES_BASE_URL = "https://rest.opensubtitles.org"
@@ -28,8 +33,18 @@ _OPENSUBTITLES_HASH_URL = (
     f"{_OPENSUBTITLES_BASE_URL}/search/moviebytesize-{{size}}/moviehash-{{hash}}"
 )
 
+# Result fields read per item, fetched in one C-level call
+_RESULT_FIELDS = (
+    "SubFileName",
+    "SubLanguageID",
+    "IDMovieImdb",
+    "ZipDownloadLink",
+    "SubDownloadLink",
+)
+_get_result_fields = itemgetter(*_RESULT_FIELDS)
+
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from filebot.core.providers.cache import ExpiringLRUCache
 
 
 @dataclass(slots=True)
@@ -38,8 +53,8 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
 
     app_name: str
     app_version: str
-    _cache_short: TTLCache = field(init=False, repr=False)
-    _cache_long: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
     _limiter: RateLimiter = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
@@ -51,13 +66,17 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
         """Return the OpenSubtitles provider identifier."""
         return "OpenSubtitles"
 
-    def search(self, query: str) -> list[SubtitleSearchResult]:
+    def search(
+        self, query: str, *, limit: int | None = None
+    ) -> list[SubtitleSearchResult]:
         """Search subtitles by free-form tag using the REST API.
 
         Parameters
         ----------
         query:
             Free-form tag (typically file name without extension).
+        limit:
+            Maximum number of results to build; None for all.
 
         Returns
         -------
@@ -85,32 +104,10 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
         if not isinstance(data, list):
             return []
 
-        results: list[SubtitleSearchResult] = []
-        for it in data:
-            if not isinstance(it, dict):
-                continue
-            name = (it.get("SubFileName") or "").strip()
-            lang = it.get("SubLanguageID") or None
-            imdb_raw = it.get("IDMovieImdb")
-            imdb_id = None
-            if isinstance(imdb_raw, (int, str)) and str(imdb_raw).isdigit():
-                imdb_id = int(imdb_raw)
-            url_dl = it.get("ZipDownloadLink") or it.get("SubDownloadLink") or None
-            score = None
-            sr = SubtitleSearchResult(
-                name=name or query,
-                lang=lang,
-                imdb_id=imdb_id,
-                tmdb_id=None,
-                score=score,
-                url=url_dl,
-            )
-            results.append(sr)
-
-        return results
+        return _parse_results(data, query, limit)
 
     def search_by_hash(
-        self, file_path: str, locale: str | None = None
+        self, file_path: str, locale: str | None = None, *, limit: int | None = None
     ) -> list[SubtitleSearchResult]:
         """Search subtitles by OpenSubtitles movie hash.
 
@@ -120,6 +117,8 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
             Absolute path to the target video file.
         locale:
             Optional language code; when provided, may bias results.
+        limit:
+            Maximum number of results to build; None for all.
         """
         if not file_path:
             return []
@@ -135,31 +134,15 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
         )
         if not isinstance(data, list):
             return []
-        out: list[SubtitleSearchResult] = []
-        for it in data:
-            if not isinstance(it, dict):
-                continue
-            name = (it.get("SubFileName") or "").strip()
-            lang = it.get("SubLanguageID") or None
-            imdb_raw = it.get("IDMovieImdb")
-            imdb_id = None
-            if isinstance(imdb_raw, (int, str)) and str(imdb_raw).isdigit():
-                imdb_id = int(imdb_raw)
-            url_dl = it.get("ZipDownloadLink") or it.get("SubDownloadLink") or None
-            out.append(
-                SubtitleSearchResult(
-                    name=name or file_path,
-                    lang=lang,
-                    imdb_id=imdb_id,
-                    tmdb_id=None,
-                    score=None,
-                    url=url_dl,
-                )
-            )
-        return out
+        return _parse_results(data, file_path, limit)
 
     def search_best(
-        self, file_path: str, tag: str | None = None, locale: str | None = None
+        self,
+        file_path: str,
+        tag: str | None = None,
+        locale: str | None = None,
+        *,
+        limit: int | None = None,
     ) -> list[SubtitleSearchResult]:
         """Search by hash first, then fall back to tag-based search.
 
@@ -171,6 +154,8 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
             Optional tag to use for fallback (defaults to file stem).
         locale:
             Optional language code; currently not used by REST API filter.
+        limit:
+            Maximum number of results to build; None for all.
 
         Returns
         -------
@@ -180,7 +165,7 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
         if not file_path:
             return []
 
-        by_hash = self.search_by_hash(file_path, locale=locale)
+        by_hash = self.search_by_hash(file_path, locale=locale, limit=limit)
         if by_hash:
             return by_hash
 
@@ -190,4 +175,54 @@ class OpenSubtitlesClient(BaseDatasource, RestClientMixin, SubtitleProvider):
             tag = Path(file_path).stem
         if not tag:
             return []
-        return self.search(tag)
+        return self.search(tag, limit=limit)
+
+
+def _parse_results(
+    data: list[Any], fallback_name: str, limit: int | None = None
+) -> list[SubtitleSearchResult]:
+    """Convert REST search items into subtitle results.
+
+    Parameters
+    ----------
+    data:
+        Decoded JSON list returned by a search endpoint.
+    fallback_name:
+        Name used for items without a subtitle file name.
+    limit:
+        Stop after this many results; None for all.
+
+    Returns
+    -------
+    list[SubtitleSearchResult]
+        One result per dict item, in response order.
+    """
+    results: list[SubtitleSearchResult] = []
+    for it in data:
+        if limit is not None and len(results) >= limit:
+            break
+        if not isinstance(it, dict):
+            continue
+        try:
+            name, lang, imdb_raw, zip_dl, sub_dl = _get_result_fields(it)
+        except KeyError:
+            # Sparse item; fall back to per-key lookups
+            name, lang, imdb_raw, zip_dl, sub_dl = map(it.get, _RESULT_FIELDS)
+        name = name.strip() if isinstance(name, str) else ""
+        results.append(
+            SubtitleSearchResult(
+                name=name or fallback_name,
+                lang=lang or None,
+                imdb_id=_parse_imdb_id(imdb_raw),
+                tmdb_id=None,
+                score=None,
+                url=zip_dl or sub_dl or None,
+            )
+        )
+    return results
+
+
+def _parse_imdb_id(raw: object) -> int | None:
+    """Return a non-negative IMDb id from an int or decimal string, else None."""
+    value = parse_int(raw)
+    return value if value is not None and value >= 0 else None
@@ -23,7 +23,9 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
@@ -33,13 +35,18 @@ from filebot.core.providers.base import (
     MovieIdentificationService,
     RestClientMixin,
 )
+from filebot.core.providers.utils import parse_int
 
 # TMDb API URLs
 _TMDB_BASE_URL = "https://api.themoviedb.org/3/"
 
+# Trailing release year in free-form queries, e.g. "Serenity (2005)"
+_YEAR_RE = re.compile(r"(.+?)\s*\(?((?:19|20)\d{2})\)?$")
+
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from collections.abc import Sequence
 
+    from filebot.core.providers.cache import ExpiringLRUCache
     from filebot.core.providers.utils import RateLimiter
 
 
@@ -54,14 +61,18 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
     """
 
     apikey: str
-    _cache_short: TTLCache = field(init=False, repr=False)
-    _cache_long: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
     _limiter: RateLimiter = field(init=False, repr=False)
+    _api_key_query: str = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize caches and rate limiter for TMDb client."""
+        # Constant leading query component, encoded once
+        self._api_key_query = urlencode({"api_key": self.apikey})
+        # Search results shift as titles trend; details are near-static
         self._init_rest(
-            short_ttl=24 * 60 * 60,
+            short_ttl=4 * 60 * 60,
             long_ttl=7 * 24 * 60 * 60,
             rate=(35, 10),
         )
@@ -103,24 +114,23 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
 
         movies: list[Movie] = []
         for it in results:
-            try:
-                tmdb_id = int(it["id"])  # KeyError/ValueError handled below
-                title = it.get("title") or it.get("original_title") or ""
-                release_date = it.get("release_date") or ""
-                year = int(release_date[:4]) if len(release_date) >= 4 else None
-                movies.append(
-                    Movie(
-                        name=title,
-                        alias_names=[],
-                        year=year,
-                        imdb_id=None,
-                        tmdb_id=tmdb_id,
-                        language=locale,
-                    )
-                )
-            except (KeyError, ValueError, TypeError):
+            if not isinstance(it, dict):
+                continue
+            tmdb_id = parse_int(it.get("id"))
+            if tmdb_id is None:
                 # Skip malformed entries from API
                 continue
+            title = it.get("title") or it.get("original_title") or ""
+            movies.append(
+                Movie(
+                    name=title,
+                    alias_names=(),
+                    year=_release_year(it.get("release_date")),
+                    imdb_id=None,
+                    tmdb_id=tmdb_id,
+                    language=locale,
+                )
+            )
         return movies
 
     def get_movie_descriptor(self, movie: Movie, locale: str) -> Movie | None:
@@ -148,12 +158,8 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
                 locale,
             )
             matches = data.get("movie_results") or []
-            if matches:
-                with_id = matches[0]
-                try:
-                    tmdb_id = int(with_id["id"])  # type: ignore[assignment]
-                except (KeyError, ValueError, TypeError):
-                    tmdb_id = None
+            if matches and isinstance(matches[0], dict):
+                tmdb_id = parse_int(matches[0].get("id"))
 
         if tmdb_id is None:
             return None
@@ -167,14 +173,14 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
             if (
                 isinstance(imdb_code, str)
                 and imdb_code.startswith("tt")
-                and imdb_code[2:].isdigit()
+                and imdb_code[2:].isdecimal()
             ):
                 imdb_id_val = int(imdb_code[2:])
             else:
                 imdb_id_val = movie.imdb_id
             return Movie(
                 name=title,
-                alias_names=[],
+                alias_names=(),
                 year=year,
                 imdb_id=imdb_id_val,
                 tmdb_id=tmdb_id,
@@ -183,6 +189,37 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
         except (ValueError, TypeError, AttributeError, KeyError):
             return None
 
+    def get_movie_descriptors(
+        self, movies: Sequence[Movie], locale: str, max_workers: int = 8
+    ) -> list[Movie | None]:
+        """Resolve several movie descriptors concurrently.
+
+        Each descriptor may need two dependent requests (IMDb lookup, then
+        details); running movies in parallel overlaps those round-trips
+        while the shared rate limiter still caps request throughput.
+
+        Parameters
+        ----------
+        movies:
+            Movies with `tmdb_id` or `imdb_id` populated.
+        locale:
+            Preferred language.
+        max_workers:
+            Maximum number of movies resolved at once.
+
+        Returns
+        -------
+        list[Movie | None]
+            Descriptors in input order; None where a movie was not found.
+        """
+        if not movies:
+            return []
+        workers = max(1, min(max_workers, len(movies)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda m: self.get_movie_descriptor(m, locale), movies)
+            )
+
     # --- Internal helpers ---
     def _request_json(
         self, path: str, params: dict[str, Any], locale: str
@@ -203,12 +240,9 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
         dict[str, Any]
             Parsed JSON; empty dict on HTTP errors.
         """
-        base = _TMDB_BASE_URL
-        query = {"api_key": self.apikey}
-        if locale:
-            query["language"] = _normalize_language(locale)
-        query.update(params)
-        url = base + path + "?" + urlencode(query)
+        url = f"{_TMDB_BASE_URL}{path}?{self._api_key_query}{_language_query(locale)}"
+        if params:
+            url += "&" + urlencode(params)
 
         return self._http_get_json(
             url,
@@ -218,6 +252,7 @@ class TMDbClient(BaseDatasource, RestClientMixin, MovieIdentificationService):
         )
 
 
+@lru_cache(maxsize=2048)
 def _split_name_and_year(query: str) -> tuple[str, int | None]:
     """Split free-form movie query into name and year if present.
 
@@ -231,16 +266,32 @@ def _split_name_and_year(query: str) -> tuple[str, int | None]:
     tuple[str, int | None]
         Name and optional year.
     """
-    m = re.match(r"(.+?)\s*\(?((?:19|20)\d{2})\)?$", query.strip())
+    query = query.strip()
+    if not query.rstrip(")")[-4:].isdigit():
+        # No trailing year; skip the regex for the common case
+        return query, None
+    m = _YEAR_RE.match(query)
     if m:
-        name = m.group(1).strip()
-        try:
-            return name, int(m.group(2))
-        except ValueError:
-            return query.strip(), None
-    return query.strip(), None
+        return m.group(1).strip(), int(m.group(2))
+    return query, None
+
+
+def _release_year(release_date: object) -> int | None:
+    """Return the year of a ``YYYY-MM-DD`` release date, else None."""
+    if isinstance(release_date, str) and release_date[:4].isdecimal():
+        return int(release_date[:4])
+    return None
+
+
+@lru_cache(maxsize=64)
+def _language_query(locale: str) -> str:
+    """Return the encoded ``&language=`` query component for `locale`."""
+    if not locale:
+        return ""
+    return "&" + urlencode({"language": _normalize_language(locale)})
 
 
+@lru_cache(maxsize=64)
 def _normalize_language(locale: str) -> str:
     """Normalize locale to TMDb `language` parameter.
 
@@ -7,7 +7,10 @@ Fetches series, seasons, and episodes from TMDb v3 API.
 
 from __future__ import annotations
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
@@ -18,16 +21,25 @@ from filebot.core.providers.base import (
     RestClientMixin,
 )
 
-# Reuse language normalization from movie client
-from filebot.core.providers.tmdb import _normalize_language
+# Reuse language query encoding from movie client
+from filebot.core.providers.tmdb import _language_query
 
 # TMDb TV API URLs
 _TMDB_TV_BASE_URL = "https://api.themoviedb.org/3/"
 _TMDB_TV_PUBLIC_URL = "https://www.themoviedb.org/tv/"
 
+# TMDb accepts at most 20 sub-requests per append_to_response
+_APPEND_LIMIT = 20
+# Maximum season requests in flight per episode list
+_SEASON_WORKERS = 8
+
+# Trailing start year in free-form queries, e.g. "The Office 2005"
+_YEAR_RE = re.compile(r"(.+?)\s+(19\d{2}|20\d{2})$")
+
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from collections.abc import Iterable
 
+    from filebot.core.providers.cache import ExpiringLRUCache
     from filebot.core.providers.utils import RateLimiter
 
 
@@ -42,14 +54,18 @@ class TMDbTVClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
     """
 
     apikey: str
-    _cache_short: TTLCache = field(init=False, repr=False)
-    _cache_long: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
     _limiter: RateLimiter = field(init=False, repr=False)
+    _api_key_query: str = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize caches and rate limiter for TMDb TV client."""
+        # Constant leading query component, encoded once
+        self._api_key_query = urlencode({"api_key": self.apikey})
+        # Search results shift as titles trend; details are near-static
         self._init_rest(
-            short_ttl=24 * 60 * 60,
+            short_ttl=4 * 60 * 60,
             long_ttl=7 * 24 * 60 * 60,
             rate=(35, 10),
         )
@@ -81,12 +97,11 @@ class TMDbTVClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         results = data.get("results") or []
         out: list[SearchResult] = []
         for it in results:
-            try:
-                sid = int(it["id"])  # KeyError/ValueError handled below
-                title = (it.get("name") or it.get("original_name") or "").strip()
-                out.append(SearchResult(id=sid, name=title, alias_names=[]))
-            except (KeyError, ValueError, TypeError):
+            sid = _to_int(it.get("id")) if isinstance(it, dict) else None
+            if sid is None:
                 continue
+            title = (it.get("name") or it.get("original_name") or "").strip()
+            out.append(SearchResult(id=sid, name=title, alias_names=()))
         return out
 
     def get_episode_list(
@@ -98,69 +113,80 @@ class TMDbTVClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         name = (tv.get("name") or tv.get("original_name") or "").strip()
 
         # List seasons, then fetch each season's episodes
-        seasons = [s.get("season_number") for s in tv.get("seasons", [])]
-        seasons = [int(s) for s in seasons if isinstance(s, int)]
+        seasons = [
+            n
+            for s in tv.get("seasons") or ()
+            if isinstance(n := s.get("season_number"), int)
+        ]
 
-        info = SeriesInfo(id=sid, name=name or None, alias_names=[])
+        info = SeriesInfo(id=sid, name=name or None, alias_names=())
 
+        name = info.name or ""
+        make_episode = Episode.from_values
         episodes: list[Episode] = []
         specials: list[Episode] = []
 
-        for s in seasons:
-            season = self._request_json(f"tv/{sid}/season/{s}", {}, locale)
-            for ep in season.get("episodes", []) or []:
-                try:
-                    eid = int(ep.get("id")) if ep.get("id") is not None else None
-                except (ValueError, TypeError):
-                    eid = None
-                season_num = ep.get("season_number")
-                try:
-                    season_num = (
-                        int(season_num) if season_num not in (None, "") else None
-                    )
-                except (ValueError, TypeError):
-                    season_num = None
-                ep_num = ep.get("episode_number")
-                try:
-                    ep_num = int(ep_num) if ep_num not in (None, "") else None
-                except (ValueError, TypeError):
-                    ep_num = None
-                title = (ep.get("name") or "").strip() or None
-                airdate = ep.get("air_date") or None
-
-                if s > 0:
-                    episodes.append(
-                        Episode(
-                            series_name=name,
-                            season=season_num,
-                            episode=ep_num,
-                            title=title,
-                            absolute=None,
-                            special_number=None,
-                            airdate=airdate,
-                            id=eid,
-                            series_info=info,
-                        )
-                    )
-                else:
-                    specials.append(
-                        Episode(
-                            series_name=name,
-                            season=None,
-                            episode=None,
-                            title=title,
-                            absolute=None,
-                            special_number=ep_num,
-                            airdate=airdate,
-                            id=eid,
-                            series_info=info,
-                        )
-                    )
+        for s, season in zip(
+            seasons, self._fetch_seasons(sid, seasons, locale), strict=True
+        ):
+            # map() drives the row parser from C, with no comprehension frame
+            rows = list(map(_episode_row, season.get("episodes") or ()))
+            # Season 0 holds specials; branch once per season, not per row.
+            # Extending with sized lists grows the result once per season
+            if s > 0:
+                episodes += [
+                    make_episode(name, sn, en, title, None, None, air, eid, info)
+                    for eid, sn, en, title, air in rows
+                ]
+            else:
+                specials += [
+                    make_episode(name, None, None, title, None, en, air, eid, info)
+                    for eid, _, en, title, air in rows
+                ]
 
         # Append specials after regular episodes
         episodes.extend(specials)
         return episodes
 
+    def get_episode_lists(
+        self,
+        series_ids: Iterable[int],
+        order: str,
+        locale: str,
+        max_workers: int = 4,
+    ) -> dict[int, list[Episode]]:
+        """Fetch episode lists for several series concurrently.
+
+        Requests share the client's rate limiter and keep-alive pool, so the
+        batch is bounded by the API rate limit rather than per-series latency.
+
+        Parameters
+        ----------
+        series_ids:
+            TMDb series IDs; duplicates are fetched once.
+        order:
+            Sort order, as for `get_episode_list`.
+        locale:
+            Preferred language, as for `get_episode_list`.
+        max_workers:
+            Maximum number of series processed at once.
+
+        Returns
+        -------
+        dict[int, list[Episode]]
+            Episodes per series ID in input order.
+        """
+        ids = list(dict.fromkeys(series_ids))
+        if not ids:
+            return {}
+
+        def _fetch(sid: int) -> list[Episode]:
+            return self.get_episode_list(sid, order, locale)
+
+        workers = max(1, min(max_workers, len(ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(ids, executor.map(_fetch, ids), strict=True))
+
     def get_series_info(self, series: SearchResult | int, locale: str) -> SeriesInfo:
         """Fetch basic series info for the given series id."""
         sid = series.id if isinstance(series, SearchResult) else int(series)
@@ -176,16 +202,12 @@ class TMDbTVClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         runtime = None
         runtimes = tv.get("episode_run_time") or []
         if isinstance(runtimes, list) and runtimes:
-            rt0 = runtimes[0]
-            if isinstance(rt0, int):
-                runtime = rt0
-            elif isinstance(rt0, str) and rt0.isdigit():
-                runtime = int(rt0)
-        genres = [
+            runtime = _to_int(runtimes[0])
+        genres = tuple(
             g.get("name")
             for g in (tv.get("genres") or [])
             if isinstance(g, dict) and g.get("name")
-        ]
+        )
         network = None
         nets = tv.get("networks") or []
         if isinstance(nets, list) and nets:
@@ -195,7 +217,7 @@ class TMDbTVClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         return SeriesInfo(
             id=sid,
             name=name,
-            alias_names=aliases,
+            alias_names=tuple(aliases),
             status=status,
             runtime=runtime,
             genres=genres,
@@ -207,21 +229,78 @@ class TMDbTVClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         return f"{_TMDB_TV_PUBLIC_URL}{series.id}"
 
     # --- internal helpers ---
+    def _fetch_seasons(
+        self, sid: int, seasons: list[int], locale: str
+    ) -> list[dict[str, Any]]:
+        """Fetch season payloads, returned in `seasons` order.
+
+        Seasons are bundled into ``tv/{sid}`` requests via
+        ``append_to_response`` (up to 20 per request), so most shows need a
+        single round-trip; larger shows fetch their chunks concurrently.
+        """
+        chunks = [
+            seasons[i : i + _APPEND_LIMIT]
+            for i in range(0, len(seasons), _APPEND_LIMIT)
+        ]
+
+        def fetch(chunk: list[int]) -> list[dict[str, Any]]:
+            keys = [f"season/{s}" for s in chunk]
+            data = self._request_json(
+                f"tv/{sid}", {"append_to_response": ",".join(keys)}, locale
+            )
+            return [data.get(key) or {} for key in keys]
+
+        if len(chunks) <= 1:
+            return [season for chunk in chunks for season in fetch(chunk)]
+        workers = min(_SEASON_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [season for part in executor.map(fetch, chunks) for season in part]
+
     def _request_json(
         self, path: str, params: dict[str, Any], locale: str
     ) -> dict[str, Any]:
-        base = _TMDB_TV_BASE_URL
-        query = {"api_key": self.apikey}
-        if locale:
-            query["language"] = _normalize_language(locale)
-        query.update(params)
-        url = base + path + "?" + urlencode(query)
+        url = (
+            f"{_TMDB_TV_BASE_URL}{path}?{self._api_key_query}{_language_query(locale)}"
+        )
+        if params:
+            url += "&" + urlencode(params)
         # Use mixin for HTTPS + caching + rate limiting
         return self._http_get_json(
             url, timeout=15, long_ttl=not path.startswith("search/"), require_https=True
         )
 
 
+def _episode_row(
+    ep: dict[str, Any],
+) -> tuple[int | None, int | None, int | None, str | None, str | None]:
+    """Extract (id, season, episode, title, airdate) from a season episode."""
+    return (
+        _to_int(ep.get("id")),
+        _to_int(ep.get("season_number")),
+        _to_int(ep.get("episode_number")),
+        (ep.get("name") or "").strip() or None,
+        ep.get("air_date") or None,
+    )
+
+
+def _to_int(value: object) -> int | None:
+    """Return `value` as an int if it is an int or decimal string, else None.
+
+    TMDb sends ints natively, so the exact-type check is the common path and
+    no conversion ever raises.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        digits = value.strip()
+        if digits[:1] == "-":
+            digits = digits[1:]
+        if digits.isdecimal():
+            return int(value)
+    return None
+
+
+@lru_cache(maxsize=2048)
 def _split_name_and_year(query: str) -> tuple[str, int | None]:
     """Split TV query into name and optional start year.
 
@@ -230,12 +309,11 @@ def _split_name_and_year(query: str) -> tuple[str, int | None]:
     "The Office 2005" -> ("The Office", 2005)
     "Breaking Bad" -> ("Breaking Bad", None)
     """
-    import re as _re
-
-    m = _re.match(r"(.+?)\s+(19\d{2}|20\d{2})$", query.strip())
+    query = query.strip()
+    if not query[-4:].isdigit():
+        # No trailing year; skip the regex for the common case
+        return query, None
+    m = _YEAR_RE.match(query)
     if m:
-        try:
-            return m.group(1).strip(), int(m.group(2))
-        except ValueError:
-            return query.strip(), None
-    return query.strip(), None
+        return m.group(1).strip(), int(m.group(2))
+    return query, None
@@ -21,14 +21,15 @@
 """Core providers TheTVDB module."""
 
 import json
-import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from time import monotonic
 from typing import Any
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-
-from cachetools import TTLCache
+from urllib.request import Request
 
 from filebot.core.models import (
     TV_DB_IDENTIFIER,
@@ -42,17 +43,18 @@ from filebot.core.providers.base import (
     EpisodeListProvider,
     RestClientMixin,
 )
-from filebot.core.providers.utils import (
-    RateLimiter,
-    is_https,
-    lenient_name_equals,
-)
+from filebot.core.providers.cache import ExpiringLRUCache, shared_cache
+from filebot.core.providers.connection_pool import urlopen
+from filebot.core.providers.utils import RateLimiter, parse_int
 
 # TVDB API URLs
 _TVDB_BASE_URL = "https://api.thetvdb.com/"
 _TVDB_LOGIN_URL = "https://api.thetvdb.com/login"
 _TVDB_PUBLIC_URL = "https://www.thetvdb.com/"
 
+# Maximum episode pages requested at once
+_PAGE_WORKERS = 8
+
 
 @dataclass(slots=True)
 class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
@@ -67,16 +69,25 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
     apikey: str
     _token: str | None = None
     _token_expire_ts: float | None = None  # monotonic seconds deadline
-    _cache_short: TTLCache = field(init=False, repr=False)
-    _cache_long: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
     _limiter: RateLimiter = field(init=False, repr=False)
+    _unlocalized: ExpiringLRUCache = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize caches and rate limiter for TheTVDB client."""
-        self._cache_short = TTLCache(maxsize=4096, ttl=24 * 60 * 60)
-        self._cache_long = TTLCache(maxsize=4096, ttl=7 * 24 * 60 * 60)
         # Typical limits allow ~20-40/10s; use conservative 30/10s
-        self._limiter = RateLimiter(max_requests=30, window_seconds=10)
+        self._init_rest(
+            short_ttl=24 * 60 * 60,
+            long_ttl=7 * 24 * 60 * 60,
+            maxsize_short=4096,
+            maxsize_long=4096,
+            rate=(30, 10),
+        )
+        # "series|language" pairs known to lack a localized series name
+        self._unlocalized = shared_cache(
+            TheTVDBClient, "unlocalized", maxsize=4096, ttl=7 * 24 * 60 * 60
+        )
 
     @property
     def identifier(self) -> str:
@@ -101,145 +112,201 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
             {"name": query},
             locale,
         )
-        results = data.get("data") or []
+        # Every result is kept: TheTVDB already ranks by name and aliases, and
+        # callers apply their own lenient matching
         out: list[SearchResult] = []
-        for it in results:
-            try:
-                sid = int(it["id"])  # KeyError/ValueError handled below
-                name = it.get("seriesName") or ""
-                aliases = list(it.get("aliases") or [])
-                # Filter clearly invalid items by lenient name match if possible
-                if query and not lenient_name_equals(query, name, locale):
-                    # allow if any alias matches leniently
-                    if not any(lenient_name_equals(query, a, locale) for a in aliases):
-                        # keep but deprioritize by appending later if desired
-                        out.append(SearchResult(id=sid, name=name, alias_names=aliases))
-                    else:
-                        out.append(SearchResult(id=sid, name=name, alias_names=aliases))
-                else:
-                    out.append(SearchResult(id=sid, name=name, alias_names=aliases))
-            except (KeyError, ValueError, TypeError):
+        for it in data.get("data") or []:
+            sid = parse_int(it.get("id")) if isinstance(it, dict) else None
+            if sid is None:
                 continue
+            aliases = it.get("aliases")
+            out.append(
+                SearchResult(
+                    id=sid,
+                    name=it.get("seriesName") or "",
+                    alias_names=tuple(aliases) if isinstance(aliases, list) else (),
+                )
+            )
         return out
 
+    def search_many(
+        self, queries: Iterable[str], locale: str, max_workers: int = 4
+    ) -> dict[str, list[SearchResult]]:
+        """Search for several series concurrently.
+
+        Like `get_episode_lists`, requests share the client's rate limiter
+        and keep-alive pool, so a library scan is bounded by the API rate
+        limit rather than by one round trip per show.
+
+        Parameters
+        ----------
+        queries:
+            Series names; duplicates are searched once.
+        locale:
+            Preferred language, as for `search`.
+        max_workers:
+            Maximum number of searches in flight.
+
+        Returns
+        -------
+        dict[str, list[SearchResult]]
+            Results per query in input order.
+        """
+        names = list(dict.fromkeys(queries))
+        if not names:
+            return {}
+        # Log in once up front instead of racing a login per worker
+        self._get_token()
+        workers = max(1, min(max_workers, len(names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            found = executor.map(lambda q: self.search(q, locale), names)
+            return dict(zip(names, found, strict=True))
+
     def get_episode_list(
         self, series: SearchResult | int, order: str, locale: str
     ) -> list[Episode]:
         """Fetch episodes for a series with pagination."""
         series_id = series.id if isinstance(series, SearchResult) else int(series)
 
-        # Fetch series info to capture series-level context with English fallback
-        s_info = self.get_series_info(series_id, locale)
-        if not s_info.name and locale and not locale.startswith("en"):
+        # Series info and the episode pages are independent requests: overlap
+        # them so a full fetch costs two round trips (info + page 1, then the
+        # remaining pages) instead of three. Log in first so both threads
+        # share one token.
+        # Series known to have no name in this language go straight to the
+        # English fallback instead of paying a second, serial round trip.
+        fallback_key = (
+            f"{series_id}|{_normalize_language(locale)}"
+            if locale and not locale.startswith("en")
+            else None
+        )
+        info_locale = "en" if fallback_key in self._unlocalized else locale
+        self._get_token()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            info_future = pool.submit(self.get_series_info, series_id, info_locale)
+            nodes = list(self._iter_episode_nodes(series_id, locale))
+            s_info = info_future.result()
+
+        # Series-level context with English fallback
+        if not s_info.name and fallback_key is not None and info_locale != "en":
             # Fallback to English if preferred language returns no title
+            self._unlocalized[fallback_key] = True
             s_info = self.get_series_info(series_id, "en")
 
-        episodes: list[Episode] = []
+        name = s_info.name or ""
+        make_episode = Episode.from_values
+        # Regular episodes are staged as plain tuples led by their sort key,
+        # sorted, and only then materialized
+        staged: list[tuple[Any, ...]] = []
         specials: list[Episode] = []
-        for node in self._iter_episode_nodes(series_id, locale):
-            try:
-                eid = int(node["id"])  # episode id
-                title = node.get("episodeName") or None
-                airdate = node.get("firstAired") or None
-                absolute_num = self._parse_int(node.get("absoluteNumber"))
-
-                season_num, episode_num = self._derive_numbering(
-                    order, node, absolute_num, airdate
-                )
+        for node in nodes:
+            eid = parse_int(node.get("id")) if isinstance(node, dict) else None
+            if eid is None:
+                continue
+            title = node.get("episodeName") or None
+            airdate = node.get("firstAired") or None
+            absolute_num = parse_int(node.get("absoluteNumber"))
 
-                is_regular = season_num is None or (
-                    isinstance(season_num, int) and season_num > 0
-                )
+            season_num, episode_num = _derive_numbering(
+                order, node, absolute_num, airdate
+            )
 
-                if is_regular:
-                    episodes.append(
-                        Episode(
-                            series_name=s_info.name or "",
-                            season=season_num,
-                            episode=episode_num,
-                            title=title,
-                            absolute=absolute_num,
-                            special_number=None,
-                            airdate=airdate,
-                            id=eid,
-                            series_info=s_info,
-                        )
-                    )
-                else:
-                    specials.append(
-                        Episode(
-                            series_name=s_info.name or "",
-                            season=None,
-                            episode=None,
-                            title=title,
-                            absolute=absolute_num,
-                            special_number=episode_num,
-                            airdate=airdate,
-                            id=eid,
-                            series_info=s_info,
-                        )
+            # Season 0 holds specials; season None means absolute numbering
+            if season_num is None or season_num > 0:
+                staged.append((
+                    (season_num or 0, episode_num or 0),
+                    season_num,
+                    episode_num,
+                    title,
+                    absolute_num,
+                    airdate,
+                    eid,
+                ))
+            else:
+                specials.append(
+                    make_episode(
+                        name,
+                        None,
+                        None,
+                        title,
+                        absolute_num,
+                        episode_num,
+                        airdate,
+                        eid,
+                        s_info,
                     )
-            except (KeyError, ValueError, TypeError):
-                continue
+                )
 
-        # Sort episodes by season / episode number and append specials at the end
-        episodes.sort(key=lambda e: ((e.season or 0), (e.episode or 0)))
+        # Sort by season / episode number and append specials at the end
+        staged.sort(key=itemgetter(0))
+        episodes = [
+            make_episode(name, sn, en, title, absolute, None, air, eid, s_info)
+            for _, sn, en, title, absolute, air, eid in staged
+        ]
         episodes.extend(specials)
         return episodes
 
     def _iter_episode_nodes(self, series_id: int, locale: str):
-        """Yield raw episode nodes across all pages."""
-        page = 1
-        last = None
-        while last is None or page <= last:
-            data = self._request_json(
-                f"series/{series_id}/episodes",
-                {"page": page},
-                locale,
-            )
-            last = (data.get("links") or {}).get("last")
-            try:
-                last = int(last) if last is not None else page
-            except (TypeError, ValueError):
-                last = page
-            yield from data.get("data", [])
-            page += 1
-
-    def _parse_int(self, value: Any) -> int | None:
-        if isinstance(value, int):
-            return value
-        if isinstance(value, str) and value.isdigit():
-            return int(value)
-        return None
-
-    def _derive_numbering(
+        """Yield raw episode nodes across all pages.
+
+        Page 1 reveals the last page number; the remaining pages are then
+        fetched concurrently and yielded in page order.
+        """
+        path = f"series/{series_id}/episodes"
+        first = self._request_json(path, {"page": 1}, locale)
+        yield from first.get("data", [])
+        last = (first.get("links") or {}).get("last")
+        try:
+            last = int(last) if last is not None else 1
+        except (TypeError, ValueError):
+            last = 1
+        if last < 2:
+            return
+        pages = range(2, last + 1)
+        with ThreadPoolExecutor(max_workers=min(len(pages), _PAGE_WORKERS)) as pool:
+            for data in pool.map(
+                lambda page: self._request_json(path, {"page": page}, locale), pages
+            ):
+                yield from data.get("data", [])
+
+    def get_episode_lists(
         self,
-        sort_order: str,
-        node: dict[str, Any],
-        absolute_number: int | None,
-        airdate_str: str | None,
-    ) -> tuple[int | None, int | None]:
-        season_number = self._parse_int(node.get("airedSeason"))
-        episode_number = self._parse_int(node.get("airedEpisodeNumber"))
-
-        if sort_order == "DVD":
-            dvd_season = self._parse_int(node.get("dvdSeason"))
-            dvd_episode = self._parse_int(node.get("dvdEpisodeNumber"))
-            if dvd_season is not None and dvd_episode is not None:
-                return dvd_season, dvd_episode
-
-        if sort_order == "Absolute" and (absolute_number or 0) > 0:
-            return None, absolute_number
+        series_ids: Iterable[int],
+        order: str,
+        locale: str,
+        max_workers: int = 4,
+    ) -> dict[int, list[Episode]]:
+        """Fetch episode lists for several series concurrently.
+
+        Requests share the client's rate limiter and keep-alive pool, so the
+        batch is bounded by the API rate limit rather than per-series latency.
+
+        Parameters
+        ----------
+        series_ids:
+            TheTVDB series IDs; duplicates are fetched once.
+        order:
+            Sort order, as for `get_episode_list`.
+        locale:
+            Preferred language, as for `get_episode_list`.
+        max_workers:
+            Maximum number of series processed at once.
+
+        Returns
+        -------
+        dict[int, list[Episode]]
+            Episodes per series ID in input order.
+        """
+        ids = list(dict.fromkeys(series_ids))
+        if not ids:
+            return {}
 
-        if (
-            sort_order == "AbsoluteAirdate"
-            and isinstance(airdate_str, str)
-            and re.match(r"^\d{4}-\d{2}-\d{2}$", airdate_str)
-        ):
-            y, m, d = airdate_str.split("-")
-            return None, int(y) * 10000 + int(m) * 100 + int(d)
+        def _fetch(sid: int) -> list[Episode]:
+            return self.get_episode_list(sid, order, locale)
 
-        return season_number, episode_number
+        self._get_token()
+        workers = max(1, min(max_workers, len(ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(ids, executor.map(_fetch, ids), strict=True))
 
     def get_series_info(self, series: SearchResult | int, locale: str) -> SeriesInfo:
         """Fetch basic series info."""
@@ -247,7 +314,7 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         data = self._request_json(f"series/{sid}", {}, locale)
         d = data.get("data") or {}
         name = d.get("seriesName") or None
-        aliases = list(d.get("aliases") or [])
+        aliases = tuple(d.get("aliases") or ())
         return SeriesInfo(id=sid, name=name, alias_names=aliases)
 
     def get_episode_list_link(self, series: SearchResult) -> str:
@@ -295,24 +362,26 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         items = data.get("data") if isinstance(data, dict) else None
         if not isinstance(items, list):
             return []
-        actors: list[dict[str, object]] = []
+        # (sort key, actor) pairs: unordered actors last, then by sortOrder
+        keyed: list[tuple[tuple[bool, int], dict[str, object]]] = []
         for it in items:
             if not isinstance(it, dict):
                 continue
             name = it.get("name")
             character = it.get("role")
-            order = it.get("sortOrder")
+            order = parse_int(it.get("sortOrder"))
             image = self._resolve_image(it.get("image"))
-            actors.append({
-                "name": name if isinstance(name, str) else None,
-                "character": character if isinstance(character, str) else None,
-                "order": int(order)
-                if isinstance(order, (int, str)) and str(order).isdigit()
-                else None,
-                "image": image,
-            })
-        actors.sort(key=lambda a: (a.get("order") is None, a.get("order") or 0))
-        return actors
+            keyed.append((
+                (order is None, order or 0),
+                {
+                    "name": name if isinstance(name, str) else None,
+                    "character": character if isinstance(character, str) else None,
+                    "order": order,
+                    "image": image,
+                },
+            ))
+        keyed.sort(key=itemgetter(0))
+        return list(map(itemgetter(1), keyed))
 
     def get_episode_info(self, episode_id: int, locale: str) -> dict[str, object]:
         """Return extra episode information.
@@ -354,17 +423,13 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         people.extend(_as_people("guestStars", "Guest Star"))
 
         return {
-            "series_id": int(series_id)
-            if isinstance(series_id, (int, str)) and str(series_id).isdigit()
-            else None,
+            "series_id": parse_int(series_id),
             "overview": overview if isinstance(overview, str) else None,
             "rating": float(rating)
             if isinstance(rating, (int, float, str))
             and str(rating).replace(".", "", 1).isdigit()
             else None,
-            "votes": int(votes)
-            if isinstance(votes, (int, str)) and str(votes).isdigit()
-            else None,
+            "votes": parse_int(votes),
             "people": people,
         }
 
@@ -390,7 +455,8 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
         items = data.get("data") if isinstance(data, dict) else None
         if not isinstance(items, list):
             return []
-        artworks: list[Artwork] = []
+        # (sort key, artwork) pairs: unrated last, then by rating descending
+        keyed: list[tuple[tuple[bool, float], Artwork]] = []
         for it in items:
             if not isinstance(it, dict):
                 continue
@@ -410,11 +476,12 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
                 ",".join([p for p in [category, sub_key, resolution] if p]) or category
             )
             if url:
-                artworks.append(
-                    Artwork(category=cat, url=url, language=None, rating=rating)
-                )
-        artworks.sort(key=lambda a: (a.rating is None, -(a.rating or 0.0)))
-        return artworks
+                keyed.append((
+                    (rating is None, -(rating or 0.0)),
+                    Artwork(category=cat, url=url, language=None, rating=rating),
+                ))
+        keyed.sort(key=itemgetter(0))
+        return list(map(itemgetter(1), keyed))
 
     def _resolve_image(self, path: object) -> str | None:
         """Resolve TheTVDB banner path to full URL."""
@@ -426,21 +493,26 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
     def _request_json(
         self, path: str, params: dict[str, Any], locale: str
     ) -> dict[str, Any]:
-        base = _TVDB_BASE_URL
         token = self._get_token()
-        query = urlencode(params) if params else ""
-        url = base + path + ("?" + query if query else "")
+        # Most calls (series info, actors, episode info) carry no params
+        url = (
+            f"{_TVDB_BASE_URL}{path}?{urlencode(params)}"
+            if params
+            else _TVDB_BASE_URL + path
+        )
         headers = {
             "Accept": "application/json",
             "Authorization": f"Bearer {token}",
         }
-        if locale:
-            headers["Accept-Language"] = _normalize_language(locale)
+        language = _normalize_language(locale) if locale else ""
+        if language:
+            headers["Accept-Language"] = language
 
-        if not is_https(url):
-            return {}
+        # _http_get_json enforces HTTPS itself
         long_ttl = not (path.startswith("series/") and path.endswith("/episodes"))
-        cache_key = url + "|" + headers.get("Accept-Language", "")
+        # TheTVDB answers in English without the header, so "en" and no locale
+        # share the bare URL as their cache key
+        cache_key = url if language in {"", "en"} else f"{url}|{language}"
         return self._http_get_json(
             url,
             headers=headers,
@@ -463,11 +535,15 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
             data=payload,
             headers={"Content-Type": "application/json", "Accept": "application/json"},
         )
-        if not is_https(url):
+        # Literal prefix test: the login URL is a module constant
+        if not url.startswith("https://"):
             message = "TheTVDB: invalid scheme for token endpoint"
             raise RuntimeError(message)
-        with urlopen(req, timeout=15) as resp:  # noqa: S310
-            data = json.loads(resp.read().decode("utf-8"))
+        # Pooled keep-alive connection: the API calls that follow reuse the
+        # TLS session opened for the login request
+        with urlopen(req, timeout=15) as resp:
+            # json.loads detects the encoding of raw bytes itself
+            data = json.loads(resp.read())
             token = data.get("token")
             if not token:
                 message = "TheTVDB: missing token in response"
@@ -478,6 +554,56 @@ class TheTVDBClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
             return token
 
 
+def _derive_numbering(
+    sort_order: str,
+    node: dict[str, Any],
+    absolute_number: int | None,
+    airdate_str: str | None,
+) -> tuple[int | None, int | None]:
+    """Return (season, episode) for an episode node under `sort_order`.
+
+    Alternate orders are checked first so the aired fields are only parsed
+    when they are the answer (always, for the default order).
+    """
+    if sort_order == "DVD":
+        dvd_season = parse_int(node.get("dvdSeason"))
+        dvd_episode = parse_int(node.get("dvdEpisodeNumber"))
+        if dvd_season is not None and dvd_episode is not None:
+            return dvd_season, dvd_episode
+    elif sort_order == "Absolute":
+        if (absolute_number or 0) > 0:
+            return None, absolute_number
+    elif sort_order == "AbsoluteAirdate":
+        airdate_number = _airdate_number(airdate_str)
+        if airdate_number is not None:
+            return None, airdate_number
+
+    return (
+        parse_int(node.get("airedSeason")),
+        parse_int(node.get("airedEpisodeNumber")),
+    )
+
+
+def _airdate_number(airdate: object) -> int | None:
+    """Return an ISO ``YYYY-MM-DD`` airdate as the integer YYYYMMDD, else None.
+
+    Validated by length, dash positions and digit slices instead of a regex;
+    ``isdecimal`` accepts the same digits as a regex digit class and ``int``.
+    """
+    if (
+        type(airdate) is str
+        and len(airdate) == 10
+        and airdate[4] == "-"
+        and airdate[7] == "-"
+        and airdate[:4].isdecimal()
+        and airdate[5:7].isdecimal()
+        and airdate[8:].isdecimal()
+    ):
+        return int(airdate[:4]) * 10000 + int(airdate[5:7]) * 100 + int(airdate[8:])
+    return None
+
+
+@lru_cache(maxsize=64)
 def _normalize_language(locale: str) -> str:
     """Normalize to TheTVDB Accept-Language semantics.
 
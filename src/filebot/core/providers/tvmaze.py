@@ -38,12 +38,13 @@ from filebot.core.providers.base import (
 from filebot.core.providers.utils import is_allowed_http
 
 _TVMAZE_HOST = "api.tvmaze.com"
+_TVMAZE_ALLOWED_HOSTS = frozenset({_TVMAZE_HOST})
 _TVMAZE_BASE_URL = f"http://{_TVMAZE_HOST}/"
 _TVMAZE_PUBLIC_URL = "http://www.tvmaze.com/shows/"
 
 
 if TYPE_CHECKING:
-    from cachetools import TTLCache
+    from filebot.core.providers.cache import ExpiringLRUCache
 
 
 @dataclass(slots=True)
@@ -56,8 +57,8 @@ class TVMazeClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
     shared REST mixin for caching, validation and request handling.
     """
 
-    _cache_short: TTLCache = field(init=False, repr=False)
-    _cache_long: TTLCache = field(init=False, repr=False)
+    _cache_short: ExpiringLRUCache = field(init=False, repr=False)
+    _cache_long: ExpiringLRUCache = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize caches; TVmaze is HTTP-only with short cache.
@@ -196,12 +197,12 @@ class TVMazeClient(BaseDatasource, RestClientMixin, EpisodeListProvider):
     # --- internal helpers ---
     def _request_json(self, resource: str) -> Any:
         url = f"{_TVMAZE_BASE_URL}{resource}"
-        if not is_allowed_http(url, {_TVMAZE_HOST}):
+        if not is_allowed_http(url, _TVMAZE_ALLOWED_HOSTS):
             return {}
         return self._http_get_json(
             url,
             timeout=15,
             long_ttl=False,
             require_https=False,
-            allowed_http_hosts={_TVMAZE_HOST},
+            allowed_http_hosts=_TVMAZE_ALLOWED_HOSTS,
         )
@@ -26,13 +26,20 @@ rate limiter to protect external API calls.
 
 from __future__ import annotations
 
+import sys
 import threading
 import time
 import unicodedata
+from array import array
 from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlsplit
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
 
 def is_https(url: str) -> bool:
     """Check if URL uses HTTPS scheme.
@@ -51,21 +58,29 @@ def is_https(url: str) -> bool:
     return parts.scheme == "https"
 
 
-def is_allowed_http(url: str, allowed_hosts: set[str] | None = None) -> bool:
+def is_allowed_http(url: str, allowed_hosts: Collection[str] | None = None) -> bool:
     """Check if URL uses HTTP scheme and is from an allowed host.
 
     Parameters
     ----------
     url : str
         URL to check.
-    allowed_hosts : set[str] | None
-        Set of allowed hosts for HTTP URLs. If None, only checks for HTTP scheme.
+    allowed_hosts : Collection[str] | None
+        Allowed hosts for HTTP URLs. If None, only checks for HTTP scheme.
+        Pass a `frozenset` constant to avoid a conversion per call.
 
     Returns
     -------
     bool
         True if URL uses HTTP scheme and is from an allowed host (if specified).
     """
+    if allowed_hosts is not None and not isinstance(allowed_hosts, frozenset):
+        allowed_hosts = frozenset(allowed_hosts)
+    return _is_allowed_http_cached(url, allowed_hosts)
+
+
+@lru_cache(maxsize=1024)
+def _is_allowed_http_cached(url: str, allowed_hosts: frozenset[str] | None) -> bool:
     parts = urlsplit(url)
     if parts.scheme != "http":
         return False
@@ -76,6 +91,31 @@ def is_allowed_http(url: str, allowed_hosts: set[str] | None = None) -> bool:
     return parts.netloc in allowed_hosts
 
 
+def parse_int(value: object) -> int | None:
+    """Return `value` as an int if it is an int or decimal string, else None.
+
+    Providers send numbers as JSON ints, so the exact-type check is the common
+    path and also rejects bools. ``isdecimal`` admits only strings ``int`` can
+    parse (unlike ``isdigit``, which accepts e.g. superscripts), so no
+    conversion ever raises.
+
+    Parameters
+    ----------
+    value : object
+        Raw JSON value.
+
+    Returns
+    -------
+    int | None
+        Parsed non-negative integer, or None if `value` is not one.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    return None
+
+
 class RateLimiter:
     """Simple sliding-window rate limiter.
 
@@ -90,6 +130,13 @@ class RateLimiter:
     -------
     acquire:
         Blocks briefly if necessary to respect the configured rate.
+
+    Notes
+    -----
+    Providers publish limits as "N requests per window", which a sliding
+    window enforces exactly while still allowing a burst of N. A token bucket
+    with capacity N refilling at N per window would admit up to 2N requests
+    in one window (a full bucket plus a window's refill) and draw 429s.
     """
 
     def __init__(self, max_requests: int, window_seconds: float) -> None:
@@ -105,26 +152,26 @@ class RateLimiter:
         -----
         Uses a sliding window over the last ``window_seconds``. If the number
         of recorded events reaches ``max_requests``, this call will sleep until
-        the oldest event falls out of the current window.
+        the oldest event falls out of the current window, then re-check: when
+        several threads wait at once (e.g., concurrent page fetches), only as
+        many proceed as there are free slots.
         """
-        now = time.monotonic()
-        with self._lock:
-            # purge old events
-            cutoff = now - self._window
-            while self._events and self._events[0] < cutoff:
-                self._events.popleft()
-
-            if len(self._events) < self._max_requests:
-                self._events.append(now)
-                return
-
-            # need to wait until earliest event leaves window
-            sleep_for = self._events[0] + self._window - now
-        if sleep_for > 0:
-            time.sleep(sleep_for)
-        # record event after sleeping
-        with self._lock:
-            self._events.append(time.monotonic())
+        events = self._events
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # purge old events
+                cutoff = now - self._window
+                while events and events[0] < cutoff:
+                    events.popleft()
+
+                if len(events) < self._max_requests:
+                    events.append(now)
+                    return
+
+                # need to wait until earliest event leaves window
+                sleep_for = events[0] + self._window - now
+            time.sleep(max(sleep_for, 0.0))
 
 
 def compute_opensubtitles_hash(file_path: str) -> tuple[str, int]:
@@ -151,28 +198,12 @@ def compute_opensubtitles_hash(file_path: str) -> tuple[str, int]:
     p = Path(file_path)
     size = p.stat().st_size
 
-    def _sum_64k(fh, length: int) -> int:
-        total = 0
-        buf = fh.read(length)
-        mv = memoryview(buf)
-        n = (len(mv) // 8) * 8
-        # sum 8-byte little-endian chunks
-        for i in range(0, n, 8):
-            chunk = int.from_bytes(mv[i : i + 8], "little", signed=False)
-            total = (total + chunk) & 0xFFFFFFFFFFFFFFFF
-        # handle remaining tail bytes (pad as little-endian)
-        rem = len(mv) - n
-        if rem:
-            tail = int.from_bytes(mv[n:], "little", signed=False)
-            total = (total + tail) & 0xFFFFFFFFFFFFFFFF
-        return total
-
     with p.open("rb") as fh:
-        head_sum = _sum_64k(fh, min(block_size, size))
+        head_sum = _sum_le_uint64(fh.read(min(block_size, size)))
         # seek to start of last 64 KiB (or 0 if file smaller)
         tail_offset = max(size - block_size, 0)
         fh.seek(tail_offset)
-        tail_sum = _sum_64k(fh, min(block_size, size))
+        tail_sum = _sum_le_uint64(fh.read(min(block_size, size)))
 
     # include size
     h = (head_sum + tail_sum + (size & 0xFFFFFFFFFFFFFFFF)) & 0xFFFFFFFFFFFFFFFF
@@ -180,6 +211,23 @@ def compute_opensubtitles_hash(file_path: str) -> tuple[str, int]:
     return hash_hex, size
 
 
+def _sum_le_uint64(buf: bytes) -> int:
+    """Return the sum of `buf` as little-endian uint64 words, modulo 2^64.
+
+    Whole words are summed in C through an ``array("Q")`` view instead of a
+    per-word Python loop; a trailing partial word counts as zero-padded.
+    """
+    n = len(buf) & ~7
+    words = array("Q", buf[:n])
+    if sys.byteorder == "big":
+        words.byteswap()
+    total = sum(words)
+    if n < len(buf):
+        total += int.from_bytes(buf[n:], "little")
+    return total & 0xFFFFFFFFFFFFFFFF
+
+
+@lru_cache(maxsize=4096)
 def normalize_string_for_match(value: str, _locale: str | None = None) -> str:
     """Return a lenient-normalized string for name matching.
 
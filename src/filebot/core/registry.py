@@ -21,6 +21,7 @@
 """Core registry module."""
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from filebot.core.config import AppConfig, load_config_from_env
 from filebot.core.providers.acoustid import AcoustIDClient
@@ -32,6 +33,7 @@ from filebot.core.providers.base import (
     MusicIdentificationService,
     SubtitleProvider,
 )
+from filebot.core.providers.cache import configure_disk_cache
 from filebot.core.providers.fanarttv import FanartTVClient
 from filebot.core.providers.omdb import OMDbClient
 from filebot.core.providers.tmdb import TMDbClient
@@ -94,6 +96,11 @@ def _build_registry(config: AppConfig) -> ProviderRegistry:
     music: list[MusicIdentificationService] = []
     subtitles: list[SubtitleProvider] = []
 
+    # Persist JSON responses so a restart does not re-spend API quota
+    configure_disk_cache(
+        Path(config.cache_dir) / "responses.sqlite3" if config.cache_dir else None
+    )
+
     if config.tmdb_api_key:
         tmdb = TMDbClient(apikey=config.tmdb_api_key)
         movies.append(tmdb)
@@ -109,7 +116,13 @@ def _build_registry(config: AppConfig) -> ProviderRegistry:
 
     if config.anidb_client and config.anidb_clientver:
         anidb = AniDBClient(
-            client=config.anidb_client, clientver=config.anidb_clientver
+            client=config.anidb_client,
+            clientver=config.anidb_clientver,
+            titles_cache_path=(
+                Path(config.cache_dir) / "anidb_titles.json.gz"
+                if config.cache_dir
+                else None
+            ),
         )
         episodes.append(anidb)
 
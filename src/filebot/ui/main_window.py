@@ -42,6 +42,22 @@ class MainWindow(QMainWindow):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("FileBot")
+        # Cheap placeholder so the first frame can paint before the views exist
+        self.setCentralWidget(QWidget(self))
+        self._initialized = False
+
+    def finish_init(self) -> None:
+        """Build the sidebar and content views.
+
+        Notes
+        -----
+        Intended to run from the event loop right after the window is shown
+        (see `filebot.app.main`) so that the first paint is not blocked by
+        panel construction. Subsequent calls are no-ops.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
         self._setup_central()
 
     def _setup_central(self) -> None:
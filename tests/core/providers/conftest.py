@@ -31,9 +31,19 @@ import pytest
 
 from filebot.core.providers.acoustid import AcoustIDClient
 from filebot.core.providers.base import RestClientMixin
+from filebot.core.providers.cache import clear_shared_caches, configure_disk_cache
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+
+
+@pytest.fixture(autouse=True)
+def _isolate_shared_caches() -> Iterator[None]:
+    """Start every provider test with empty process-wide caches."""
+    clear_shared_caches()
+    yield
+    clear_shared_caches()
+    configure_disk_cache(None)
 
 
 @pytest.fixture
@@ -103,14 +113,14 @@ def acoustid_client(monkeypatch: pytest.MonkeyPatch) -> AcoustIDClient:
 
     Notes
     -----
-    The production `__post_init__` relies on a mixin not used by `AcoustIDClient`.
-    We override the initializer to set required attributes for unit testing.
+    We override the initializer to use a small cache and a counting limiter
+    for unit testing.
     """
 
     from cachetools import TTLCache as _TTLCache
 
     def _init(self: AcoustIDClient) -> None:  # type: ignore[override]
-        self._cache_day = _TTLCache(maxsize=128, ttl=60)  # type: ignore[attr-defined]
+        self._cache_short = _TTLCache(maxsize=128, ttl=60)  # type: ignore[attr-defined]
 
         class _Limiter:
             def __init__(self) -> None:
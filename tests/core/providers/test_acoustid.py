@@ -79,13 +79,13 @@ def test_acoustid_invalid_input_early_return(
     assert c.lookup(duration, fingerprint) == {}
 
 
-def test_acoustid_disallowed_host(
+def test_acoustid_non_https_rejected(
     monkeypatch: pytest.MonkeyPatch, acoustid_client: AcoustIDClient
 ) -> None:
-    # Disallow host to force early return
+    # Downgrade the endpoint to force early return
     monkeypatch.setattr(
-        "filebot.core.providers.acoustid._ACOUSTID_ALLOWED_HOSTS",
-        set(),
+        "filebot.core.providers.acoustid._ACOUSTID_LOOKUP_PREFIX",
+        "http://api.acoustid.org/v2/lookup?meta=x",
         raising=True,
     )
     c = acoustid_client
@@ -121,6 +121,94 @@ def test_acoustid_caching_and_limiter(
     assert calls["n"] == 1
 
 
+def test_acoustid_gzip_body_is_decoded(
+    monkeypatch: pytest.MonkeyPatch, acoustid_client: AcoustIDClient
+) -> None:
+    import gzip
+
+    def _gz(req: Any, timeout: int = 0):
+        class _Resp:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return None
+
+            def read(self):
+                return gzip.compress(b'{"status": "ok", "results": []}')
+
+        return _Resp()
+
+    monkeypatch.setattr("filebot.core.providers.acoustid.urlopen", _gz, raising=True)
+    c = acoustid_client
+    assert c.lookup(10, "fp") == {"status": "ok", "results": []}
+
+
+def test_acoustid_cache_keyed_by_inputs(
+    monkeypatch: pytest.MonkeyPatch, acoustid_client: AcoustIDClient
+) -> None:
+    def _boom(req: Any, timeout: int = 0) -> None:  # pragma: no cover - cached
+        msg = "network should not be called on cache hit"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("filebot.core.providers.acoustid.urlopen", _boom, raising=True)
+    c = acoustid_client
+    c._cache_short[10, "fp"] = {"status": "ok"}
+    assert c.lookup(10, "fp") == {"status": "ok"}
+
+
+def test_acoustid_lookup_many_orders_dedupes_and_caches(
+    monkeypatch: pytest.MonkeyPatch, acoustid_client: AcoustIDClient
+) -> None:
+    import json as _json
+    import threading
+    from urllib.parse import parse_qs, urlsplit
+
+    lock = threading.Lock()
+    seen: list[str] = []
+
+    def _echo(req: Any, timeout: int = 0):
+        fp = parse_qs(urlsplit(req.full_url).query)["fingerprint"][0]
+        with lock:
+            seen.append(fp)
+
+        class _Resp:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return None
+
+            def read(self):
+                return _json.dumps({"fp": fp}).encode()
+
+        return _Resp()
+
+    monkeypatch.setattr("filebot.core.providers.acoustid.urlopen", _echo, raising=True)
+    c = acoustid_client
+    c._cache_short[7, "cached"] = {"fp": "from-cache"}
+    out = c.lookup_many([(10, "a"), (0, "bad"), (10, "b"), (7, "cached"), (10, "a")])
+    assert out == [
+        {"fp": "a"},
+        {},
+        {"fp": "b"},
+        {"fp": "from-cache"},
+        {"fp": "a"},
+    ]
+    assert sorted(seen) == ["a", "b"]
+    # Fetched results are cached for subsequent single lookups
+    assert c.lookup(10, "b") == {"fp": "b"}
+    assert len(seen) == 2
+
+
+def test_acoustid_post_init_uses_shared_rest_setup() -> None:
+    from filebot.core.providers.acoustid import AcoustIDClient
+
+    c = AcoustIDClient(apikey="k")
+    assert c._cache_short.maxsize == 2048
+    assert c._limiter is not None
+
+
 def test_acoustid_json_error_returns_empty(
     monkeypatch: pytest.MonkeyPatch, acoustid_client: AcoustIDClient
 ) -> None:
@@ -161,13 +249,6 @@ def test_acoustid_request_contains_params(
 ) -> None:
     captured = {"url": "", "headers": {}}
 
-    # Ensure allowed host and clean cache
-    monkeypatch.setattr(
-        "filebot.core.providers.acoustid._ACOUSTID_ALLOWED_HOSTS",
-        {"api.acoustid.org"},
-        raising=True,
-    )
-
     def _ok(req: Any, timeout: int = 0):
         # Robustly extract URL and headers from urllib Request
         url_val = getattr(req, "full_url", None)
@@ -200,13 +281,58 @@ def test_acoustid_request_contains_params(
 
     monkeypatch.setattr("filebot.core.providers.acoustid.urlopen", _ok, raising=True)
     c = acoustid_client
-    c._cache_day.clear()  # type: ignore[attr-defined]
+    c._cache_short.clear()  # type: ignore[attr-defined]
     out = c.lookup(99, "abcdef")
     assert isinstance(out, dict)
     # Fixture uses test-key; replace for loose check
     assert "client=k" in captured["url"].replace("test-key", "k")
     assert "duration=99" in captured["url"]
     assert "fingerprint=abcdef" in captured["url"]
+    assert captured["url"].startswith("https://api.acoustid.org/v2/lookup?meta=")
     # Normalize header keys for case-insensitive comparison
     norm_headers = {k.lower(): v for k, v in captured["headers"].items()}
     assert norm_headers.get("accept-encoding") == "gzip"
+
+
+def test_acoustid_identify_returns_typed_matches(
+    acoustid_client: AcoustIDClient,
+) -> None:
+    c = acoustid_client
+    c._cache_short[30, "fp"] = {
+        "status": "ok",
+        "results": [
+            {"id": "low", "score": 0.2},
+            {
+                "id": "high",
+                "score": 0.95,
+                "recordings": [
+                    {
+                        "id": "rec-1",
+                        "title": "Song",
+                        "duration": 181.4,
+                        "artists": [{"name": "A"}, {"name": "B"}, {}],
+                    },
+                    {"title": "no id"},
+                    "x",
+                ],
+            },
+            "junk",
+        ],
+    }
+    matches = c.identify(30, "fp")
+    assert [m.id for m in matches] == ["high", "low"]
+    (rec,) = matches[0].recordings
+    assert rec.id == "rec-1"
+    assert rec.title == "Song"
+    assert rec.artists == ("A", "B")
+    assert rec.duration == 181
+    assert matches[1].recordings == ()
+
+
+def test_acoustid_identify_error_status_is_empty(
+    acoustid_client: AcoustIDClient,
+) -> None:
+    c = acoustid_client
+    c._cache_short[30, "bad"] = {"status": "error", "results": [{"id": "x"}]}
+    assert c.identify(30, "bad") == []
+    assert c.identify(0, "bad") == []
@@ -0,0 +1,264 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from filebot.core.models import SeriesInfo
+from filebot.core.providers.anidb import AniDBClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_TITLES_DAT = gzip.compress(b"""# aid|type|language|title
+1|1|x-jat|Kidou Senshi Gundam
+1|4|en|Mobile Suit Gundam
+2|1|x-jat|Cowboy Bebop
+3|1|x-jat|Gundam Wing
+3|2|en|New Mobile Report
+4|1|en|Tom &amp; Jerry
+""")
+
+_ANIME_XML = b"""<root><anime id="1">
+<titles>
+  <title type="main" lang="x-jat">Kidou Senshi</title>
+  <title type="official" lang="en">Mobile Suit</title>
+</titles>
+<episodes>
+  <episode id="11"><epno type="1">1</epno><airdate>1979-04-07</airdate>
+    <title lang="en">Gundam Rises</title></episode>
+  <episode id="12"><epno type="1">2</epno><title lang="en">Destroy</title></episode>
+  <episode id="13"><epno type="2">S1</epno><title lang="en">Recap</title></episode>
+  <episode id="14"><epno type="3">C1</epno><title lang="en">Opening</title></episode>
+  <episode id="15"><epno type="1">S</epno><title lang="en">No number</title></episode>
+</episodes>
+</anime></root>"""
+
+
+def test_anidb_episodes_share_one_series_info(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({"aid=1": _ANIME_XML})
+    c = AniDBClient(client="test", clientver=1)
+    eps = c.get_episode_list(1, "Absolute", "en")
+    assert [(e.episode, e.special_number) for e in eps] == [
+        (1, None),
+        (2, None),
+        (None, 1),
+    ]
+    assert eps[0].title == "Gundam Rises"
+    assert eps[0].series_name == "Mobile Suit"
+    info = eps[0].series_info
+    assert info == SeriesInfo(id=1, name="Mobile Suit")
+    assert all(e.series_info is info for e in eps)
+
+
+def test_series_info_is_immutable() -> None:
+    info = SeriesInfo(id=1, name="A")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.name = "B"  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("gundam", [1, 3]),
+        ("  MOBILE ", [1, 3]),
+        ("bebop", [2]),
+        ("ow", [2]),  # shorter than a trigram: linear scan
+        ("gundam bebop", []),
+        ("gundam mobile", [1, 3]),  # any word order when the phrase misses
+        ("suit mobile report", []),
+        ("tom & jerry", [4]),
+        ("mdnug", []),
+        ("", []),
+    ],
+)
+def test_anidb_search_uses_titles_index(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+    query: str,
+    expected: list[int],
+) -> None:
+    mock_http_bytes({"anime-titles": _TITLES_DAT})
+    c = AniDBClient(client="test", clientver=1)
+    assert [r.id for r in c.search(query, "en")] == expected
+
+
+def test_anidb_search_index_built_once(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({"anime-titles": _TITLES_DAT})
+    c = AniDBClient(client="test", clientver=1)
+    c.search("gundam", "en")
+    index = c._trigram_index
+    assert index is not None
+    assert index["gun"] == {0, 2}
+    c.search("cowboy", "en")
+    assert c._trigram_index is index
+
+
+def test_anidb_episode_title_falls_back_to_english(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({"aid=1": _ANIME_XML})
+    c = AniDBClient(client="test", clientver=1)
+    eps = c.get_episode_list(1, "Absolute", "de'x")
+    assert eps[1].title == "Destroy"
+    assert eps[0].series_name == "Kidou Senshi"  # no official title in that language
+    assert c.get_series_info(1, "en").name == "Kidou Senshi"
+
+
+def test_anidb_error_document_raises(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({"aid=9": b"<error>Banned</error>"})
+    c = AniDBClient(client="test", clientver=1)
+    with pytest.raises(RuntimeError, match="Banned"):
+        c.get_episode_list(9, "Absolute", "en")
+
+
+def test_anidb_titles_index_handles_crlf(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({"anime-titles": gzip.compress(b"5|1|en|Trigun\r\n6|1|en|Monster")})
+    c = AniDBClient(client="test", clientver=1)
+    assert [(r.id, r.name) for r in c._load_titles_index()] == [
+        (5, "Trigun"),
+        (6, "Monster"),
+    ]
+
+
+def test_anidb_series_info_reuses_episode_list_parse(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_http_bytes({"aid=1": _ANIME_XML})
+    c = AniDBClient(client="test", clientver=1)
+    c.get_episode_list(1, "Absolute", "en")
+
+    def _no_parse(self: AniDBClient, aid: int) -> None:
+        raise AssertionError(aid)
+
+    monkeypatch.setattr(AniDBClient, "_request_xml", _no_parse)
+    assert c.get_series_info(1, "en").name == "Kidou Senshi"
+
+
+def test_anidb_search_limit_stops_early(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({"anime-titles": _TITLES_DAT})
+    c = AniDBClient(client="test", clientver=1)
+    assert [r.id for r in c.search("gundam", "en", limit=1)] == [1]
+    assert [r.id for r in c.search("o", "en", limit=2)] == [1, 2]
+    assert c.search("gundam", "en", limit=0) == []
+
+
+def test_anidb_titles_index_persists_to_disk(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "cache" / "anidb_titles.json.gz"
+    mock_http_bytes({"anime-titles": _TITLES_DAT})
+    first = AniDBClient(client="test", clientver=1, titles_cache_path=path)
+    expected = first._load_titles_index()
+    assert path.exists()
+
+    # A warm start reads the file without touching the network
+    mock_http_bytes({})
+    warm = AniDBClient(client="test", clientver=1, titles_cache_path=path)
+    assert warm._load_titles_index() == expected
+    assert [r.id for r in warm.search("mobile", "en")] == [1, 3]
+
+
+def test_anidb_stale_titles_file_is_ignored(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "anidb_titles.json.gz"
+    path.write_bytes(gzip.compress(b'{"version": 1, "titles": [[9, "Old", []]]}'))
+    os.utime(path, (0, 0))
+    mock_http_bytes({"anime-titles": _TITLES_DAT})
+    c = AniDBClient(client="test", clientver=1, titles_cache_path=path)
+    assert 9 not in {r.id for r in c._load_titles_index()}
+
+
+def test_iter_gzip_lines_spans_chunks() -> None:
+    from filebot.core.providers.anidb import _iter_gzip_lines
+
+    lines = [f"{i}|1|en|Title number {i}".encode() for i in range(20000)]
+    blob = gzip.compress(b"\n".join(lines) + b"\n", compresslevel=1)
+    assert [line for line in _iter_gzip_lines(blob) if line] == lines
+
+
+def test_anidb_titles_ordered_by_type_then_language(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    dump = b"""7|2|ja|Synonym JA
+7|3|en|Short
+7|4|en|Official EN
+7|2|en|Synonym EN
+7|1|x-jat|Main Romaji
+7|4|fr|Ignored French
+"""
+    mock_http_bytes({"anime-titles": gzip.compress(dump)})
+    c = AniDBClient(client="test", clientver=1)
+    (entry,) = c._load_titles_index()
+    assert entry.name == "Main Romaji"
+    assert entry.alias_names == ("Official EN", "Synonym EN", "Synonym JA", "Short")
+
+
+def test_anidb_get_episode_lists_batches_in_input_order(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    mock_http_bytes({
+        "aid=1": _ANIME_XML,
+        "aid=9": b"<error>Banned</error>",
+        "aid=7": b"<anime id='7'><episodes><episode",
+    })
+    c = AniDBClient(client="test", clientver=1)
+    out = c.get_episode_lists([9, 1, 7, 9], "Absolute", "en")
+    assert list(out) == [9, 1, 7]
+    assert out[9] == []
+    assert out[7] == []
+    assert [e.id for e in out[1]] == [11, 12, 13]
+    assert c.get_episode_lists([], "Absolute", "en") == {}
+
+
+def test_anidb_episodes_sorted_normals_then_specials(
+    mock_http_bytes: Callable[[dict[str, bytes | None]], None],
+) -> None:
+    xml = b"""<anime id="2"><titles><title type="main" lang="x-jat">X</title></titles>
+<episodes>
+  <episode id="3"><epno type="2">S2</epno></episode>
+  <episode id="2"><epno type="1">10</epno></episode>
+  <episode id="4"><epno type="2">S1</epno></episode>
+  <episode id="1"><epno type="1">9</epno></episode>
+</episodes></anime>"""
+    mock_http_bytes({"aid=2": xml})
+    c = AniDBClient(client="test", clientver=1)
+    assert [e.id for e in c.get_episode_list(2, "Absolute", "en")] == [1, 2, 4, 3]
@@ -20,14 +20,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
+import pytest
 from cachetools import TTLCache
 
 from filebot.core.providers.base import RestClientMixin
 
 if TYPE_CHECKING:
-    import pytest
+    from pathlib import Path
 
 
 class DummyClient(RestClientMixin):
@@ -47,6 +48,9 @@ class DummyClient(RestClientMixin):
 
 def _mock_urlopen(monkeypatch: pytest.MonkeyPatch, body: bytes) -> None:
     class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
         def __init__(self, data: bytes) -> None:
             self._data = data
 
@@ -84,6 +88,9 @@ def test_http_get_json_cache_and_limiter(monkeypatch: pytest.MonkeyPatch) -> Non
     calls = {"n": 0}
 
     class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
         def __init__(self) -> None:
             pass
 
@@ -135,6 +142,9 @@ def test_http_get_json_headers_and_cache_key(monkeypatch: pytest.MonkeyPatch) ->
     calls = {"n": 0, "last_req": None}
 
     class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
         def read(self) -> bytes:
             calls["n"] += 1
             return b"{}"
@@ -209,6 +219,9 @@ def test_http_get_bytes_scheme_guards_and_identity_cache(
 
     # Allowed host passes; identity cached in long vs short cache is per long_ttl flag
     class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
         def __init__(self, data: bytes) -> None:
             self._data = data
 
@@ -250,6 +263,9 @@ def test_http_get_json_error_paths(monkeypatch: pytest.MonkeyPatch) -> None:
 
     # JSON decode error
     class _Bad:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
         def read(self) -> bytes:
             return b"not-json"
 
@@ -306,3 +322,358 @@ def test_init_rest_sets_attributes() -> None:
     c2 = _C()
     c2._init_rest(short_ttl=1, long_ttl=2, rate=(1, 0.1))
     assert hasattr(c2, "_limiter")
+
+
+def test_init_rest_shares_caches_per_provider_class() -> None:
+    class _A(RestClientMixin):
+        pass
+
+    class _B(RestClientMixin):
+        pass
+
+    a1, a2, b = _A(), _A(), _B()
+    for c in (a1, a2, b):
+        c._init_rest(short_ttl=60, long_ttl=120)
+    assert a1._cache_short is a2._cache_short
+    assert a1._cache_long is a2._cache_long
+    assert a1._cache_short is not a1._cache_long
+    assert a1._cache_short is not b._cache_short
+
+    a1._cache_short["k"] = {"v": 1}
+    assert a2._cache_short.get("k") == {"v": 1}
+    assert b._cache_short.get("k") is None
+
+
+def test_http_get_without_rate_limit_uses_noop_limiter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _Unlimited(RestClientMixin):
+        def __init__(self) -> None:
+            self._cache_short = TTLCache(maxsize=4, ttl=60)
+            self._cache_long = TTLCache(maxsize=4, ttl=60)
+
+    _mock_urlopen(monkeypatch, b"payload")
+    client = _Unlimited()
+    assert client._http_get_bytes("https://example.com/raw") == b"payload"
+    assert client._http_get_json("https://example.com/j") == {}  # not JSON
+
+
+@pytest.mark.parametrize(
+    ("url", "require_https", "hosts", "expected"),
+    [
+        ("https://api.example.com/x", True, None, True),
+        ("http://api.example.com/x", True, None, False),
+        ("http://api.example.com/x", False, frozenset({"api.example.com"}), True),
+        ("http://other.example.com/x", False, frozenset({"api.example.com"}), False),
+        ("ftp://api.example.com/x", False, None, False),
+    ],
+)
+def test_url_permitted_policy(
+    url: str, require_https: bool, hosts: frozenset[str] | None, expected: bool
+) -> None:
+    from filebot.core.providers.base import _url_permitted
+
+    assert _url_permitted(url, require_https, hosts) is expected
+    before = _url_permitted.cache_info().hits
+    assert _url_permitted(url, require_https, hosts) is expected
+    assert _url_permitted.cache_info().hits == before + 1
+
+
+def test_http_get_bytes_cache_hit_is_zero_copy(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = b"x" * 4096
+    _mock_urlopen(monkeypatch, body)
+    client = DummyClient()
+    first = client._http_get_bytes("https://example.com/blob", long_ttl=True)
+    second = client._http_get_bytes("https://example.com/blob", long_ttl=True)
+    assert first is body
+    assert second is first
+
+
+def test_http_get_json_decodes_bytes_and_rejects_bad_encoding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = DummyClient()
+    _mock_urlopen(monkeypatch, '{"t": "Amélie"}'.encode())
+    assert client._http_get_json("https://example.com/ok") == {"t": "Amélie"}
+
+    # Invalid UTF-8 is logged and swallowed like any other decode failure
+    _mock_urlopen(monkeypatch, b'{"t": "\xff\xfe\xfa"}')
+    assert client._http_get_json("https://example.com/bad") == {}
+
+
+def test_http_get_json_requests_and_inflates_gzip(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import gzip
+
+    client = DummyClient()
+    seen: dict[str, Any] = {}
+
+    class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
+        def read(self) -> bytes:
+            return gzip.compress(b'{"z": 1}')
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:  # pragma: no cover - trivial
+            return None
+
+    def _factory(req: Any, timeout: int = 0) -> _Resp:
+        seen["headers"] = {k.lower(): v for k, v in req.header_items()}
+        return _Resp()
+
+    monkeypatch.setattr("filebot.core.providers.base.urlopen", _factory, raising=True)
+    assert client._http_get_json("https://example.com/gz") == {"z": 1}
+    assert seen["headers"]["accept-encoding"] == "gzip"
+
+    # Corrupt gzip bodies are treated like any other failed request
+    _mock_urlopen(monkeypatch, b"\x1f\x8bnot-gzip")
+    assert client._http_get_json("https://example.com/bad-gz") == {}
+
+
+def test_http_get_json_coalesces_concurrent_identical_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = DummyClient()
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"n": 0}
+
+    class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {}
+
+        def read(self) -> bytes:
+            return b'{"v": 1}'
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:  # pragma: no cover - trivial
+            return None
+
+    def _factory(req: Any, timeout: int = 0) -> _Resp:
+        calls["n"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return _Resp()
+
+    monkeypatch.setattr("filebot.core.providers.base.urlopen", _factory, raising=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(client._http_get_json, "https://example.com/same")
+        assert started.wait(timeout=5)
+        followers = [
+            pool.submit(client._http_get_json, "https://example.com/same")
+            for _ in range(3)
+        ]
+        release.set()
+        results = [leader.result(), *(f.result() for f in followers)]
+
+    assert results == [{"v": 1}] * 4
+    assert calls["n"] == 1
+    assert client._limiter.calls == 1  # type: ignore[attr-defined]
+
+
+def test_http_get_json_remembers_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
+    from urllib.error import HTTPError
+
+    client = DummyClient()
+    calls = {"n": 0}
+    status = {"code": 404}
+
+    def _raise(req: Any, timeout: int = 0) -> None:
+        calls["n"] += 1
+        raise HTTPError(req.full_url, status["code"], "err", None, None)  # type: ignore[arg-type]
+
+    monkeypatch.setattr("filebot.core.providers.base.urlopen", _raise, raising=True)
+    assert client._http_get_json("https://example.com/missing") == {}
+    assert client._http_get_json("https://example.com/missing") == {}
+    assert client._http_get_bytes("https://example.com/missing") is None
+    assert calls["n"] == 1
+
+    # Transient server errors are retried on the next call
+    status["code"] = 503
+    client._http_get_json("https://example.com/flaky")
+    client._http_get_json("https://example.com/flaky")
+    assert calls["n"] == 3
+
+
+def test_http_get_json_disk_tier_survives_memory_loss(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from filebot.core.providers.cache import configure_disk_cache
+
+    configure_disk_cache(tmp_path / "responses.sqlite3")
+    _mock_urlopen(monkeypatch, b'{"v": 1}')
+    assert DummyClient()._http_get_json("https://example.com/d") == {"v": 1}
+
+    # A fresh client with empty memory caches is served from disk
+    def _fail(req: Any, timeout: int = 0) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr("filebot.core.providers.base.urlopen", _fail, raising=True)
+    client = DummyClient()
+    assert client._http_get_json("https://example.com/d") == {"v": 1}
+    assert client._cache_short["https://example.com/d"] == {"v": 1}
+    assert client._limiter.calls == 0  # type: ignore[attr-defined]
+
+
+def test_http_get_json_revalidates_expired_long_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent: list[dict[str, str]] = []
+    reply = {"status": 200, "body": b'{"v": 1}'}
+
+    class _Resp:
+        headers: ClassVar[dict[str, str]] = {"ETag": '"abc"'}
+
+        def __init__(self) -> None:
+            self.status = reply["status"]
+
+        def read(self) -> bytes:
+            return reply["body"]
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:  # pragma: no cover - trivial
+            return None
+
+    def _factory(req: Any, timeout: int = 0) -> _Resp:
+        sent.append({k.lower(): v for k, v in req.header_items()})
+        return _Resp()
+
+    monkeypatch.setattr("filebot.core.providers.base.urlopen", _factory, raising=True)
+    client = DummyClient()
+    first = client._http_get_json("https://example.com/e", long_ttl=True)
+    assert first == {"v": 1}
+    assert "if-none-match" not in sent[0]
+
+    # Entry expired: the stored ETag is sent and a 304 reuses the kept body
+    client._cache_long.clear()
+    reply.update(status=304, body=b"")
+    assert client._http_get_json("https://example.com/e", long_ttl=True) == first
+    assert sent[1]["if-none-match"] == '"abc"'
+    assert client._cache_long["https://example.com/e"] == first
+
+
+def test_http_get_json_304_renews_validators(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import gzip
+    import time
+
+    from filebot.core.providers import base as base_mod
+    from filebot.core.providers.cache import configure_disk_cache
+
+    class _Resp:
+        status = 304
+        headers: ClassVar[dict[str, str]] = {}
+
+        def read(self) -> bytes:
+            return b""
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:  # pragma: no cover - trivial
+            return None
+
+    monkeypatch.setattr(
+        "filebot.core.providers.base.urlopen", lambda req, timeout=0: _Resp()
+    )
+    key = f"{DummyClient.__module__}.{DummyClient.__qualname__}|https://example.com/r"
+    stale = ({"If-None-Match": '"x"'}, gzip.compress(b'{"v": 2}'))
+    # Validators about to expire in a second
+    base_mod._validators._data[key] = (time.monotonic() + 1, stale)
+    disk = configure_disk_cache(tmp_path / "c.sqlite3")
+    assert disk is not None
+    assert DummyClient()._http_get_json("https://example.com/r") == {"v": 2}
+    assert base_mod._validators._data[key][0] > time.monotonic() + 60
+    assert base_mod._validators[key] is stale
+    # The revalidated body is written back to the disk tier
+    assert disk.get(key) == b'{"v": 2}'
+
+
+def test_validators_keep_bytes_not_payloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    from filebot.core.providers import base as base_mod
+
+    class _Resp:
+        status = 200
+        headers: ClassVar[dict[str, str]] = {"Last-Modified": "Mon, 01 Jan 2024"}
+
+        def read(self) -> bytes:
+            return b'{"v": 3}'
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:  # pragma: no cover - trivial
+            return None
+
+    monkeypatch.setattr(
+        "filebot.core.providers.base.urlopen", lambda req, timeout=0: _Resp()
+    )
+    assert DummyClient()._http_get_json("https://example.com/b") == {"v": 3}
+    key = f"{DummyClient.__module__}.{DummyClient.__qualname__}|https://example.com/b"
+    conditional, body = base_mod._validators[key]
+    assert conditional == {"If-Modified-Since": "Mon, 01 Jan 2024"}
+    assert isinstance(body, bytes)
+    assert body[:2] == b"\x1f\x8b"
+
+
+def test_http_get_json_revalidates_through_environment_proxy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    seen: list[str | None] = []
+
+    class _Proxy(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            seen.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            body = b'{"ok": 1}'
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            return None
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Proxy)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    # urllib raises HTTPError for a 304 on the proxied path
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{httpd.server_address[1]}")
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    try:
+        client = DummyClient()
+        kwargs: dict[str, Any] = {
+            "require_https": False,
+            "allowed_http_hosts": {"provider.invalid"},
+            "timeout": 5,
+        }
+        for _ in range(3):
+            assert client._http_get_json("http://provider.invalid/x", **kwargs) == {
+                "ok": 1
+            }
+            client._cache_short.clear()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert seen == [None, '"v1"', '"v1"']
@@ -0,0 +1,134 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+from filebot.core.providers import cache as cache_mod
+from filebot.core.providers.cache import (
+    DiskCache,
+    ExpiringLRUCache,
+    configure_disk_cache,
+    disk_cache,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_expiring_lru_cache_expires_on_read(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    c = ExpiringLRUCache(maxsize=4, ttl=10)
+    c["k"] = {"v": 1}
+    assert c.get("k") == {"v": 1}
+    assert "k" in c
+    now[0] = 110.0
+    assert c.get("k") is None
+    assert "k" not in c
+    assert len(c) == 0
+
+
+def test_expiring_lru_cache_evicts_least_recently_used() -> None:
+    c = ExpiringLRUCache(maxsize=2, ttl=60)
+    c["a"] = 1
+    c["b"] = 2
+    assert c["a"] == 1  # touch "a" so "b" is the LRU entry
+    c["c"] = 3
+    assert "b" not in c
+    assert sorted(c) == ["a", "c"]
+    assert c.maxsize == 2
+    assert c.ttl == 60
+
+
+def test_expiring_lru_cache_concurrent_readers_and_writers() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    c = ExpiringLRUCache(maxsize=32, ttl=60)
+
+    def _work(seed: int) -> None:
+        for i in range(2000):
+            key = (seed * 7 + i) % 64
+            if i % 3:
+                value = c.get(key)
+                assert value is None or value == key
+            else:
+                c[key] = key
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_work, range(8)))
+    assert len(c) <= 32
+    assert all(c.get(k) in {None, k} for k in range(64))
+
+
+def test_disk_cache_round_trip_and_expiry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    disk = DiskCache(tmp_path / "sub" / "c.sqlite3")
+    disk.set("a", b"1", ttl=10)
+    assert disk.get("a") == b"1"
+    assert disk.get("missing") is None
+
+    now = cache_mod.time.time()
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now + 11)
+    assert disk.get("a") is None
+    disk.close()
+
+
+def test_disk_cache_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "c.sqlite3"
+    first = DiskCache(path)
+    first.set("k", b"v", ttl=60)
+    first.close()
+    second = DiskCache(path)
+    assert second.get("k") == b"v"
+    second.clear()
+    assert second.get("k") is None
+    second.close()
+
+
+def test_disk_cache_does_not_store_plain_keys(tmp_path: Path) -> None:
+    path = tmp_path / "c.sqlite3"
+    disk = DiskCache(path)
+    disk.set("https://example.com/x?api_key=secret", b"v", ttl=60)
+    assert disk.get("https://example.com/x?api_key=secret") == b"v"
+    disk.close()
+    with sqlite3.connect(path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM entries")]
+    assert keys
+    assert all("secret" not in k for k in keys)
+
+
+def test_configure_disk_cache_disables_tier_on_open_failure(tmp_path: Path) -> None:
+    corrupt = tmp_path / "corrupt.sqlite3"
+    corrupt.write_bytes(b"this is not a database" * 100)
+    assert configure_disk_cache(corrupt) is None
+    assert disk_cache() is None
+
+    # Parent "directory" is a regular file, so it cannot be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("x")
+    assert configure_disk_cache(blocker / "responses.sqlite3") is None
+    assert disk_cache() is None
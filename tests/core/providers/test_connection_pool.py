@@ -0,0 +1,161 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test the keep-alive connection pool against a local HTTP/1.1 server."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import pytest
+
+from filebot.core.providers.connection_pool import ConnectionPool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: list[int] = []  # noqa: RUF012 - shared across handler instances
+    paths: list[str] = []  # noqa: RUF012 - shared across handler instances
+
+    def do_GET(self) -> None:
+        self.peers.append(self.client_address[1])
+        self.paths.append(self.path)
+        if self.path == "/missing":
+            self._reply(404, b"nope")
+        elif self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._reply(200, b'{"ok": 1}')
+
+    def _reply(self, code: int, body: bytes) -> None:
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    _Handler.peers = []
+    _Handler.paths = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_connection_is_reused(server: str) -> None:
+    pool = ConnectionPool()
+    for _ in range(3):
+        with pool.urlopen(Request(server + "/ok"), timeout=5) as resp:
+            assert resp.status == 200
+            assert resp.read() == b'{"ok": 1}'
+    # All requests arrived over the same client socket
+    assert len(set(_Handler.peers)) == 1
+    pool.clear()
+
+
+def test_http_error_raised_and_connection_kept(server: str) -> None:
+    pool = ConnectionPool()
+    with pytest.raises(HTTPError) as info:
+        pool.urlopen(server + "/missing", timeout=5)
+    assert info.value.code == 404
+    assert info.value.read() == b"nope"
+    with pool.urlopen(server + "/ok", timeout=5) as resp:
+        assert resp.read() == b'{"ok": 1}'
+    assert len(set(_Handler.peers)) == 1
+    pool.clear()
+
+
+def test_redirect_is_followed(server: str) -> None:
+    pool = ConnectionPool()
+    with pool.urlopen(server + "/redirect", timeout=5) as resp:
+        assert resp.status == 200
+        assert resp.url.endswith("/ok")
+    pool.clear()
+
+
+def test_unsupported_scheme_and_refused_connection() -> None:
+    pool = ConnectionPool()
+    with pytest.raises(URLError):
+        pool.urlopen("ftp://example.com/x", timeout=1)
+    with pytest.raises(URLError):
+        pool.urlopen("http://127.0.0.1:9/x", timeout=1)
+
+
+def test_environment_proxy_is_honored(
+    server: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The test server doubles as the proxy: it sees the absolute request URI
+    monkeypatch.setenv("http_proxy", server)
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    pool = ConnectionPool()
+    with pool.urlopen("http://provider.invalid/ok", timeout=5) as resp:
+        assert resp.status == 200
+        assert resp.read() == b'{"ok": 1}'
+    assert _Handler.paths == ["http://provider.invalid/ok"]
+
+
+def test_no_proxy_hosts_use_the_pool(
+    server: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    pool = ConnectionPool()
+    with pool.urlopen(server + "/ok", timeout=5) as resp:
+        assert resp.read() == b'{"ok": 1}'
+    assert _Handler.paths == ["/ok"]
+    pool.clear()
+
+
+def test_proxy_settings_are_read_per_request(
+    server: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    pool = ConnectionPool()
+    # A dead proxy used first must not stick for later requests
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    with pytest.raises(URLError):
+        pool.urlopen("http://provider.invalid/ok", timeout=5)
+    monkeypatch.setenv("http_proxy", server)
+    with pool.urlopen("http://provider.invalid/ok", timeout=5) as resp:
+        assert resp.read() == b'{"ok": 1}'
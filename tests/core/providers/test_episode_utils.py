@@ -24,10 +24,12 @@ import pytest
 
 from filebot.core.models import Episode, MultiEpisode, SeriesInfo
 from filebot.core.providers.episode_utils import (
+    build_absolute_index,
     create_episode,
     episode_numbers_key,
     get_multi_episode_list,
     match_by_absolute,
+    match_many_by_absolute,
 )
 
 
@@ -164,3 +166,38 @@ def test_match_by_absolute_duplicate_candidates_do_not_break_selection() -> None
         Episode("S", None, None, special_number=99, absolute=2),  # ignored special
     ]
     assert match_by_absolute(src, candidates) is None
+
+
+def test_build_absolute_index_skips_specials_and_marks_duplicates() -> None:
+    candidates = [
+        _ep(1),
+        _ep(2),
+        _ep(2),
+        Episode("S", None, None, special_number=1, absolute=3),
+    ]
+    index = build_absolute_index(candidates)
+    assert index == {1: candidates[0], 2: None}
+
+
+def test_match_many_by_absolute_reuses_index() -> None:
+    candidates = [_ep(1), _ep(2), _ep(3)]
+    sources = [_ep(2), MultiEpisode([_ep(1), _ep(3)]), _ep(9)]
+    out = match_many_by_absolute(sources, candidates)
+    assert isinstance(out[0], Episode)
+    assert out[0].absolute == 2
+    assert isinstance(out[1], MultiEpisode)
+    assert [e.absolute for e in out[1].get_episodes()] == [1, 3]
+    assert out[2] is None
+    # A prebuilt index is accepted directly
+    matched = match_by_absolute(_ep(3), build_absolute_index(candidates))
+    assert matched is not None
+    assert matched.absolute == 3
+
+
+def test_match_many_by_absolute_ignores_unwanted_duplicates() -> None:
+    # Ambiguity only matters for numbers a source asks for
+    candidates = [_ep(n) for n in range(1, 500)] + [_ep(300)]
+    out = match_many_by_absolute(iter([_ep(4), _ep(300)]), candidates)
+    assert out[0] is not None
+    assert out[0].absolute == 4
+    assert out[1] is None
@@ -0,0 +1,57 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test lazy provider exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import filebot.core.providers as providers
+
+
+def test_package_import_defers_client_modules() -> None:
+    code = (
+        "import sys\n"
+        "import filebot.core\n"
+        "import filebot.core.providers\n"
+        "loaded = [m for m in sys.modules if m.startswith('filebot.core.providers.')]\n"
+        "assert 'filebot.core.registry' not in sys.modules, loaded\n"
+        "assert 'filebot.core.providers.tvdb' not in sys.modules, loaded\n"
+        "assert 'filebot.core.providers.acoustid' not in sys.modules, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_client_access_resolves_and_caches() -> None:
+    from filebot.core.providers.tvmaze import TVMazeClient
+
+    assert providers.TVMazeClient is TVMazeClient
+    assert "TVMazeClient" in vars(providers)
+    assert "TheTVDBClient" in dir(providers)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        _ = providers.DoesNotExist  # type: ignore[attr-defined]
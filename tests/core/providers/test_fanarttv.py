@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from filebot.core.providers.fanarttv import FanartTVClient
+from filebot.core.providers.fanarttv import FanartTVClient, _to_float
 
 if TYPE_CHECKING:  # type-only import to satisfy linter rule
     from filebot.core.models import Artwork
@@ -134,3 +134,25 @@ def test_get_artwork_unknown_fields_do_not_crash(mock_http_json) -> None:
     assert urls == {"https://x/w1.jpg", "https://x/w2.jpg", "https://x/w3.jpg"}
     # All with None rating when likes is invalid/None
     assert all(a.rating is None for a in out)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(3, 3.0), (2.5, 2.5), ("7", 7.0), ("bad", None), (None, None), ([1], None)],
+)
+def test_to_float(value: object, expected: float | None) -> None:
+    assert _to_float(value) == expected
+
+
+def test_get_artwork_batch_dedupes_and_keys_by_id(mock_http_json) -> None:
+    mock_http_json({
+        "v3/movies/1?": {"movieposter": [{"url": "https://x/1.jpg"}]},
+        "v3/movies/2?": {"movieposter": [{"url": "https://x/2.jpg"}]},
+    })
+    c = FanartTVClient(apikey="k")
+    out = c.get_artwork_batch([2, 1, 2, 3], "movies", "en")
+    assert list(out) == [2, 1, 3]
+    assert [a.url for a in out[1]] == ["https://x/1.jpg"]
+    assert [a.url for a in out[2]] == ["https://x/2.jpg"]
+    assert out[3] == []
+    assert c.get_artwork_batch([], "movies", "en") == {}
@@ -61,6 +61,9 @@ def test_search_movie_filters_and_parses(mock_http_json) -> None:
                 {"Type": "series", "Title": "S"},
                 # malformed item still yielded by implementation (empty title)
                 {"Type": "movie", "Title": None, "Year": "not-year", "imdbID": "bad"},
+                # non-dict items and non-string types are skipped
+                "junk",
+                {"Type": None, "Title": "N"},
             ]
         }
     })
@@ -128,3 +131,20 @@ def test_get_movie_descriptor_preserves_original_year_when_invalid(
     out = c.get_movie_descriptor(m, "en")
     assert out is not None
     assert out.year == 1999
+
+
+def test_lookups_use_long_cache_and_searches_short(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[tuple[str, bool]] = []
+
+    def _fake(self: OMDbClient, url: str, **kwargs: object) -> dict:
+        seen.append(("i=" in url, bool(kwargs.get("long_ttl"))))
+        return {}
+
+    monkeypatch.setattr(OMDbClient, "_http_get_json", _fake, raising=True)
+    c = OMDbClient(apikey="k")
+    c.search_movie("X", "en")
+    c.get_movie_descriptor(Movie(name="?", imdb_id=1), "en")
+    assert seen == [(False, False), (True, True)]
+    assert c._cache_short.ttl < c._cache_long.ttl
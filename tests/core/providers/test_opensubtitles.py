@@ -22,7 +22,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from filebot.core.providers.opensubtitles import OpenSubtitlesClient
+import pytest
+
+from filebot.core.providers.opensubtitles import OpenSubtitlesClient, _parse_imdb_id
 
 if TYPE_CHECKING:  # pragma: no cover - types only
     from pathlib import Path
@@ -76,3 +78,51 @@ def test_opensubtitles_search_best(tmp_path: Path, mock_http_json) -> None:
     out = c.search_best(str(video), tag="C")
     assert out
     assert out[0].name == "C.srt"
+
+
+def test_opensubtitles_search_parses_full_and_sparse_items(mock_http_json) -> None:
+    mock_http_json({
+        "/search/query-": [
+            {
+                "SubFileName": " Full.srt ",
+                "SubLanguageID": "fr",
+                "IDMovieImdb": "7",
+                "ZipDownloadLink": "",
+                "SubDownloadLink": "https://sub",
+            },
+            {"SubDownloadLink": "https://sparse"},
+            "junk",
+        ]
+    })
+    c = OpenSubtitlesClient(app_name="App", app_version="1.0")
+    res = c.search("Tag")
+    assert [(r.name, r.lang, r.imdb_id, r.url) for r in res] == [
+        ("Full.srt", "fr", 7, "https://sub"),
+        ("Tag", None, None, "https://sparse"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (123, 123),
+        ("0042", 42),
+        (-1, None),
+        (True, None),
+        ("tt1", None),
+        ("²", None),
+        (None, None),
+    ],
+)
+def test_parse_imdb_id(raw: object, expected: int | None) -> None:
+    assert _parse_imdb_id(raw) == expected
+
+
+def test_opensubtitles_search_limit_stops_early(mock_http_json) -> None:
+    mock_http_json({
+        "/search/query-": [{"SubFileName": f"{i}.srt"} for i in range(100)]
+    })
+    c = OpenSubtitlesClient(app_name="App", app_version="1.0")
+    assert [r.name for r in c.search("T", limit=2)] == ["0.srt", "1.srt"]
+    assert len(c.search("T")) == 100
+    assert c.search("T", limit=0) == []
@@ -39,6 +39,16 @@ def test_identifier_and_language_normalization() -> None:
     assert _normalize_language("in_ID") == "id-ID"
 
 
+def test_query_helpers_are_memoized() -> None:
+    _normalize_language.cache_clear()
+    _split_name_and_year.cache_clear()
+    for _ in range(3):
+        assert _normalize_language("fr_FR") == "fr-FR"
+        assert _split_name_and_year("Heat (1995)") == ("Heat", 1995)
+    assert _normalize_language.cache_info().hits == 2
+    assert _split_name_and_year.cache_info().hits == 2
+
+
 @pytest.mark.parametrize(
     ("query", "expected_name", "expected_year"),
     [
@@ -82,13 +92,18 @@ def test_tmdb_search_movie_parses_results(mock_http_json) -> None:
                 {"id": 10, "title": "A", "release_date": "2001-01-01"},
                 {"id": 11, "original_title": "B"},
                 {"id": "x"},  # skipped
+                {"id": True},  # skipped
+                {"id": "²"},  # skipped
+                "junk",  # skipped
+                {"id": "12", "title": "C", "release_date": "n/a"},
             ]
         }
     })
     c = TMDbClient(apikey="k")
     out = c.search_movie("A 2001", "en-US")
-    assert [m.tmdb_id for m in out] == [10, 11]
+    assert [m.tmdb_id for m in out] == [10, 11, 12]
     assert out[0].year == 2001
+    assert out[2].year is None
     assert out[0].language == "en-US"
 
 
@@ -123,6 +138,23 @@ def test_get_movie_descriptor_via_imdb_find_then_fetch(mock_http_json) -> None:
     assert out.imdb_id == 123
 
 
+def test_get_movie_descriptors_batch_keeps_input_order(mock_http_json) -> None:
+    mock_http_json({
+        "api.themoviedb.org/3/find/tt0000123": {"movie_results": [{"id": 77}]},
+        "api.themoviedb.org/3/movie/77": {"title": "Z"},
+        "api.themoviedb.org/3/movie/42": {"title": "X"},
+    })
+    c = TMDbClient(apikey="k")
+    movies = [
+        Movie(name="?", imdb_id=123),
+        Movie(name="?"),
+        Movie(name="?", tmdb_id=42),
+    ]
+    out = c.get_movie_descriptors(movies, "en")
+    assert [m.name if m else None for m in out] == ["Z", None, "X"]
+    assert c.get_movie_descriptors([], "en") == []
+
+
 def test_get_movie_descriptor_missing_ids_returns_none(mock_http_json) -> None:
     mock_http_json({})
     c = TMDbClient(apikey="k")
@@ -156,3 +188,32 @@ def test_request_json_long_ttl_for_non_search(
     # Non-search path should set long_ttl True
     c._request_json("movie/1", {}, "en-US")
     assert captured.get("long_ttl") is True
+
+
+@pytest.mark.parametrize(
+    ("path", "params", "locale"),
+    [
+        ("search/movie", {"query": "Amélie & co", "year": 2001}, "fr_FR"),
+        ("movie/42", {}, "en-US"),
+        ("find/tt0000123", {"external_source": "imdb_id"}, ""),
+    ],
+)
+def test_request_json_url_matches_urlencode(
+    monkeypatch: pytest.MonkeyPatch, path: str, params: dict, locale: str
+) -> None:
+    from urllib.parse import urlencode
+
+    captured: dict[str, str] = {}
+
+    def fake_http(self, url: str, **kwargs):  # type: ignore[override]
+        captured["url"] = url
+        return {}
+
+    monkeypatch.setattr(TMDbClient, "_http_get_json", fake_http, raising=True)
+    c = TMDbClient(apikey="k+y")
+    c._request_json(path, params, locale)
+    query = {"api_key": "k+y"}
+    if locale:
+        query["language"] = _normalize_language(locale)
+    expected = "https://api.themoviedb.org/3/" + path + "?" + urlencode(query | params)
+    assert captured["url"] == expected
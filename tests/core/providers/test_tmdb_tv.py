@@ -22,8 +22,8 @@ from __future__ import annotations
 
 import pytest
 
-from filebot.core.models import SearchResult
-from filebot.core.providers.tmdb_tv import TMDbTVClient, _split_name_and_year
+from filebot.core.models import Episode, SearchResult
+from filebot.core.providers.tmdb_tv import TMDbTVClient, _split_name_and_year, _to_int
 
 
 def test_identifier_and_season_support() -> None:
@@ -39,6 +39,8 @@ def test_identifier_and_season_support() -> None:
         ("Breaking Bad", "Breaking Bad", None),
         ("Show 20x5", "Show 20x5", None),
         ("  Extra spaces 1999 ", "Extra spaces", 1999),
+        ("1999", "1999", None),
+        ("Room 1408", "Room 1408", None),
     ],
 )
 def test_split_name_and_year(
@@ -79,27 +81,30 @@ def test_tmdb_tv_search_uses_language_and_year(
 
 def test_tmdb_tv_get_episode_list_and_info(mock_http_json) -> None:
     mock_http_json({
-        "tv/100/season/0": {
-            "episodes": [
-                {
-                    "id": 1,
-                    "episode_number": 1,
-                    "season_number": 0,
-                    "name": "Sp1",
-                    "air_date": "2020-01-01",
-                }
-            ]
-        },
-        "tv/100/season/1": {
-            "episodes": [
-                {
-                    "id": 2,
-                    "episode_number": 1,
-                    "season_number": 1,
-                    "name": "E1",
-                    "air_date": "2020-01-02",
-                }
-            ]
+        # Seasons arrive bundled via append_to_response
+        "tv/100?api_key=k&language=en&append_to_response": {
+            "season/0": {
+                "episodes": [
+                    {
+                        "id": 1,
+                        "episode_number": 1,
+                        "season_number": 0,
+                        "name": "Sp1",
+                        "air_date": "2020-01-01",
+                    }
+                ]
+            },
+            "season/1": {
+                "episodes": [
+                    {
+                        "id": 2,
+                        "episode_number": 1,
+                        "season_number": 1,
+                        "name": "E1",
+                        "air_date": "2020-01-02",
+                    }
+                ]
+            },
         },
         "tv/100?": {
             "name": "S",
@@ -126,34 +131,37 @@ def test_tmdb_tv_get_episode_list_and_info(mock_http_json) -> None:
 def test_tmdb_tv_get_episode_list_parsing_edge_cases(mock_http_json) -> None:
     # Mix invalid numbers, missing ids, empty seasons, and None values
     mock_http_json({
-        "tv/200/season/1": {
-            "episodes": [
-                {
-                    "id": None,
-                    "episode_number": "x",
-                    "season_number": "1",
-                    "name": "E?",
-                    "air_date": None,
-                },
-                {
-                    "id": "3",
-                    "episode_number": 2,
-                    "season_number": 1,
-                    "name": "E2",
-                    "air_date": "2020-02-02",
-                },
-            ]
-        },
-        "tv/200/season/0": {
-            "episodes": [
-                {
-                    "id": "bad",
-                    "episode_number": "not-int",
-                    "season_number": 0,
-                    "name": "Sp?",
-                    "air_date": "2020-01-01",
-                }
-            ]
+        # Seasons arrive bundled via append_to_response
+        "tv/200?api_key=k&language=en&append_to_response": {
+            "season/1": {
+                "episodes": [
+                    {
+                        "id": None,
+                        "episode_number": "x",
+                        "season_number": "1",
+                        "name": "E?",
+                        "air_date": None,
+                    },
+                    {
+                        "id": "3",
+                        "episode_number": 2,
+                        "season_number": 1,
+                        "name": "E2",
+                        "air_date": "2020-02-02",
+                    },
+                ]
+            },
+            "season/0": {
+                "episodes": [
+                    {
+                        "id": "bad",
+                        "episode_number": "not-int",
+                        "season_number": 0,
+                        "name": "Sp?",
+                        "air_date": "2020-01-01",
+                    }
+                ]
+            },
         },
         "tv/200?": {
             "name": "S2",
@@ -197,10 +205,10 @@ def test_tmdb_tv_get_series_info_parsing(mock_http_json) -> None:
     c = TMDbTVClient(apikey="k")
     info = c.get_series_info(300, "en")
     assert info.name == "Name"
-    assert info.alias_names == ["Original"]
+    assert info.alias_names == ("Original",)
     assert info.status == "Returning Series"
     assert info.runtime == 45
-    assert info.genres == ["Drama"]
+    assert info.genres == ("Drama",)
     assert info.network == "HBO"
 
 
@@ -208,3 +216,83 @@ def test_tmdb_tv_public_link() -> None:
     c = TMDbTVClient(apikey="k")
     s = SearchResult(id=7, name="S")
     assert c.get_episode_list_link(s) == "https://www.themoviedb.org/tv/7"
+
+
+def test_tmdb_tv_get_episode_list_bundles_seasons_in_chunks_of_20(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from urllib.parse import parse_qs, urlsplit
+
+    appended: list[list[str]] = []
+
+    def fake_http(self, url: str, **kwargs):  # type: ignore[override]
+        query = parse_qs(urlsplit(url).query)
+        if "append_to_response" not in query:
+            return {
+                "name": "S",
+                "seasons": [{"season_number": n} for n in range(1, 26)],
+            }
+        keys = query["append_to_response"][0].split(",")
+        appended.append(keys)
+        return {
+            key: {"episodes": [{"id": int(key[7:]), "season_number": int(key[7:])}]}
+            for key in keys
+        }
+
+    monkeypatch.setattr(TMDbTVClient, "_http_get_json", fake_http, raising=True)
+    eps = TMDbTVClient(apikey="k").get_episode_list(7, "Airdate", "en")
+    assert [e.season for e in eps] == list(range(1, 26))
+    assert sorted(len(keys) for keys in appended) == [5, 20]
+    assert appended[0][0] in {"season/1", "season/21"}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (5, 5),
+        ("12", 12),
+        (" -3 ", -3),
+        ("", None),
+        ("--1", None),
+        ("1.5", None),
+        (None, None),
+        (True, None),
+        (2.0, None),
+    ],
+)
+def test_to_int(value: object, expected: int | None) -> None:
+    assert _to_int(value) == expected
+
+
+def test_tmdb_tv_get_episode_lists_batches_in_input_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[int] = []
+
+    def fake_list(self, series, order, locale):
+        calls.append(series)
+        return [Episode(series_name="S", season=1, episode=series)]
+
+    monkeypatch.setattr(TMDbTVClient, "get_episode_list", fake_list)
+    c = TMDbTVClient(apikey="k")
+    out = c.get_episode_lists([3, 1, 3], "Airdate", "en")
+    assert list(out) == [3, 1]
+    assert [e.episode for e in out[3]] == [3]
+    assert sorted(calls) == [1, 3]
+    assert c.get_episode_lists([], "Airdate", "en") == {}
+
+
+def test_tmdb_tv_episodes_share_interned_series_name(mock_http_json) -> None:
+    mock_http_json({
+        "tv/5?api_key=k&language=en&append_to_response": {
+            "season/1": {
+                "episodes": [
+                    {"id": 1, "episode_number": 1, "season_number": 1},
+                    {"id": 2, "episode_number": 2, "season_number": 1},
+                ]
+            },
+        },
+        "tv/5": {"name": "Interned Show", "seasons": [{"season_number": 1}]},
+    })
+    eps = TMDbTVClient(apikey="k").get_episode_list(5, "Airdate", "en")
+    assert eps[0].series_name is eps[1].series_name is eps[0].series_info.name
@@ -20,11 +20,21 @@
 
 from __future__ import annotations
 
+import io
 from typing import cast
 
 import pytest
 
-from filebot.core.providers.tvdb import TheTVDBClient, _normalize_language
+from filebot.core.models import Episode, SearchResult
+from filebot.core.providers.tvdb import (
+    TheTVDBClient,
+    _airdate_number,
+    _derive_numbering,
+    _normalize_language,
+)
+
+# Captured before the autouse fixture replaces it
+_real_get_token = TheTVDBClient._get_token
 
 
 @pytest.fixture(autouse=True)
@@ -86,7 +96,7 @@ def test_search_series_and_series_info(mock_http_json) -> None:
     assert res[0].name == "S"
     info = c.get_series_info(1, "en")
     assert info.name == "S"
-    assert info.alias_names == ["A"]
+    assert info.alias_names == ("A",)
 
 
 def test_tvdb_episode_list_and_info(mock_http_json) -> None:
@@ -287,3 +297,156 @@ def test_get_artwork_parsing_and_sorting(mock_http_json) -> None:
     cats = [a.category for a in out]
     assert cats[0] == "poster"
     assert cats[1] == "poster,season,500x750"
+
+
+def test_iter_episode_nodes_fetches_remaining_pages_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[int] = []
+
+    def fake_request(self, path: str, params: dict, locale: str) -> dict:  # type: ignore[override]
+        page = params["page"]
+        requested.append(page)
+        return {
+            "links": {"last": 4},
+            "data": [{"id": page * 10}, {"id": page * 10 + 1}],
+        }
+
+    monkeypatch.setattr(TheTVDBClient, "_request_json", fake_request, raising=True)
+    c = TheTVDBClient(apikey="k")
+    ids = [n["id"] for n in c._iter_episode_nodes(5, "en")]
+    assert ids == [10, 11, 20, 21, 30, 31, 40, 41]
+    assert requested[0] == 1
+    assert sorted(requested) == [1, 2, 3, 4]
+
+
+def test_get_token_uses_pooled_urlopen(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[str] = []
+
+    def fake_urlopen(req, timeout=0):
+        seen.append(req.full_url)
+        return io.BytesIO(b'{"token": "abc"}')
+
+    monkeypatch.setattr("filebot.core.providers.tvdb.urlopen", fake_urlopen)
+    client = TheTVDBClient(apikey="k")
+    assert _real_get_token(client) == "abc"
+    assert _real_get_token(client) == "abc"
+    assert len(seen) == 1
+
+
+def test_tvdb_get_episode_lists_batches_in_input_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_list(self, series, order, locale):
+        return [Episode(series_name="S", season=1, episode=series)]
+
+    monkeypatch.setattr(TheTVDBClient, "get_episode_list", fake_list)
+    c = TheTVDBClient(apikey="k")
+    out = c.get_episode_lists([7, 2, 7], "Airdate", "en")
+    assert list(out) == [7, 2]
+    assert [e.episode for e in out[2]] == [2]
+    assert c.get_episode_lists([], "Airdate", "en") == {}
+
+
+def test_request_cache_key_shared_by_default_language(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    keys: list[str] = []
+
+    def fake_http(self, url: str, **kwargs):  # type: ignore[override]
+        keys.append(kwargs["cache_key"])
+        return {}
+
+    monkeypatch.setattr(TheTVDBClient, "_http_get_json", fake_http, raising=True)
+    c = TheTVDBClient(apikey="k")
+    for locale in ("", "en", "de_DE"):
+        c._request_json("series/1", {}, locale)
+    url = "https://api.thetvdb.com/series/1"
+    assert keys == [url, url, f"{url}|de-DE"]
+
+
+def test_get_episode_list_overlaps_series_info_and_first_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+
+    page_requested = threading.Event()
+
+    def fake_request(self, path: str, params: dict, locale: str) -> dict:
+        if path == "series/1":
+            # Only completes if the episode page is requested concurrently
+            assert page_requested.wait(timeout=5)
+            return {"data": {"id": 1, "seriesName": "Show"}}
+        page_requested.set()
+        return {"data": [{"id": 10, "airedSeason": 1, "airedEpisodeNumber": 1}]}
+
+    monkeypatch.setattr(TheTVDBClient, "_request_json", fake_request, raising=True)
+    eps = TheTVDBClient(apikey="k").get_episode_list(1, "Airdate", "en")
+    assert [(e.series_name, e.id) for e in eps] == [("Show", 10)]
+
+
+def test_get_episode_list_remembers_missing_localized_name(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    info_locales: list[str] = []
+
+    def fake_request(self, path: str, params: dict, locale: str) -> dict:
+        if path == "series/1":
+            info_locales.append(locale)
+            name = "Show" if locale == "en" else None
+            return {"data": {"id": 1, "seriesName": name}}
+        return {"data": [{"id": 10, "airedSeason": 1, "airedEpisodeNumber": 1}]}
+
+    monkeypatch.setattr(TheTVDBClient, "_request_json", fake_request, raising=True)
+    c = TheTVDBClient(apikey="k")
+    for _ in range(2):
+        eps = c.get_episode_list(1, "Airdate", "de-DE")
+        assert [e.series_name for e in eps] == ["Show"]
+    # The localized lookup is only paid once; later calls go straight to English
+    assert info_locales == ["de-DE", "en", "en"]
+
+
+@pytest.mark.parametrize(
+    ("airdate", "expected"),
+    [
+        ("2020-01-02", 20200102),
+        ("2020-1-02", None),
+        ("2020/01/02", None),
+        ("2020-01-0x", None),
+        (None, None),
+        ("", None),
+    ],
+)
+def test_airdate_number(airdate: object, expected: int | None) -> None:
+    assert _airdate_number(airdate) == expected
+
+
+def test_tvdb_search_many_in_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_search(self, query, locale):
+        return [SearchResult(id=len(query), name=query)]
+
+    monkeypatch.setattr(TheTVDBClient, "search", fake_search)
+    c = TheTVDBClient(apikey="k")
+    out = c.search_many(["Lost", "Fringe", "Lost"], "en")
+    assert list(out) == ["Lost", "Fringe"]
+    assert out["Fringe"][0].id == 6
+    assert c.search_many([], "en") == {}
+
+
+@pytest.mark.parametrize(
+    ("order", "expected"),
+    [
+        ("Airdate", (1, 2)),
+        ("DVD", (3, 4)),
+        ("Absolute", (None, 7)),
+        ("AbsoluteAirdate", (None, 20200102)),
+    ],
+)
+def test_derive_numbering(order: str, expected: tuple[int | None, int]) -> None:
+    node = {
+        "airedSeason": 1,
+        "airedEpisodeNumber": 2,
+        "dvdSeason": "3",
+        "dvdEpisodeNumber": 4,
+    }
+    assert _derive_numbering(order, node, 7, "2020-01-02") == expected
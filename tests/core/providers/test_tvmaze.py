@@ -57,8 +57,8 @@ def test_request_params_and_allowed_host(
     assert captured.get("require_https") is False
     assert captured.get("long_ttl") is False
     set_hosts = captured.get("allowed_http_hosts")
-    assert isinstance(set_hosts, set)
-    hosts_set = cast("set[str]", set_hosts)
+    assert isinstance(set_hosts, frozenset)
+    hosts_set = cast("frozenset[str]", set_hosts)
     assert "api.tvmaze.com" in hosts_set
 
 
@@ -33,6 +33,7 @@ from filebot.core.providers.utils import (
     lenient_name_equals,
     lenient_names_set,
     normalize_string_for_match,
+    parse_int,
 )
 
 if TYPE_CHECKING:
@@ -76,6 +77,23 @@ def test_rate_limiter_acquire_sleeps_briefly() -> None:
     assert dt >= 0
 
 
+def test_rate_limiter_holds_limit_under_concurrency() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+    from time import monotonic
+
+    window = 0.2
+    limiter = RateLimiter(max_requests=2, window_seconds=window)
+
+    def _acquire(_: int) -> float:
+        limiter.acquire()
+        return monotonic()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        times = sorted(pool.map(_acquire, range(6)))
+    # No window may admit more than two acquisitions
+    assert all(b - a >= window * 0.9 for a, b in zip(times, times[2:], strict=False))
+
+
 def test_compute_opensubtitles_hash_small_and_empty(tmp_path: Path) -> None:
     small = tmp_path / "small.bin"
     small.write_bytes(b"x" * 1024)
@@ -125,3 +143,43 @@ def test_lenient_names_set_deduplicates() -> None:
 )
 def test_lenient_name_equals(a: str | None, b: str | None, eq: bool) -> None:
     assert lenient_name_equals(a, b) is eq
+
+
+def test_is_allowed_http_accepts_frozenset_and_caches() -> None:
+    from filebot.core.providers.utils import _is_allowed_http_cached
+
+    hosts = frozenset({"api.tvmaze.com"})
+    _is_allowed_http_cached.cache_clear()
+    assert is_allowed_http("http://api.tvmaze.com/y", hosts) is True
+    assert is_allowed_http("http://api.tvmaze.com/y", hosts) is True
+    # Mutable sets are normalized to the same cached frozenset key
+    assert is_allowed_http("http://api.tvmaze.com/y", {"api.tvmaze.com"}) is True
+    assert _is_allowed_http_cached.cache_info().hits == 2
+
+
+def test_compute_opensubtitles_hash_matches_reference_loop(tmp_path: Path) -> None:
+    import random
+
+    def _reference(data: bytes) -> str:
+        block = 64 * 1024
+        size = len(data)
+        total = size
+        for chunk in (data[:block], data[max(size - block, 0) :][:block]):
+            for i in range(0, len(chunk), 8):
+                total += int.from_bytes(chunk[i : i + 8], "little")
+        return f"{total & 0xFFFFFFFFFFFFFFFF:016x}"
+
+    rng = random.Random(7)
+    for size in (13, 4096, 200 * 1024 + 5):
+        path = tmp_path / f"{size}.bin"
+        data = rng.randbytes(size)
+        path.write_bytes(data)
+        assert compute_opensubtitles_hash(str(path)) == (_reference(data), size)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(5, 5), ("12", 12), ("1.5", None), ("²", None), (True, None), (None, None)],
+)
+def test_parse_int(value: object, expected: int | None) -> None:
+    assert parse_int(value) == expected
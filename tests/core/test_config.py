@@ -0,0 +1,90 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import pytest
+
+from filebot.core.config import (
+    AppConfig,
+    clear_config_cache,
+    load_config_from_env,
+    reload_config,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config() -> Iterator[None]:
+    load_config_from_env.cache_clear()
+    yield
+    load_config_from_env.cache_clear()
+
+
+def test_load_config_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FILEBOT_API_TMDB", "first")
+    cfg1 = load_config_from_env()
+    monkeypatch.setenv("FILEBOT_API_TMDB", "second")
+    cfg2 = load_config_from_env()
+    assert cfg1 is cfg2
+    assert cfg2.tmdb_api_key == "first"
+
+
+def test_reload_config_rereads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FILEBOT_API_TMDB", "first")
+    cfg1 = load_config_from_env()
+    monkeypatch.setenv("FILEBOT_API_TMDB", "second")
+    monkeypatch.setenv("FILEBOT_ANIDB_CLIENTVER", "3")
+    cfg2 = reload_config()
+    assert cfg2 is not cfg1
+    assert cfg2.tmdb_api_key == "second"
+    assert cfg2.anidb_clientver == 3
+    assert load_config_from_env() is cfg2
+
+
+def test_app_config_is_frozen() -> None:
+    cfg = AppConfig(tmdb_api_key="t")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.tmdb_api_key = "x"  # type: ignore[misc]
+
+
+def test_clear_config_cache_rereads_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("FILEBOT_API_TMDB", "tm")
+    clear_config_cache()
+    assert load_config_from_env().tmdb_api_key == "tm"
+    monkeypatch.setenv("FILEBOT_API_TMDB", "changed")
+    assert load_config_from_env().tmdb_api_key == "tm"
+    clear_config_cache()
+    assert load_config_from_env().tmdb_api_key == "changed"
+
+
+def test_cache_dir_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FILEBOT_CACHE_DIR", "/tmp/filebot-cache")
+    assert reload_config().cache_dir == "/tmp/filebot-cache"
+    monkeypatch.setenv("FILEBOT_CACHE_DIR", "")
+    assert reload_config().cache_dir is None
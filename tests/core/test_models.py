@@ -0,0 +1,122 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import annotations
+
+import sys
+
+from filebot.core.models import Artwork, Episode, Movie, SearchResult, SeriesInfo
+
+
+def test_effective_names_tuple_is_memoized() -> None:
+    r = SearchResult(id=1, name="Naruto", alias_names=("NARUTO", "Naruto TV"))
+    names = r.effective_names()
+    assert names == ("Naruto", "NARUTO", "Naruto TV")
+    assert r.effective_names() is names
+
+
+def test_effective_names_without_name_or_aliases() -> None:
+    assert SearchResult(id=1).effective_names() == ()
+    assert SearchResult(id=1, name="Solo").effective_names() == ("Solo",)
+
+
+def test_iter_effective_names_matches_tuple() -> None:
+    r = SearchResult(id=1, name="A", alias_names=("B",))
+    assert list(r.iter_effective_names()) == ["A", "B"]
+    assert list(SearchResult(id=2, alias_names=("B",)).iter_effective_names()) == []
+
+
+def test_memo_excluded_from_equality_and_repr() -> None:
+    a = SearchResult(id=1, name="A")
+    b = SearchResult(id=1, name="A")
+    a.effective_names()
+    assert a == b
+    assert "_effective_names" not in repr(a)
+
+
+def test_repeated_strings_are_interned() -> None:
+    # Build equal strings at runtime so they start out as distinct objects
+    name_a = b"Some Series".decode()
+    name_b = b"Some Series".decode()
+    assert name_a is not name_b
+    ep1 = Episode(series_name=name_a, season=1, episode=1)
+    ep2 = Episode(series_name=name_b, season=1, episode=2)
+    assert ep1.series_name is ep2.series_name
+
+    lang = b"en".decode()
+    assert Movie(name="M", language=lang).language is sys.intern("en")
+    category = b"poster".decode()
+    assert Artwork(category=category, url="u").category is sys.intern("poster")
+    genre = b"Drama".decode()
+    assert SeriesInfo(id=1, genres=(genre,)).genres[0] is sys.intern("Drama")
+
+
+def test_series_info_does_not_mutate_genres_argument() -> None:
+    genres = [b"Drama".decode()]
+    info = SeriesInfo(id=1, genres=genres)  # type: ignore[arg-type]
+    assert genres == ["Drama"]
+    assert info.genres == ("Drama",)
+
+
+def test_series_info_is_hashable() -> None:
+    info = SeriesInfo(id=1, name="Show", genres=("Drama",))
+    assert hash(info) == hash(SeriesInfo(id=1, name="Show", genres=("Drama",)))
+
+
+def test_intern_leaves_none_untouched() -> None:
+    info = SeriesInfo(id=1)
+    assert info.name is None
+    assert info.order is None
+
+
+def test_alias_names_default_is_shared_empty_tuple() -> None:
+    a = SeriesInfo(id=1)
+    b = SeriesInfo(id=2)
+    assert a.alias_names == ()
+    assert a.alias_names is b.alias_names
+    assert Movie(name="M").alias_names is SearchResult(id=1).alias_names
+
+
+def test_episode_repr_is_compact() -> None:
+    info = SeriesInfo(id=1, name="Show", genres=("Drama",))
+    ep = Episode(series_name="Show", season=1, episode=2, id=7, series_info=info)
+    assert repr(ep) == "Episode('Show', S1E2, id=7)"
+    special = Episode(series_name="Show", season=None, episode=None, special_number=3)
+    assert repr(special) == "Episode('Show', SP3, id=None)"
+
+
+def test_episode_hash_consistent_with_equality() -> None:
+    a = Episode(series_name="Show", season=1, episode=2, id=7)
+    b = Episode(series_name="Show", season=1, episode=2, id=7)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b, Episode(series_name="Show", season=1, episode=3)}) == 2
+
+
+def test_episode_from_values_matches_regular_constructor() -> None:
+    info = SeriesInfo(id=1, name="Show")
+    args = ("Show", 1, 2, "Pilot", 2, None, "2020-01-01", 7, info)
+    fast = Episode.from_values(*args)
+    assert fast == Episode(*args)
+    assert fast.series_info is info
+    name = b"Show".decode()
+    built = Episode.from_values(name, 1, 2, None, None, None, None, None, None)
+    assert built.series_name is sys.intern("Show")
@@ -0,0 +1,55 @@
+# Copyright (c) 2025 knguyen1
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Test MainWindow deferred construction."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from filebot.ui.components.sidebar import Sidebar
+from filebot.ui.main_window import MainWindow
+from filebot.ui.views.episodes_panel import EpisodesPanel
+from filebot.ui.views.rename_panel import RenamePanel
+
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication
+
+
+def test_main_window_defers_views_until_finish_init(qapp: QApplication) -> None:
+    window = MainWindow()
+    assert window.windowTitle() == "FileBot"
+    assert window.findChild(Sidebar) is None
+    assert window.findChild(RenamePanel) is None
+
+    window.finish_init()
+    assert window.findChild(Sidebar) is not None
+    assert window.findChild(RenamePanel) is not None
+    assert window.findChild(EpisodesPanel) is not None
+
+
+def test_finish_init_is_idempotent(qapp: QApplication) -> None:
+    window = MainWindow()
+    window.finish_init()
+    central = window.centralWidget()
+    window.finish_init()
+    assert window.centralWidget() is central
+    assert len(window.findChildren(RenamePanel)) == 1